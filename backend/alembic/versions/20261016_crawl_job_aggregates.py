@@ -0,0 +1,48 @@
+"""Add materialized error/response-time aggregates to crawl_jobs
+
+Revision ID: 006_crawl_job_aggregates
+Revises: 005_page_smallint_counters
+Create Date: 2026-10-16 13:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006_crawl_job_aggregates'
+down_revision: Union[str, None] = '005_page_smallint_counters'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('crawl_jobs', sa.Column('errors_4xx', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('crawl_jobs', sa.Column('errors_5xx', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('crawl_jobs', sa.Column('avg_response_time_ms', sa.Float(), nullable=True))
+    
+    # Backfill existing crawls from their pages
+    op.execute(
+        """
+        UPDATE crawl_jobs AS cj
+        SET errors_4xx = agg.errors_4xx,
+            errors_5xx = agg.errors_5xx,
+            avg_response_time_ms = agg.avg_response_time_ms
+        FROM (
+            SELECT crawl_job_id,
+                   COUNT(*) FILTER (WHERE status_code BETWEEN 400 AND 499) AS errors_4xx,
+                   COUNT(*) FILTER (WHERE status_code >= 500) AS errors_5xx,
+                   AVG(response_time_ms) AS avg_response_time_ms
+            FROM pages
+            GROUP BY crawl_job_id
+        ) AS agg
+        WHERE cj.id = agg.crawl_job_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('crawl_jobs', 'avg_response_time_ms')
+    op.drop_column('crawl_jobs', 'errors_5xx')
+    op.drop_column('crawl_jobs', 'errors_4xx')
@@ -0,0 +1,37 @@
+"""Add generated duration_seconds column to crawl_jobs
+
+Revision ID: 003_crawl_job_duration
+Revises: 002_page_length_columns
+Create Date: 2026-10-16 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003_crawl_job_duration'
+down_revision: Union[str, None] = '002_page_length_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'crawl_jobs',
+        sa.Column(
+            'duration_seconds',
+            sa.Integer(),
+            sa.Computed(
+                'CASE WHEN completed_at IS NOT NULL AND started_at IS NOT NULL '
+                'THEN CAST(EXTRACT(epoch FROM completed_at - started_at) AS INTEGER) END',
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('crawl_jobs', 'duration_seconds')
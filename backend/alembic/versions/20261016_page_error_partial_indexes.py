@@ -0,0 +1,39 @@
+"""Add partial indexes for 4xx/5xx pages
+
+Revision ID: 004_page_error_indexes
+Revises: 003_crawl_job_duration
+Create Date: 2026-10-16 11:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004_page_error_indexes'
+down_revision: Union[str, None] = '003_crawl_job_duration'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_pages_errors_4xx',
+        'pages',
+        ['crawl_job_id'],
+        unique=False,
+        postgresql_where=sa.text('status_code BETWEEN 400 AND 499'),
+    )
+    op.create_index(
+        'ix_pages_errors_5xx',
+        'pages',
+        ['crawl_job_id'],
+        unique=False,
+        postgresql_where=sa.text('status_code >= 500'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pages_errors_5xx', table_name='pages')
+    op.drop_index('ix_pages_errors_4xx', table_name='pages')
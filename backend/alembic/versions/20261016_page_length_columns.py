@@ -0,0 +1,50 @@
+"""Add generated title/meta description length columns to pages
+
+Revision ID: 002_page_length_columns
+Revises: 001_initial
+Create Date: 2026-10-16 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002_page_length_columns'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'pages',
+        sa.Column(
+            'title_length',
+            sa.Integer(),
+            sa.Computed('coalesce(length(title), 0)', persisted=True),
+        ),
+    )
+    op.add_column(
+        'pages',
+        sa.Column(
+            'meta_description_length',
+            sa.Integer(),
+            sa.Computed('coalesce(length(meta_description), 0)', persisted=True),
+        ),
+    )
+    op.create_index('ix_pages_title_length', 'pages', ['crawl_job_id', 'title_length'], unique=False)
+    op.create_index(
+        'ix_pages_meta_description_length',
+        'pages',
+        ['crawl_job_id', 'meta_description_length'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pages_meta_description_length', table_name='pages')
+    op.drop_index('ix_pages_title_length', table_name='pages')
+    op.drop_column('pages', 'meta_description_length')
+    op.drop_column('pages', 'title_length')
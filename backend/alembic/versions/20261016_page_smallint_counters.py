@@ -0,0 +1,51 @@
+"""Narrow page counter columns to SMALLINT
+
+Revision ID: 005_page_smallint_counters
+Revises: 004_page_error_indexes
+Create Date: 2026-10-16 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005_page_smallint_counters'
+down_revision: Union[str, None] = '004_page_error_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTER_COLUMNS = (
+    'images_count',
+    'images_without_alt',
+    'internal_links_count',
+    'external_links_count',
+    'depth',
+)
+
+
+def upgrade() -> None:
+    for column_name in COUNTER_COLUMNS:
+        op.alter_column(
+            'pages',
+            column_name,
+            type_=sa.SmallInteger(),
+            existing_type=sa.Integer(),
+            existing_nullable=False,
+            existing_server_default='0',
+            postgresql_using=f'LEAST({column_name}, 32767)::smallint',
+        )
+
+
+def downgrade() -> None:
+    for column_name in COUNTER_COLUMNS:
+        op.alter_column(
+            'pages',
+            column_name,
+            type_=sa.Integer(),
+            existing_type=sa.SmallInteger(),
+            existing_nullable=False,
+            existing_server_default='0',
+        )
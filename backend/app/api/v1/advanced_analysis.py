@@ -141,12 +141,9 @@ async def analyze_image(
 ):
     """Analyze an image for optimization opportunities."""
     analyzer = ImageAnalyzer()
+    result = await analyzer.analyze_image(request.image_url)
     
-    try:
-        result = await analyzer.analyze_image(request.image_url)
-        return result
-    finally:
-        await analyzer.close()
+    return result
 
 
 @router.post("/analysis/redirect-chains")
@@ -12,8 +12,6 @@ from app.core.dependencies import get_current_user, get_db
 from app.core.config import settings
 from app.models.user import User
 from app.models.page import Page
-from app.services.ai.content_scorer import ContentQualityScorer
-from app.services.ai.alt_text_generator import AltTextGenerator
 
 router = APIRouter()
 
@@ -52,6 +50,8 @@ async def score_content(
     current_user: User = Depends(get_current_user),
 ):
     """Score content quality using AI."""
+    from app.services.ai import ContentQualityScorer
+    
     # Check if OpenAI API key is configured
     openai_key = getattr(settings, 'OPENAI_API_KEY', None)
     if not openai_key or openai_key == 'your-openai-api-key-here':
@@ -78,6 +78,8 @@ async def generate_alt_text(
     current_user: User = Depends(get_current_user),
 ):
     """Generate alt text for an image using AI."""
+    from app.services.ai import AltTextGenerator
+    
     openai_key = getattr(settings, 'OPENAI_API_KEY', None)
     if not openai_key or openai_key == 'your-openai-api-key-here':
         raise HTTPException(
@@ -101,6 +103,8 @@ async def batch_generate_alt_text(
     current_user: User = Depends(get_current_user),
 ):
     """Generate alt text for multiple images."""
+    from app.services.ai import AltTextGenerator
+    
     openai_key = getattr(settings, 'OPENAI_API_KEY', None)
     if not openai_key or openai_key == 'your-openai-api-key-here':
         raise HTTPException(
@@ -126,6 +130,8 @@ async def generate_content_brief(
     current_user: User = Depends(get_current_user),
 ):
     """Generate a content brief using AI."""
+    from app.services.ai import ContentQualityScorer
+    
     openai_key = getattr(settings, 'OPENAI_API_KEY', None)
     if not openai_key or openai_key == 'your-openai-api-key-here':
         raise HTTPException(
@@ -150,6 +156,8 @@ async def compare_content_with_competitors(
     current_user: User = Depends(get_current_user),
 ):
     """Compare your content with competitors using AI."""
+    from app.services.ai import ContentQualityScorer
+    
     openai_key = getattr(settings, 'OPENAI_API_KEY', None)
     if not openai_key or openai_key == 'your-openai-api-key-here':
         raise HTTPException(
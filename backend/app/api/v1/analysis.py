@@ -6,7 +6,7 @@ Handles SEO analysis and reporting.
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,7 +15,13 @@ from app.models.crawl_job import CrawlJob
 from app.models.page import Page
 from app.models.project import Project
 from app.models.user import User
-from app.schemas.page import PageAnalysis, PageSummary, PageWithIssues
+from app.schemas._base import fast_dump
+from app.schemas.page import (
+    PAGE_SUMMARY_LIST_ADAPTER,
+    PageAnalysis,
+    PageSummary,
+    PageWithIssues,
+)
 
 
 router = APIRouter()
@@ -28,7 +34,7 @@ async def get_crawl_pages(
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> List[Page]:
+) -> Response:
     """
     Get all pages from a crawl job.
     
@@ -40,7 +46,7 @@ async def get_crawl_pages(
         current_user: Authenticated user.
     
     Returns:
-        list[Page]: List of crawled pages.
+        Response: JSON list of crawled pages.
     
     Raises:
         HTTPException: If crawl not found or access denied.
@@ -69,9 +75,12 @@ async def get_crawl_pages(
         .offset(skip)
         .limit(limit)
     )
-    pages = result.scalars().all()
     
-    return pages
+    pages = PAGE_SUMMARY_LIST_ADAPTER.validate_python(
+        result.scalars().all(), from_attributes=True
+    )
+    
+    return Response(content=fast_dump(pages), media_type="application/json")
 
 
 @router.get("/crawl/{crawl_id}/issues", response_model=List[PageWithIssues])
@@ -132,6 +141,69 @@ async def get_crawl_issues(
     return pages_with_issues
 
 
+@router.get("/crawl/{crawl_id}/errors", response_model=List[PageSummary])
+async def get_crawl_error_pages(
+    crawl_id: int,
+    error_class: str = Query("4xx", pattern="^[45]xx$", description="4xx or 5xx"),
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> List[PageSummary]:
+    """
+    Get pages from a crawl that returned client (4xx) or server (5xx) errors.
+    
+    The status predicates match the partial indexes on ``pages``, so only
+    error rows are read.
+    
+    Args:
+        crawl_id: Crawl job ID.
+        error_class: Either "4xx" or "5xx".
+        skip: Number of records to skip.
+        limit: Maximum number of records.
+        db: Database session.
+        current_user: Authenticated user.
+    
+    Returns:
+        list[PageSummary]: Pages in the requested error class.
+    
+    Raises:
+        HTTPException: If crawl not found or access denied.
+    """
+    # Verify crawl job access
+    result = await db.execute(
+        select(CrawlJob)
+        .join(Project)
+        .where(
+            CrawlJob.id == crawl_id,
+            Project.user_id == current_user.id,
+        )
+    )
+    crawl_job = result.scalar_one_or_none()
+    
+    if not crawl_job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Crawl job not found",
+        )
+    
+    if error_class == "4xx":
+        status_filter = Page.status_code.between(400, 499)
+    else:
+        status_filter = Page.status_code >= 500
+    
+    result = await db.execute(
+        select(Page)
+        .where(Page.crawl_job_id == crawl_id, status_filter)
+        .offset(skip)
+        .limit(limit)
+    )
+    
+    return PAGE_SUMMARY_LIST_ADAPTER.validate_python(
+        result.scalars().all(), from_attributes=True
+    )
+
+
 @router.get("/page/{page_id}", response_model=PageAnalysis)
 async def get_page_analysis(
     page_id: int,
@@ -214,10 +286,10 @@ def analyze_page_seo(page: Page) -> tuple[list[str], list[str], int]:
     if not page.title:
         issues.append("Missing title tag")
         score -= 15
-    elif len(page.title) < 30:
+    elif page.title_length < 30:
         warnings.append("Title is too short (< 30 chars)")
         score -= 5
-    elif len(page.title) > 60:
+    elif page.title_length > 60:
         warnings.append("Title is too long (> 60 chars)")
         score -= 5
     
@@ -225,10 +297,10 @@ def analyze_page_seo(page: Page) -> tuple[list[str], list[str], int]:
     if not page.meta_description:
         issues.append("Missing meta description")
         score -= 10
-    elif len(page.meta_description) < 120:
+    elif page.meta_description_length < 120:
         warnings.append("Meta description is too short")
         score -= 3
-    elif len(page.meta_description) > 160:
+    elif page.meta_description_length > 160:
         warnings.append("Meta description is too long")
         score -= 3
     
@@ -271,8 +343,8 @@ def analyze_title(page: Page) -> dict:
     """Analyze title tag."""
     return {
         "present": bool(page.title),
-        "length": len(page.title) if page.title else 0,
-        "optimal_length": 50 <= len(page.title or "") <= 60,
+        "length": page.title_length,
+        "optimal_length": 50 <= page.title_length <= 60,
     }
 
 
@@ -280,8 +352,8 @@ def analyze_meta(page: Page) -> dict:
     """Analyze meta tags."""
     return {
         "description_present": bool(page.meta_description),
-        "description_length": len(page.meta_description) if page.meta_description else 0,
-        "description_optimal": 120 <= len(page.meta_description or "") <= 160,
+        "description_length": page.meta_description_length,
+        "description_optimal": 120 <= page.meta_description_length <= 160,
         "canonical_present": bool(page.canonical_url),
     }
 
@@ -34,7 +34,7 @@ router = APIRouter()
 async def register(
     user_in: UserCreate,
     db: AsyncSession = Depends(get_db),
-) -> User:
+) -> UserSchema:
     """
     Register a new user.
     
@@ -43,7 +43,7 @@ async def register(
         db: Database session.
     
     Returns:
-        User: The created user.
+        UserSchema: The created user.
     
     Raises:
         HTTPException: If email already exists.
@@ -71,7 +71,7 @@ async def register(
     await db.commit()
     await db.refresh(user)
     
-    return user
+    return UserSchema.from_orm_trusted(user)
 
 
 @router.post("/login", response_model=Token)
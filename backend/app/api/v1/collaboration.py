@@ -79,7 +79,7 @@ async def invite_team_member(
     await db.commit()
     await db.refresh(team_member)
     
-    return team_member
+    return TeamMemberResponse.from_orm_trusted(team_member)
 
 
 @router.get("/projects/{project_id}/team", response_model=List[TeamMemberResponse])
@@ -107,7 +107,7 @@ async def get_team_members(
         select(TeamMember).where(TeamMember.project_id == project_id)
     )
     
-    return members_result.scalars().all()
+    return [TeamMemberResponse.from_orm_trusted(m) for m in members_result.scalars()]
 
 
 @router.delete("/projects/{project_id}/team/{user_id}")
@@ -185,7 +185,7 @@ async def create_comment(
     await db.commit()
     await db.refresh(new_comment)
     
-    return new_comment
+    return CommentResponse.from_orm_trusted(new_comment)
 
 
 @router.get("/projects/{project_id}/comments", response_model=List[CommentResponse])
@@ -218,7 +218,7 @@ async def get_comments(
     query = query.order_by(Comment.created_at.desc())
     
     comments_result = await db.execute(query)
-    return comments_result.scalars().all()
+    return [CommentResponse.from_orm_trusted(c) for c in comments_result.scalars()]
 
 
 # Task Endpoints
@@ -261,7 +261,7 @@ async def create_task(
     await db.commit()
     await db.refresh(new_task)
     
-    return new_task
+    return TaskResponse.from_orm_trusted(new_task)
 
 
 @router.get("/projects/{project_id}/tasks", response_model=List[TaskResponse])
@@ -298,7 +298,7 @@ async def get_tasks(
     query = query.order_by(Task.created_at.desc())
     
     tasks_result = await db.execute(query)
-    return tasks_result.scalars().all()
+    return [TaskResponse.from_orm_trusted(t) for t in tasks_result.scalars()]
 
 
 @router.put("/tasks/{task_id}", response_model=TaskResponse)
@@ -352,7 +352,7 @@ async def update_task(
     await db.commit()
     await db.refresh(task)
     
-    return task
+    return TaskResponse.from_orm_trusted(task)
 
 
 @router.delete("/tasks/{task_id}")
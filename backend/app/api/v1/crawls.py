@@ -15,6 +15,7 @@ from app.models.crawl_job import CrawlJob, CrawlStatus
 from app.models.project import Project
 from app.models.user import User
 from app.schemas.crawl import (
+    CRAWL_JOB_SUMMARY_LIST_ADAPTER,
     CrawlJob as CrawlJobSchema,
     CrawlJobCreate,
     CrawlJobSummary,
@@ -30,7 +31,7 @@ async def start_crawl(
     crawl_data: CrawlJobCreate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> CrawlJob:
+) -> CrawlJobSchema:
     """
     Start a new crawl job for a project.
     
@@ -40,7 +41,7 @@ async def start_crawl(
         current_user: Authenticated user.
     
     Returns:
-        CrawlJob: The created crawl job.
+        CrawlJobSchema: The created crawl job.
     
     Raises:
         HTTPException: If project not found or access denied.
@@ -91,7 +92,7 @@ async def start_crawl(
     # crawl_job.celery_task_id = task.id
     # await db.commit()
     
-    return crawl_job
+    return CrawlJobSchema.from_orm_trusted(crawl_job)
 
 
 @router.get("/{crawl_id}", response_model=CrawlJobSchema)
@@ -99,7 +100,7 @@ async def get_crawl(
     crawl_id: int,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> CrawlJob:
+) -> CrawlJobSchema:
     """
     Get a specific crawl job by ID.
     
@@ -109,7 +110,7 @@ async def get_crawl(
         current_user: Authenticated user.
     
     Returns:
-        CrawlJob: The requested crawl job.
+        CrawlJobSchema: The requested crawl job.
     
     Raises:
         HTTPException: If crawl not found or access denied.
@@ -130,7 +131,7 @@ async def get_crawl(
             detail="Crawl job not found",
         )
     
-    return crawl_job
+    return CrawlJobSchema.from_orm_trusted(crawl_job)
 
 
 @router.get("/project/{project_id}", response_model=List[CrawlJobSummary])
@@ -140,7 +141,7 @@ async def list_project_crawls(
     limit: int = 50,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> List[CrawlJob]:
+) -> List[CrawlJobSummary]:
     """
     List all crawl jobs for a project.
     
@@ -152,7 +153,7 @@ async def list_project_crawls(
         current_user: Authenticated user.
     
     Returns:
-        list[CrawlJob]: List of crawl jobs.
+        list[CrawlJobSummary]: List of crawl jobs.
     
     Raises:
         HTTPException: If project not found or access denied.
@@ -180,9 +181,9 @@ async def list_project_crawls(
         .offset(skip)
         .limit(limit)
     )
-    crawl_jobs = result.scalars().all()
-    
-    return crawl_jobs
+    return CRAWL_JOB_SUMMARY_LIST_ADAPTER.validate_python(
+        result.scalars().all(), from_attributes=True
+    )
 
 
 @router.get("/{crawl_id}/progress", response_model=CrawlProgress)
@@ -241,7 +242,7 @@ async def cancel_crawl(
     crawl_id: int,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> CrawlJob:
+) -> CrawlJobSchema:
     """
     Cancel a running crawl job.
     
@@ -251,7 +252,7 @@ async def cancel_crawl(
         current_user: Authenticated user.
     
     Returns:
-        CrawlJob: The cancelled crawl job.
+        CrawlJobSchema: The cancelled crawl job.
     
     Raises:
         HTTPException: If crawl not found, access denied, or not running.
@@ -287,4 +288,4 @@ async def cancel_crawl(
     await db.commit()
     await db.refresh(crawl_job)
     
-    return crawl_job
+    return CrawlJobSchema.from_orm_trusted(crawl_job)
@@ -11,6 +11,7 @@ from app.core.dependencies import get_current_user, get_db
 from app.models.user import User
 from app.models.dashboard import Dashboard, DashboardWidget
 from app.schemas.dashboard import (
+    DASHBOARD_LIST_ADAPTER,
     DashboardCreate,
     DashboardUpdate,
     DashboardResponse,
@@ -61,7 +62,7 @@ async def create_dashboard(
     await db.commit()
     await db.refresh(new_dashboard)
     
-    return new_dashboard
+    return DashboardResponse.from_orm_trusted(new_dashboard)
 
 
 @router.get("/dashboards", response_model=DashboardListResponse)
@@ -85,7 +86,7 @@ async def get_dashboards(
     dashboards = result.scalars().all()
     
     return DashboardListResponse(
-        dashboards=dashboards,
+        dashboards=DASHBOARD_LIST_ADAPTER.validate_python(dashboards, from_attributes=True),
         total=len(dashboards)
     )
 
@@ -110,7 +111,7 @@ async def get_dashboard(
     if dashboard.user_id != current_user.id and not dashboard.is_public:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    return dashboard
+    return DashboardResponse.from_orm_trusted(dashboard)
 
 
 @router.put("/dashboards/{dashboard_id}", response_model=DashboardResponse)
@@ -148,7 +149,7 @@ async def update_dashboard(
     await db.commit()
     await db.refresh(dashboard)
     
-    return dashboard
+    return DashboardResponse.from_orm_trusted(dashboard)
 
 
 @router.delete("/dashboards/{dashboard_id}")
@@ -213,7 +214,7 @@ async def add_widget(
     await db.commit()
     await db.refresh(new_widget)
     
-    return new_widget
+    return DashboardWidgetResponse.from_orm_trusted(new_widget)
 
 
 @router.put("/dashboards/{dashboard_id}/widgets/{widget_id}", response_model=DashboardWidgetResponse)
@@ -263,7 +264,7 @@ async def update_widget(
     await db.commit()
     await db.refresh(widget)
     
-    return widget
+    return DashboardWidgetResponse.from_orm_trusted(widget)
 
 
 @router.delete("/dashboards/{dashboard_id}/widgets/{widget_id}")
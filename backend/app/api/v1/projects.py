@@ -6,7 +6,7 @@ Handles project CRUD operations.
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +14,7 @@ from app.core.dependencies import get_current_user, get_db
 from app.models.project import Project
 from app.models.user import User
 from app.models.crawl_job import CrawlJob
+from app.schemas._base import fast_dump
 from app.schemas.project import (
     Project as ProjectSchema,
     ProjectCreate,
@@ -31,7 +32,7 @@ async def list_projects(
     limit: int = 50,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> List[Project]:
+) -> Response:
     """
     List all projects for the current user.
     
@@ -42,7 +43,7 @@ async def list_projects(
         current_user: Authenticated user.
     
     Returns:
-        list[Project]: List of user's projects with statistics.
+        Response: JSON list of the user's projects with statistics.
     """
     # Query projects with crawl statistics
     result = await db.execute(
@@ -72,15 +73,13 @@ async def list_projects(
         )
         last_crawl = last_crawl_result.scalar_one_or_none()
         
-        project_dict = {
-            **project.__dict__,
-            "total_crawls": total_crawls or 0,
-            "last_crawl_date": last_crawl,
-            "total_pages": 0,  # Will be calculated from latest crawl
-        }
-        projects_with_stats.append(project_dict)
+        project_with_stats = ProjectWithStats.from_orm_trusted(project)
+        project_with_stats.total_crawls = total_crawls or 0
+        project_with_stats.last_crawl_date = last_crawl
+        # total_pages stays 0; will be calculated from latest crawl
+        projects_with_stats.append(project_with_stats)
     
-    return projects_with_stats
+    return Response(content=fast_dump(projects_with_stats), media_type="application/json")
 
 
 @router.post("/", response_model=ProjectSchema, status_code=status.HTTP_201_CREATED)
@@ -88,7 +87,7 @@ async def create_project(
     project_in: ProjectCreate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> Project:
+) -> ProjectSchema:
     """
     Create a new project.
     
@@ -98,7 +97,7 @@ async def create_project(
         current_user: Authenticated user.
     
     Returns:
-        Project: The created project.
+        ProjectSchema: The created project.
     """
     project = Project(
         **project_in.model_dump(),
@@ -109,7 +108,7 @@ async def create_project(
     await db.commit()
     await db.refresh(project)
     
-    return project
+    return ProjectSchema.from_orm_trusted(project)
 
 
 @router.get("/{project_id}", response_model=ProjectSchema)
@@ -117,7 +116,7 @@ async def get_project(
     project_id: int,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> Project:
+) -> ProjectSchema:
     """
     Get a specific project by ID.
     
@@ -127,7 +126,7 @@ async def get_project(
         current_user: Authenticated user.
     
     Returns:
-        Project: The requested project.
+        ProjectSchema: The requested project.
     
     Raises:
         HTTPException: If project not found or access denied.
@@ -146,7 +145,7 @@ async def get_project(
             detail="Project not found",
         )
     
-    return project
+    return ProjectSchema.from_orm_trusted(project)
 
 
 @router.patch("/{project_id}", response_model=ProjectSchema)
@@ -155,7 +154,7 @@ async def update_project(
     project_update: ProjectUpdate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> Project:
+) -> ProjectSchema:
     """
     Update a project.
     
@@ -166,7 +165,7 @@ async def update_project(
         current_user: Authenticated user.
     
     Returns:
-        Project: The updated project.
+        ProjectSchema: The updated project.
     
     Raises:
         HTTPException: If project not found or access denied.
@@ -193,7 +192,7 @@ async def update_project(
     await db.commit()
     await db.refresh(project)
     
-    return project
+    return ProjectSchema.from_orm_trusted(project)
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
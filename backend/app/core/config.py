@@ -58,6 +58,8 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "seo_user"
     POSTGRES_PASSWORD: str
     DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
 
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
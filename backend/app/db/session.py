@@ -15,14 +15,24 @@ from sqlalchemy.pool import NullPool
 from app.core.config import settings
 
 
+# Using NullPool for development to avoid connection pool issues; elsewhere
+# keep a sized pool of asyncpg connections so handlers never block the loop
+# waiting on connection setup
+if settings.is_development:
+    _pool_options: dict = {"poolclass": NullPool}
+else:
+    _pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+
 # Create async engine
-# Using NullPool for development to avoid connection pool issues
 engine: AsyncEngine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
     pool_pre_ping=True,
-    poolclass=NullPool if settings.is_development else None,
+    **_pool_options,
 )
 
 # Create async session factory
@@ -5,29 +5,42 @@ This module initializes and configures the FastAPI application,
 including middleware, CORS, and route registration.
 """
 
+import importlib
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from app.core.config import settings
-from app.api.v1 import (
-    auth,
-    projects,
-    crawls,
-    analysis,
-    list_crawl,
-    collaboration,
-    dashboards,
-    monitoring,
-    competitive,
-    serp,
-    ai,
-    advanced_analysis,
-    export,
+
+
+# Hot settings resolved once at import instead of through pydantic
+# attribute access on every use
+_DEBUG = settings.DEBUG
+_IS_PROD = settings.is_production
+_APP_NAME = settings.APP_NAME
+_ENV = settings.ENVIRONMENT
+
+# API v1 routers as (module in app.api.v1, path suffix, OpenAPI tag)
+ROUTER_SPECS: tuple[tuple[str, str, str], ...] = (
+    ("auth", "/auth", "Authentication"),
+    ("projects", "/projects", "Projects"),
+    ("crawls", "/crawls", "Crawls"),
+    ("analysis", "/analysis", "Analysis"),
+    ("list_crawl", "", "List Mode Crawling"),
+    ("collaboration", "", "Team Collaboration"),
+    ("dashboards", "", "Custom Dashboards"),
+    ("monitoring", "", "Monitoring & Alerts"),
+    ("competitive", "", "Competitive Analysis"),
+    ("serp", "", "SERP Tracking"),
+    ("ai", "", "AI-Powered Features"),
+    ("advanced_analysis", "", "Advanced Analysis"),
+    ("export", "", "Export & Reporting"),
 )
 
 
@@ -39,25 +52,35 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     Handles startup and shutdown events.
     """
     # Startup
-    print(f"Starting {settings.APP_NAME}")
-    print(f"Environment: {settings.ENVIRONMENT}")
-    print(f"Debug mode: {settings.DEBUG}")
+    print(f"Starting {_APP_NAME}")
+    print(f"Environment: {_ENV}")
+    print(f"Debug mode: {_DEBUG}")
     
     yield
     
     # Shutdown
-    print(f"Shutting down {settings.APP_NAME}")
+    print(f"Shutting down {_APP_NAME}")
+    
+    from app.services.ai.content_scorer import close_all_clients
+    await close_all_clients()
+    
+    from app.services.analyzer.image_analyzer import close_client as close_image_client
+    await close_image_client()
+    
+    from app.services.analyzer.redirect_chain import close_client as close_redirect_client
+    await close_redirect_client()
 
 
 # Create FastAPI application
 app = FastAPI(
-    title=settings.APP_NAME,
+    title=_APP_NAME,
     description="Enterprise-grade SEO analysis platform with AI-powered insights",
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -71,135 +94,85 @@ app.add_middleware(
 )
 
 
+# Compress JSON reports; level 5 keeps CPU on the event loop low while
+# still shrinking large page listings substantially. Added before
+# TrustedHost so rejected-host responses are never compressed.
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
+
 # Add trusted host middleware for production
-if settings.is_production:
+if _IS_PROD:
     app.add_middleware(
         TrustedHostMiddleware,
         allowed_hosts=["*"],  # Configure properly in production
     )
 
 
-# Root endpoint
-@app.get("/", tags=["Root"])
-async def root() -> dict:
-    """Root endpoint returning API information."""
-    return {
-        "name": settings.APP_NAME,
+# Static payloads are serialized once at import time
+_ROOT_BYTES = orjson.dumps(
+    {
+        "name": _APP_NAME,
         "version": "1.0.0",
         "status": "online",
-        "environment": settings.ENVIRONMENT,
+        "environment": _ENV,
         "docs": "/docs",
     }
-
-
-# Health check endpoint
-@app.get("/health", tags=["Health"])
-async def health_check() -> dict:
-    """Health check endpoint for monitoring."""
-    return {
+)
+_HEALTH_BYTES = orjson.dumps(
+    {
         "status": "healthy",
-        "environment": settings.ENVIRONMENT,
+        "environment": _ENV,
     }
-
-
-# Include API routers
-app.include_router(
-    auth.router,
-    prefix=f"{settings.API_V1_PREFIX}/auth",
-    tags=["Authentication"],
-)
-
-app.include_router(
-    projects.router,
-    prefix=f"{settings.API_V1_PREFIX}/projects",
-    tags=["Projects"],
-)
-
-app.include_router(
-    crawls.router,
-    prefix=f"{settings.API_V1_PREFIX}/crawls",
-    tags=["Crawls"],
-)
-
-app.include_router(
-    analysis.router,
-    prefix=f"{settings.API_V1_PREFIX}/analysis",
-    tags=["Analysis"],
 )
 
-app.include_router(
-    list_crawl.router,
-    prefix=f"{settings.API_V1_PREFIX}",
-    tags=["List Mode Crawling"],
-)
 
-app.include_router(
-    collaboration.router,
-    prefix=f"{settings.API_V1_PREFIX}",
-    tags=["Team Collaboration"],
-)
+# Root endpoint
+@app.get("/", tags=["Root"])
+async def root() -> Response:
+    """Root endpoint returning API information."""
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
-app.include_router(
-    dashboards.router,
-    prefix=f"{settings.API_V1_PREFIX}",
-    tags=["Custom Dashboards"],
-)
 
-app.include_router(
-    monitoring.router,
-    prefix=f"{settings.API_V1_PREFIX}",
-    tags=["Monitoring & Alerts"],
-)
+# Health check endpoint
+@app.get("/health", tags=["Health"])
+async def health_check() -> Response:
+    """Health check endpoint for monitoring."""
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
-app.include_router(
-    competitive.router,
-    prefix=f"{settings.API_V1_PREFIX}",
-    tags=["Competitive Analysis"],
-)
 
-app.include_router(
-    serp.router,
-    prefix=f"{settings.API_V1_PREFIX}",
-    tags=["SERP Tracking"],
-)
-
-app.include_router(
-    ai.router,
-    prefix=f"{settings.API_V1_PREFIX}",
-    tags=["AI-Powered Features"],
-)
+# Include API routers
+api_prefix = settings.API_V1_PREFIX
+for module_name, suffix, tag in ROUTER_SPECS:
+    app.include_router(
+        importlib.import_module(f"app.api.v1.{module_name}").router,
+        prefix=api_prefix + suffix,
+        tags=[tag],
+    )
 
-app.include_router(
-    advanced_analysis.router,
-    prefix=f"{settings.API_V1_PREFIX}",
-    tags=["Advanced Analysis"],
-)
 
-app.include_router(
-    export.router,
-    prefix=f"{settings.API_V1_PREFIX}",
-    tags=["Export & Reporting"],
+# Global exception handler
+# Starlette routes an ``Exception`` handler to its outermost
+# ServerErrorMiddleware, so no extra try/except wraps each request. In
+# DEBUG mode no handler is installed and errors propagate to the server.
+_500_BYTES = orjson.dumps(
+    {
+        "detail": "Internal server error",
+        "type": "internal_error",
+    }
 )
 
 
-# Global exception handler
-@app.exception_handler(Exception)
-async def global_exception_handler(request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Global exception handler for unhandled exceptions.
     
     In production, this would log to a monitoring service.
     """
-    if settings.DEBUG:
-        raise exc
-    
-    return JSONResponse(
-        status_code=500,
-        content={
-            "detail": "Internal server error",
-            "type": "internal_error",
-        },
-    )
+    return Response(content=_500_BYTES, status_code=500, media_type="application/json")
+
+
+if not _DEBUG:
+    app.add_exception_handler(Exception, global_exception_handler)
 
 
 if __name__ == "__main__":
@@ -209,6 +182,6 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG,
+        reload=_DEBUG,
         log_level=settings.LOG_LEVEL.lower(),
     )
@@ -6,7 +6,21 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Computed,
+    DateTime,
+    Enum as SQLEnum,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    and_,
+    case,
+    cast,
+    column,
+    extract,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -27,6 +41,24 @@ class CrawlStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Terminal statuses; a crawl in one of these will not change again
+FINISHED_STATUSES = frozenset(
+    {CrawlStatus.COMPLETED, CrawlStatus.FAILED, CrawlStatus.CANCELLED}
+)
+
+
+# Duration expression for the generated ``duration_seconds`` column. Built
+# from Core constructs rather than raw SQL so it renders for any dialect.
+_started_at = column("started_at", DateTime(timezone=True))
+_completed_at = column("completed_at", DateTime(timezone=True))
+_DURATION_SECONDS_SQL = case(
+    (
+        and_(_completed_at.isnot(None), _started_at.isnot(None)),
+        cast(extract("epoch", _completed_at - _started_at), Integer),
+    ),
+)
+
+
 class CrawlJob(Base):
     """
     Crawl Job model representing a single crawl execution.
@@ -40,8 +72,12 @@ class CrawlJob(Base):
         celery_task_id: Celery task ID for tracking background job.
         started_at: Timestamp when crawl started.
         completed_at: Timestamp when crawl completed.
+        duration_seconds: Crawl duration in seconds (generated column).
         pages_crawled: Number of pages successfully crawled.
         pages_total: Total number of pages discovered.
+        errors_4xx: Number of crawled pages that returned a 4xx status.
+        errors_5xx: Number of crawled pages that returned a 5xx status.
+        avg_response_time_ms: Mean response time across crawled pages.
         error_message: Error message if crawl failed.
         created_at: Timestamp of job creation.
         updated_at: Timestamp of last update.
@@ -73,11 +109,21 @@ class CrawlJob(Base):
     # Timing
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    duration_seconds: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed(_DURATION_SECONDS_SQL, persisted=True),
+        nullable=True,
+    )
     
     # Statistics
     pages_crawled: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     pages_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     
+    # Aggregates materialized at ingest so dashboards don't scan pages
+    errors_4xx: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    errors_5xx: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    avg_response_time_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
+    
     # Error handling
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     
@@ -105,14 +151,6 @@ class CrawlJob(Base):
         """String representation of CrawlJob."""
         return f"<CrawlJob(id={self.id}, project_id={self.project_id}, status={self.status})>"
     
-    @property
-    def duration_seconds(self) -> int | None:
-        """Calculate crawl duration in seconds."""
-        if self.started_at and self.completed_at:
-            delta = self.completed_at - self.started_at
-            return int(delta.total_seconds())
-        return None
-    
     @property
     def is_running(self) -> bool:
         """Check if crawl is currently running."""
@@ -121,4 +159,4 @@ class CrawlJob(Base):
     @property
     def is_finished(self) -> bool:
         """Check if crawl has finished (completed, failed, or cancelled)."""
-        return self.status in (CrawlStatus.COMPLETED, CrawlStatus.FAILED, CrawlStatus.CANCELLED)
+        return self.status in FINISHED_STATUSES
@@ -5,7 +5,20 @@ Page model representing crawled web pages.
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, JSON
+from sqlalchemy import (
+    JSON,
+    Computed,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    inspect,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -29,7 +42,9 @@ class Page(Base):
         status_code: HTTP status code.
         response_time_ms: Response time in milliseconds.
         title: Page title tag content.
+        title_length: Title length in characters (generated column).
         meta_description: Meta description content.
+        meta_description_length: Meta description length (generated column).
         meta_keywords: Meta keywords content.
         canonical_url: Canonical URL if specified.
         h1_tags: List of H1 tag contents (JSON).
@@ -53,6 +68,31 @@ class Page(Base):
     
     __tablename__ = "pages"
     
+    # Pages are bulk-inserted once per crawl and never updated afterwards, so
+    # skip the RETURNING of server defaults and the deleted-row count check.
+    __mapper_args__ = {
+        "eager_defaults": False,
+        "confirm_deleted_rows": False,
+    }
+    
+    __table_args__ = (
+        # Serves the "title too short / too long" report as an index-only scan
+        Index("ix_pages_title_length", "crawl_job_id", "title_length"),
+        Index("ix_pages_meta_description_length", "crawl_job_id", "meta_description_length"),
+        # Partial indexes covering only error pages, so 4xx/5xx reports
+        # read O(#errors) rows instead of the whole crawl
+        Index(
+            "ix_pages_errors_4xx",
+            "crawl_job_id",
+            postgresql_where=text("status_code BETWEEN 400 AND 499"),
+        ),
+        Index(
+            "ix_pages_errors_5xx",
+            "crawl_job_id",
+            postgresql_where=text("status_code >= 500"),
+        ),
+    )
+    
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     
     # Foreign keys
@@ -77,18 +117,29 @@ class Page(Base):
     meta_keywords: Mapped[str | None] = mapped_column(Text, nullable=True)
     canonical_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     
+    # Lengths are generated by the database so reports can filter on them
+    # without loading the underlying text columns
+    title_length: Mapped[int] = mapped_column(
+        Integer,
+        Computed("coalesce(length(title), 0)", persisted=True),
+    )
+    meta_description_length: Mapped[int] = mapped_column(
+        Integer,
+        Computed("coalesce(length(meta_description), 0)", persisted=True),
+    )
+    
     # Headings (stored as JSON arrays)
     h1_tags: Mapped[list | None] = mapped_column(JSON, nullable=True)
     h2_tags: Mapped[list | None] = mapped_column(JSON, nullable=True)
     h3_tags: Mapped[list | None] = mapped_column(JSON, nullable=True)
     
-    # Images
-    images_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    images_without_alt: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Images (small per-page counters are stored as SMALLINT to narrow rows)
+    images_count: Mapped[int] = mapped_column(SmallInteger, default=0, nullable=False)
+    images_without_alt: Mapped[int] = mapped_column(SmallInteger, default=0, nullable=False)
     
     # Links
-    internal_links_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    external_links_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    internal_links_count: Mapped[int] = mapped_column(SmallInteger, default=0, nullable=False)
+    external_links_count: Mapped[int] = mapped_column(SmallInteger, default=0, nullable=False)
     
     # Content analysis
     word_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -104,7 +155,7 @@ class Page(Base):
     has_robots_nofollow: Mapped[bool] = mapped_column(default=False, nullable=False)
     
     # Crawl metadata
-    depth: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    depth: Mapped[int] = mapped_column(SmallInteger, default=0, nullable=False)
     
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -116,7 +167,18 @@ class Page(Base):
     crawl_job: Mapped["CrawlJob"] = relationship("CrawlJob", back_populates="pages")
     
     def __repr__(self) -> str:
-        """String representation of Page."""
+        """
+        String representation of Page.
+        
+        Reads the instance state directly so logging a page never triggers
+        attribute loading or slices the URL.
+        """
+        state = inspect(self, raiseerr=False)
+        values = state.dict if state is not None else {}
+        return f"<Page(id={values.get('id')}, status={values.get('status_code')})>"
+    
+    def describe(self) -> str:
+        """Human-readable description including a truncated URL."""
         return f"<Page(id={self.id}, url={self.url[:50]}, status={self.status_code})>"
     
     @property
@@ -138,13 +200,4 @@ class Page(Base):
     def is_server_error(self) -> bool:
         """Check if page returned server error (5xx status)."""
         return self.status_code >= 500
-    
-    @property
-    def title_length(self) -> int:
-        """Get title length."""
-        return len(self.title) if self.title else 0
-    
-    @property
-    def meta_description_length(self) -> int:
-        """Get meta description length."""
-        return len(self.meta_description) if self.meta_description else 0
+
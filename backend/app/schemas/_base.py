@@ -0,0 +1,107 @@
+"""
+Shared helpers for Pydantic response schemas.
+"""
+
+from functools import lru_cache
+from typing import Annotated, Any, ClassVar, Self
+
+import orjson
+from email_validator import EmailNotValidError, validate_email
+from pydantic import AfterValidator, BaseModel, WithJsonSchema
+
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=8192)
+def _validate_email_fast(value: str) -> str:
+    """
+    Validate an email address's syntax and return its normalized form.
+    
+    Deliverability (DNS) checks are skipped, and results are cached, since
+    the same addresses are validated repeatedly on the auth endpoints.
+    
+    Args:
+        value: Email address to validate.
+    
+    Returns:
+        str: Normalized email address.
+    
+    Raises:
+        ValueError: If the address is not syntactically valid.
+    """
+    try:
+        return validate_email(
+            value,
+            check_deliverability=False,
+            allow_smtputf8=False,
+            allow_quoted_local=False,
+        ).normalized
+    except EmailNotValidError as e:
+        raise ValueError(f"value is not a valid email address: {e}") from e
+
+
+FastEmailStr = Annotated[
+    str,
+    AfterValidator(_validate_email_fast),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+
+class TrustedConstructMixin:
+    """
+    Mixin for response schemas built from trusted ORM rows.
+
+    Rows loaded from the database have already been validated on the way
+    in, so ``from_orm_trusted`` copies their attributes with
+    ``model_construct`` instead of running the full validator chain.
+    Fields the ORM object does not provide fall back to their defaults.
+    """
+
+    __trusted_fields__: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Cache the field names once the model fields are complete."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__trusted_fields__ = tuple(cls.model_fields)
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> Self:
+        """
+        Build an instance from a trusted ORM object without validation.
+
+        Args:
+            obj: SQLAlchemy model instance.
+
+        Returns:
+            The schema instance populated from ``obj``.
+        """
+        values = {}
+        for name in cls.__trusted_fields__:
+            value = getattr(obj, name, _MISSING)
+            if value is not _MISSING:
+                values[name] = value
+        return cls.model_construct(**values)
+
+
+def fast_dump(models: list[BaseModel]) -> bytes:
+    """
+    Serialize a list of flat, trusted response models straight to JSON.
+    
+    Reads each model's field values directly and encodes them with orjson,
+    bypassing response_model serialization. Only use this for models
+    without nested models or custom serializers.
+    
+    Args:
+        models: Schema instances to serialize.
+    
+    Returns:
+        bytes: JSON array of the models' fields.
+    """
+    # Datetimes are written as pydantic writes them: naive values without an
+    # offset, UTC values with a trailing 'Z'
+    return orjson.dumps(
+        [model.__dict__ for model in models],
+        option=orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY,
+    )
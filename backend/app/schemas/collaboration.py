@@ -4,7 +4,9 @@ Schemas for team collaboration features.
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas._base import TrustedConstructMixin
 
 
 class TeamMemberBase(BaseModel):
@@ -17,7 +19,7 @@ class TeamMemberCreate(TeamMemberBase):
     user_email: str = Field(..., description="Email of user to invite")
 
 
-class TeamMemberResponse(TeamMemberBase):
+class TeamMemberResponse(TrustedConstructMixin, TeamMemberBase):
     """Schema for team member response."""
     id: int
     project_id: int
@@ -25,8 +27,9 @@ class TeamMemberResponse(TeamMemberBase):
     invited_at: datetime
     joined_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(
+        from_attributes=True, validate_assignment=False, extra="ignore"
+    )
 
 
 class CommentBase(BaseModel):
@@ -39,7 +42,7 @@ class CommentCreate(CommentBase):
     page_id: Optional[int] = None
 
 
-class CommentResponse(CommentBase):
+class CommentResponse(TrustedConstructMixin, CommentBase):
     """Schema for comment response."""
     id: int
     project_id: int
@@ -48,8 +51,9 @@ class CommentResponse(CommentBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(
+        from_attributes=True, validate_assignment=False, extra="ignore"
+    )
 
 
 class TaskBase(BaseModel):
@@ -77,7 +81,7 @@ class TaskUpdate(BaseModel):
     due_date: Optional[datetime] = None
 
 
-class TaskResponse(TaskBase):
+class TaskResponse(TrustedConstructMixin, TaskBase):
     """Schema for task response."""
     id: int
     project_id: int
@@ -89,5 +93,6 @@ class TaskResponse(TaskBase):
     due_date: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(
+        from_attributes=True, validate_assignment=False, extra="ignore"
+    )
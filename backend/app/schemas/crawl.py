@@ -5,9 +5,10 @@ Pydantic schemas for Crawl Job model.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
-from app.models.crawl_job import CrawlStatus
+from app.models.crawl_job import FINISHED_STATUSES, CrawlStatus
+from app.schemas._base import TrustedConstructMixin
 
 
 class CrawlJobBase(BaseModel):
@@ -34,7 +35,7 @@ class CrawlJobUpdate(BaseModel):
 class CrawlJobSummary(BaseModel):
     """Minimal crawl job schema for listings."""
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     id: int
     status: CrawlStatus
@@ -43,7 +44,11 @@ class CrawlJobSummary(BaseModel):
     created_at: datetime
 
 
-class CrawlJobInDB(BaseModel):
+# Built once at import so list endpoints validate all rows in a single pass
+CRAWL_JOB_SUMMARY_LIST_ADAPTER = TypeAdapter(list[CrawlJobSummary])
+
+
+class CrawlJobInDB(TrustedConstructMixin, BaseModel):
     """Schema for crawl job as stored in database."""
     
     model_config = ConfigDict(from_attributes=True)
@@ -56,6 +61,9 @@ class CrawlJobInDB(BaseModel):
     completed_at: Optional[datetime]
     pages_crawled: int
     pages_total: int
+    errors_4xx: int
+    errors_5xx: int
+    avg_response_time_ms: Optional[float]
     error_message: Optional[str]
     created_at: datetime
     updated_at: datetime
@@ -74,23 +82,30 @@ class CrawlJob(CrawlJobInDB):
     @property
     def is_finished(self) -> bool:
         """Check if crawl is finished."""
-        return self.status in (CrawlStatus.COMPLETED, CrawlStatus.FAILED, CrawlStatus.CANCELLED)
+        return self.status in FINISHED_STATUSES
 
 
 class CrawlJobWithPages(CrawlJob):
     """Schema for crawl job with associated pages."""
     
-    from app.schemas.page import PageSummary
-    
-    pages: list[PageSummary] = Field(default_factory=list)
+    pages: list["PageSummary"] = Field(default_factory=list)
 
 
 class CrawlProgress(BaseModel):
     """Schema for realtime crawl progress."""
     
+    model_config = ConfigDict(frozen=True)
+    
     crawl_job_id: int
     status: CrawlStatus
     pages_crawled: int
     pages_total: int
     progress_percentage: float = Field(..., ge=0, le=100)
     current_url: Optional[str] = None
+
+
+# Imported last to avoid a circular import; rebuild resolves the forward
+# reference now instead of on first validation.
+from app.schemas.page import PageSummary  # noqa: E402
+
+CrawlJobWithPages.model_rebuild()
@@ -3,8 +3,10 @@ Dashboard schemas.
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from typing import Any
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.schemas._base import TrustedConstructMixin
 
 
 class DashboardWidgetBase(BaseModel):
@@ -15,7 +17,7 @@ class DashboardWidgetBase(BaseModel):
     position_y: int = Field(default=0, ge=0)
     width: int = Field(default=4, ge=1, le=12)
     height: int = Field(default=4, ge=1, le=12)
-    config: Dict = Field(default_factory=dict)
+    config: dict = Field(default_factory=dict)
 
 
 class DashboardWidgetCreate(DashboardWidgetBase):
@@ -23,56 +25,71 @@ class DashboardWidgetCreate(DashboardWidgetBase):
     pass
 
 
-class DashboardWidgetResponse(DashboardWidgetBase):
+class DashboardWidgetResponse(TrustedConstructMixin, DashboardWidgetBase):
     """Schema for widget response."""
     id: int
     dashboard_id: int
     created_at: datetime
-    updated_at: Optional[datetime] = None
+    updated_at: datetime | None = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(
+        from_attributes=True, validate_assignment=False, extra="ignore"
+    )
 
 
 class DashboardBase(BaseModel):
     """Base dashboard schema."""
     name: str = Field(..., min_length=1, max_length=255)
-    description: Optional[str] = None
+    description: str | None = None
     is_public: bool = False
     is_default: bool = False
 
 
 class DashboardCreate(DashboardBase):
     """Schema for creating dashboard."""
-    project_id: Optional[int] = None
-    layout: Dict = Field(default_factory=dict)
-    widgets: List[DashboardWidgetCreate] = Field(default_factory=list)
+    project_id: int | None = None
+    layout: dict = Field(default_factory=dict)
+    widgets: list[DashboardWidgetCreate] = Field(default_factory=list)
 
 
 class DashboardUpdate(BaseModel):
     """Schema for updating dashboard."""
-    name: Optional[str] = None
-    description: Optional[str] = None
-    layout: Optional[Dict] = None
-    is_public: Optional[bool] = None
-    is_default: Optional[bool] = None
+    name: str | None = None
+    description: str | None = None
+    layout: dict | None = None
+    is_public: bool | None = None
+    is_default: bool | None = None
 
 
-class DashboardResponse(DashboardBase):
+class DashboardResponse(TrustedConstructMixin, DashboardBase):
     """Schema for dashboard response."""
     id: int
     user_id: int
-    project_id: Optional[int] = None
-    layout: Dict
+    project_id: int | None = None
+    layout: dict
     created_at: datetime
-    updated_at: Optional[datetime] = None
-    widgets: List[DashboardWidgetResponse] = []
+    updated_at: datetime | None = None
+    widgets: list[DashboardWidgetResponse] = []
+    
+    model_config = ConfigDict(
+        from_attributes=True, validate_assignment=False, extra="ignore"
+    )
     
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> "DashboardResponse":
+        """Build from a trusted ORM dashboard, converting its widgets too."""
+        dashboard = super().from_orm_trusted(obj)
+        dashboard.widgets = [
+            DashboardWidgetResponse.from_orm_trusted(widget) for widget in dashboard.widgets
+        ]
+        return dashboard
+
+
+# Built once at import so list endpoints validate all rows in a single pass
+DASHBOARD_LIST_ADAPTER = TypeAdapter(list[DashboardResponse])
 
 
 class DashboardListResponse(BaseModel):
     """Schema for dashboard list."""
-    dashboards: List[DashboardResponse]
+    dashboards: list[DashboardResponse]
     total: int
@@ -3,9 +3,10 @@ Pydantic schemas for Page model.
 """
 
 from datetime import datetime
-from typing import Optional
 
-from pydantic import BaseModel, Field, HttpUrl, ConfigDict
+from pydantic import BaseModel, Field, HttpUrl, ConfigDict, TypeAdapter, field_serializer
+
+from app.schemas._base import TrustedConstructMixin
 
 
 class PageBase(BaseModel):
@@ -20,23 +21,23 @@ class PageCreate(PageBase):
     
     crawl_job_id: int
     url_hash: str
-    response_time_ms: Optional[int] = None
-    title: Optional[str] = None
-    meta_description: Optional[str] = None
-    meta_keywords: Optional[str] = None
-    canonical_url: Optional[str] = None
-    h1_tags: Optional[list[str]] = None
-    h2_tags: Optional[list[str]] = None
-    h3_tags: Optional[list[str]] = None
+    response_time_ms: int | None = None
+    title: str | None = None
+    meta_description: str | None = None
+    meta_keywords: str | None = None
+    canonical_url: str | None = None
+    h1_tags: list[str] | None = None
+    h2_tags: list[str] | None = None
+    h3_tags: list[str] | None = None
     images_count: int = 0
     images_without_alt: int = 0
     internal_links_count: int = 0
     external_links_count: int = 0
     word_count: int = 0
-    text_to_html_ratio: Optional[float] = None
-    page_size_bytes: Optional[int] = None
-    schema_org_types: Optional[list[str]] = None
-    og_tags: Optional[dict] = None
+    text_to_html_ratio: float | None = None
+    page_size_bytes: int | None = None
+    schema_org_types: list[str] | None = None
+    og_tags: dict | None = None
     has_robots_noindex: bool = False
     has_robots_nofollow: bool = False
     depth: int = 0
@@ -45,16 +46,20 @@ class PageCreate(PageBase):
 class PageSummary(BaseModel):
     """Minimal page schema for listings."""
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     id: int
     url: str
     status_code: int
-    title: Optional[str]
+    title: str | None
     depth: int
 
 
-class PageInDB(PageBase):
+# Built once at import so list endpoints validate all rows in a single pass
+PAGE_SUMMARY_LIST_ADAPTER = TypeAdapter(list[PageSummary])
+
+
+class PageInDB(TrustedConstructMixin, PageBase):
     """Schema for page as stored in database."""
     
     model_config = ConfigDict(from_attributes=True)
@@ -62,23 +67,23 @@ class PageInDB(PageBase):
     id: int
     crawl_job_id: int
     url_hash: str
-    response_time_ms: Optional[int]
-    title: Optional[str]
-    meta_description: Optional[str]
-    meta_keywords: Optional[str]
-    canonical_url: Optional[str]
-    h1_tags: Optional[list]
-    h2_tags: Optional[list]
-    h3_tags: Optional[list]
+    response_time_ms: int | None
+    title: str | None
+    meta_description: str | None
+    meta_keywords: str | None
+    canonical_url: str | None
+    h1_tags: list | None
+    h2_tags: list | None
+    h3_tags: list | None
     images_count: int
     images_without_alt: int
     internal_links_count: int
     external_links_count: int
     word_count: int
-    text_to_html_ratio: Optional[float]
-    page_size_bytes: Optional[int]
-    schema_org_types: Optional[list]
-    og_tags: Optional[dict]
+    text_to_html_ratio: float | None
+    page_size_bytes: int | None
+    schema_org_types: list | None
+    og_tags: dict | None
     has_robots_noindex: bool
     has_robots_nofollow: bool
     depth: int
@@ -108,10 +113,22 @@ class PageAnalysis(BaseModel):
     warnings: list[dict] = Field(default_factory=list)
     suggestions: list[str] = Field(default_factory=list)
     
-    # Detailed metrics
-    title_analysis: dict = Field(default_factory=dict)
-    meta_analysis: dict = Field(default_factory=dict)
-    headings_analysis: dict = Field(default_factory=dict)
-    images_analysis: dict = Field(default_factory=dict)
-    links_analysis: dict = Field(default_factory=dict)
-    content_analysis: dict = Field(default_factory=dict)
+    # Detailed metrics (left unset rather than allocated when not computed)
+    title_analysis: dict | None = Field(None, repr=False)
+    meta_analysis: dict | None = Field(None, repr=False)
+    headings_analysis: dict | None = Field(None, repr=False)
+    images_analysis: dict | None = Field(None, repr=False)
+    links_analysis: dict | None = Field(None, repr=False)
+    content_analysis: dict | None = Field(None, repr=False)
+    
+    @field_serializer(
+        "title_analysis",
+        "meta_analysis",
+        "headings_analysis",
+        "images_analysis",
+        "links_analysis",
+        "content_analysis",
+    )
+    def _serialize_analysis(self, value: dict | None) -> dict:
+        """Emit unset detail sections as empty objects."""
+        return {} if value is None else value
@@ -2,11 +2,18 @@
 Pydantic schemas for Project model.
 """
 
+import re
 from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field, HttpUrl, ConfigDict, field_validator
 
+from app.schemas._base import TrustedConstructMixin
+
+
+# Leading protocol and "www." stripped from submitted domains
+_DOMAIN_PREFIX_RE = re.compile(r"^(?:https?://)?(?:www\.)?", re.IGNORECASE)
+
 
 class ProjectBase(BaseModel):
     """Base project schema with common attributes."""
@@ -19,16 +26,8 @@ class ProjectBase(BaseModel):
     @classmethod
     def validate_domain(cls, v: str) -> str:
         """Validate and normalize domain."""
-        # Remove protocol if present
-        domain = v.lower()
-        for prefix in ["https://", "http://", "www."]:
-            if domain.startswith(prefix):
-                domain = domain[len(prefix):]
-        
-        # Remove trailing slash
-        domain = domain.rstrip("/")
-        
-        return domain
+        # Remove protocol and "www." if present, then trailing slash
+        return _DOMAIN_PREFIX_RE.sub("", v, count=1).rstrip("/").lower()
 
 
 class ProjectCreate(ProjectBase):
@@ -63,7 +62,7 @@ class ProjectUpdate(BaseModel):
 class ProjectSummary(BaseModel):
     """Minimal project schema for listings."""
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     id: int
     name: str
@@ -71,7 +70,7 @@ class ProjectSummary(BaseModel):
     created_at: datetime
 
 
-class ProjectInDB(ProjectBase):
+class ProjectInDB(TrustedConstructMixin, ProjectBase):
     """Schema for project as stored in database."""
     
     model_config = ConfigDict(from_attributes=True)
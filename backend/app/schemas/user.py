@@ -7,13 +7,15 @@ These schemas are used for request/response validation and serialization.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict
+
+from app.schemas._base import FastEmailStr, TrustedConstructMixin
 
 
 class UserBase(BaseModel):
     """Base user schema with common attributes."""
     
-    email: EmailStr = Field(..., description="User email address")
+    email: FastEmailStr = Field(..., description="User email address")
     full_name: Optional[str] = Field(None, description="User full name", max_length=255)
     is_active: bool = Field(True, description="Whether user is active")
 
@@ -21,7 +23,7 @@ class UserBase(BaseModel):
 class UserCreate(BaseModel):
     """Schema for creating a new user."""
     
-    email: EmailStr = Field(..., description="User email address")
+    email: FastEmailStr = Field(..., description="User email address")
     password: str = Field(..., min_length=8, max_length=100, description="User password")
     full_name: Optional[str] = Field(None, description="User full name", max_length=255)
 
@@ -29,13 +31,13 @@ class UserCreate(BaseModel):
 class UserUpdate(BaseModel):
     """Schema for updating user information."""
     
-    email: Optional[EmailStr] = Field(None, description="User email address")
+    email: Optional[FastEmailStr] = Field(None, description="User email address")
     password: Optional[str] = Field(None, min_length=8, max_length=100, description="New password")
     full_name: Optional[str] = Field(None, description="User full name", max_length=255)
     is_active: Optional[bool] = Field(None, description="Whether user is active")
 
 
-class UserInDB(UserBase):
+class UserInDB(TrustedConstructMixin, UserBase):
     """Schema for user as stored in database."""
     
     model_config = ConfigDict(from_attributes=True)
@@ -55,9 +57,7 @@ class User(UserInDB):
 class UserWithProjects(User):
     """Schema for user with associated projects."""
     
-    from app.schemas.project import ProjectSummary
-    
-    projects: list[ProjectSummary] = Field(default_factory=list)
+    projects: list["ProjectSummary"] = Field(default_factory=list)
 
 
 # Authentication schemas
@@ -73,6 +73,8 @@ class Token(BaseModel):
 class TokenPayload(BaseModel):
     """Schema for decoded JWT token payload."""
     
+    model_config = ConfigDict(frozen=True)
+    
     sub: int = Field(..., description="Subject (user ID)")
     exp: int = Field(..., description="Expiration timestamp")
     type: str = Field(..., description="Token type (access or refresh)")
@@ -81,7 +83,7 @@ class TokenPayload(BaseModel):
 class LoginRequest(BaseModel):
     """Schema for login request."""
     
-    email: EmailStr = Field(..., description="User email")
+    email: FastEmailStr = Field(..., description="User email")
     password: str = Field(..., description="User password")
 
 
@@ -89,3 +91,10 @@ class RefreshTokenRequest(BaseModel):
     """Schema for refresh token request."""
     
     refresh_token: str = Field(..., description="JWT refresh token")
+
+
+# Imported last to avoid a circular import; rebuild resolves the forward
+# reference now instead of on first validation.
+from app.schemas.project import ProjectSummary  # noqa: E402
+
+UserWithProjects.model_rebuild()
@@ -1,8 +1,31 @@
 """
 AI-powered SEO analysis services.
+
+Services are imported on first access so that importing this package does
+not pull in the OpenAI client until a service is actually used.
 """
 
-from app.services.ai.content_scorer import ContentQualityScorer
-from app.services.ai.alt_text_generator import AltTextGenerator
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.services.ai.alt_text_generator import AltTextGenerator
+    from app.services.ai.content_scorer import ContentQualityScorer
+
+_LAZY_IMPORTS = {
+    'ContentQualityScorer': 'app.services.ai.content_scorer',
+    'AltTextGenerator': 'app.services.ai.alt_text_generator',
+}
 
 __all__ = ['ContentQualityScorer', 'AltTextGenerator']
+
+
+def __getattr__(name: str) -> Any:
+    """Import services lazily on first attribute access (PEP 562)."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
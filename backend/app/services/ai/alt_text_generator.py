@@ -6,10 +6,68 @@ Generates descriptive alt text for images using:
 - Google Cloud Vision API
 """
 
+from functools import lru_cache
 from typing import Dict, List, Optional
-import base64
-import httpx
-from openai import AsyncOpenAI
+import asyncio
+import json
+import math
+import re
+
+from app.services.crawler.url_parser import get_url_hash
+
+
+# Alt text validation rules
+_REDUNDANT_PREFIXES = (
+    'image of', 'picture of', 'photo of', 'graphic of',
+    'screenshot of', 'illustration of'
+)
+_GENERIC_TERMS = frozenset({'image', 'photo', 'picture', 'graphic'})
+# An underscore or hyphen together with a dot, in either order
+_FILENAME_RE = re.compile(r'[_-].*\.|\..*[_-]', re.DOTALL)
+
+# Completion budget for the alt text analysis JSON; the improved alt text
+# alone may take ~40 tokens, plus the score and a list of issues
+_ANALYSIS_MAX_TOKENS = 500
+
+
+@lru_cache(maxsize=1024)
+def _build_prompt_cached(
+    page_topic: Optional[str],
+    surrounding_text: Optional[str],
+    max_length: int
+) -> str:
+    """
+    Build the alt text prompt for one set of page context values.
+    
+    Images on the same page share their context, so the prompt is built
+    once per page rather than once per image.
+    
+    Args:
+        page_topic: Page topic, if known.
+        surrounding_text: Text around the image, already truncated.
+        max_length: Maximum length.
+    
+    Returns:
+        str: Prompt text.
+    """
+    base_prompt = (
+        f"Generate a concise, descriptive alt text for this image. "
+        f"Maximum {max_length} characters. "
+        f"Focus on what's visible and relevant for accessibility and SEO. "
+    )
+    
+    if page_topic:
+        base_prompt += f"Page topic: {page_topic}. "
+    
+    if surrounding_text:
+        base_prompt += f"Context: {surrounding_text}. "
+    
+    base_prompt += (
+        "Provide ONLY the alt text, no additional explanation. "
+        "Make it descriptive but concise."
+    )
+    
+    return base_prompt
 
 
 class AltTextGenerator:
@@ -23,16 +81,28 @@ class AltTextGenerator:
     - Accessibility compliance
     """
     
-    def __init__(self, api_key: str, model: str = "gpt-4-vision-preview"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o",
+        max_concurrency: int = 8
+    ):
         """
         Initialize alt text generator.
         
         Args:
             api_key: OpenAI API key.
-            model: Vision model to use.
+            model: Vision model to use; it must support JSON mode for
+                ``analyze_and_improve_alt_text``.
+            max_concurrency: Maximum number of Vision requests in flight
+                during batch generation.
         """
+        # Imported here so loading this module does not import the client
+        from openai import AsyncOpenAI
+        
         self.client = AsyncOpenAI(api_key=api_key)
         self.model = model
+        self.max_concurrency = max_concurrency
     
     async def generate_alt_text(
         self,
@@ -52,38 +122,29 @@ class AltTextGenerator:
             dict: Generated alt text with metadata.
         """
         try:
-            # Build prompt
-            prompt = self._build_prompt(context, max_length)
-            
-            # Call GPT-4 Vision
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": prompt
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": image_url
-                                }
-                            }
-                        ]
-                    }
-                ],
-                max_tokens=150,
-                temperature=0.3,
+            # Call GPT-4 Vision, streaming so generation can be cut off
+            # as soon as the text exceeds the length limit
+            stream = await self.client.chat.completions.create(
+                **self._build_request_body(image_url, context, max_length),
+                stream=True,
             )
             
-            alt_text = response.choices[0].message.content.strip()
+            parts = []
+            received = 0
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        received += len(delta)
+                        if received > max_length:
+                            break
+            finally:
+                await stream.close()
             
-            # Ensure it's within length limit
-            if len(alt_text) > max_length:
-                alt_text = alt_text[:max_length - 3] + "..."
+            alt_text = self._clip_alt_text("".join(parts), max_length)
             
             return {
                 'success': True,
@@ -100,6 +161,69 @@ class AltTextGenerator:
                 'error': str(e),
             }
     
+    def _build_request_body(
+        self,
+        image_url: str,
+        context: Optional[Dict],
+        max_length: int
+    ) -> Dict:
+        """
+        Build the chat completions request body for one image.
+        
+        Shared by the interactive path and the Batch API job so both send
+        the same prompt.
+        
+        Args:
+            image_url: URL of the image.
+            context: Context information.
+            max_length: Maximum length.
+        
+        Returns:
+            dict: Keyword arguments for ``chat.completions.create``.
+        """
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": self._build_prompt(context, max_length)
+                        },
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": image_url
+                            }
+                        }
+                    ]
+                }
+            ],
+            # Roughly 3.5 characters per token for English text
+            "max_tokens": math.ceil(max_length / 3.5),
+            "temperature": 0.3,
+        }
+    
+    @staticmethod
+    def _clip_alt_text(alt_text: str, max_length: int) -> str:
+        """
+        Strip generated alt text and truncate it to the length limit.
+        
+        Args:
+            alt_text: Raw model output.
+            max_length: Maximum length.
+        
+        Returns:
+            str: Alt text within ``max_length`` characters.
+        """
+        alt_text = alt_text.strip()
+        
+        if len(alt_text) > max_length:
+            alt_text = alt_text[:max_length - 3] + "..."
+        
+        return alt_text
+    
     def _build_prompt(self, context: Optional[Dict], max_length: int) -> str:
         """
         Build prompt for alt text generation.
@@ -111,28 +235,17 @@ class AltTextGenerator:
         Returns:
             str: Prompt text.
         """
-        base_prompt = (
-            f"Generate a concise, descriptive alt text for this image. "
-            f"Maximum {max_length} characters. "
-            f"Focus on what's visible and relevant for accessibility and SEO. "
-        )
+        page_topic = None
+        surrounding_text = None
         
         if context:
-            page_topic = context.get('page_topic')
-            surrounding_text = context.get('surrounding_text')
+            if context.get('page_topic'):
+                page_topic = str(context['page_topic'])
             
-            if page_topic:
-                base_prompt += f"Page topic: {page_topic}. "
-            
-            if surrounding_text:
-                base_prompt += f"Context: {surrounding_text[:200]}. "
+            if context.get('surrounding_text'):
+                surrounding_text = context['surrounding_text'][:200]
         
-        base_prompt += (
-            "Provide ONLY the alt text, no additional explanation. "
-            "Make it descriptive but concise."
-        )
-        
-        return base_prompt
+        return _build_prompt_cached(page_topic, surrounding_text, max_length)
     
     async def batch_generate(
         self,
@@ -142,6 +255,9 @@ class AltTextGenerator:
         """
         Generate alt text for multiple images.
         
+        Requests run concurrently, with at most ``max_concurrency`` in
+        flight at once. Results keep the order of ``image_urls``.
+        
         Args:
             image_urls: List of image URLs.
             context: Optional context.
@@ -149,13 +265,139 @@ class AltTextGenerator:
         Returns:
             list: Alt text results for each image.
         """
-        results = []
+        sem = asyncio.Semaphore(self.max_concurrency)
         
-        for url in image_urls:
-            result = await self.generate_alt_text(url, context)
-            results.append(result)
+        results = await asyncio.gather(
+            *(self._sem_generate(sem, url, context) for url in image_urls),
+            return_exceptions=True,
+        )
         
-        return results
+        return [
+            result if not isinstance(result, BaseException) else {
+                'success': False,
+                'image_url': url,
+                'error': str(result),
+            }
+            for url, result in zip(image_urls, results)
+        ]
+    
+    async def _sem_generate(
+        self,
+        sem: asyncio.Semaphore,
+        image_url: str,
+        context: Optional[Dict]
+    ) -> Dict:
+        """
+        Generate alt text for one image once a semaphore slot is free.
+        
+        Args:
+            sem: Semaphore bounding concurrent requests.
+            image_url: URL of the image.
+            context: Optional context.
+        
+        Returns:
+            dict: Alt text generation result.
+        """
+        async with sem:
+            return await self.generate_alt_text(image_url, context)
+    
+    async def batch_generate_async_job(
+        self,
+        image_urls: List[str],
+        context: Optional[Dict] = None,
+        max_length: int = 125
+    ) -> str:
+        """
+        Submit alt text generation for many images as an OpenAI Batch job.
+        
+        Intended for scheduled audits rather than interactive requests:
+        the Batch API completes within 24 hours at reduced cost. Each
+        request is tagged with the image URL hash as its ``custom_id``.
+        
+        Args:
+            image_urls: List of image URLs.
+            context: Optional context.
+            max_length: Maximum length of alt text.
+        
+        Returns:
+            str: ID of the created batch, to be passed to ``poll_batch``.
+        """
+        lines = [
+            json.dumps({
+                "custom_id": get_url_hash(url),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_request_body(url, context, max_length),
+            })
+            for url in dict.fromkeys(image_urls)
+        ]
+        
+        input_file = await self.client.files.create(
+            file=("alt_text_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        
+        return batch.id
+    
+    async def poll_batch(self, batch_id: str, max_length: int = 125) -> Dict:
+        """
+        Fetch the state of a Batch job and its results once completed.
+        
+        Args:
+            batch_id: ID returned by ``batch_generate_async_job``.
+            max_length: Maximum length of alt text.
+        
+        Returns:
+            dict: Batch status and, when completed, alt text results keyed
+                by image URL hash.
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            return {
+                'batch_id': batch_id,
+                'status': batch.status,
+                'results': {},
+            }
+        
+        output = await self.client.files.content(batch.output_file_id)
+        
+        results = {}
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            
+            item = json.loads(line)
+            response = item.get("response") or {}
+            
+            if item.get("error") or response.get("status_code") != 200:
+                results[item["custom_id"]] = {
+                    'success': False,
+                    'error': str(item.get("error") or response.get("body")),
+                }
+                continue
+            
+            alt_text = self._clip_alt_text(
+                response["body"]["choices"][0]["message"]["content"], max_length
+            )
+            results[item["custom_id"]] = {
+                'success': True,
+                'alt_text': alt_text,
+                'length': len(alt_text),
+                'model': self.model,
+            }
+        
+        return {
+            'batch_id': batch_id,
+            'status': batch.status,
+            'results': results,
+        }
     
     async def analyze_and_improve_alt_text(
         self,
@@ -190,10 +432,7 @@ Provide:
 - Issues found
 - Improved version (max 125 characters)
 
-Format your response as:
-Score: [number]
-Issues: [list]
-Improved: [alt text]"""
+Respond with JSON: {{"score": int, "issues": [str], "improved": str}}"""
             
             response = await self.client.chat.completions.create(
                 model=self.model,
@@ -206,24 +445,26 @@ Improved: [alt text]"""
                         ]
                     }
                 ],
-                max_tokens=200,
+                max_tokens=_ANALYSIS_MAX_TOKENS,
+                response_format={"type": "json_object"},
             )
             
-            analysis_text = response.choices[0].message.content
+            choice = response.choices[0]
+            if choice.finish_reason == 'length':
+                return {
+                    'success': False,
+                    'error': 'Analysis was cut off before the JSON object was complete',
+                }
             
-            # Parse response
-            import re
-            score_match = re.search(r'Score:\s*(\d+)', analysis_text)
-            improved_match = re.search(r'Improved:\s*(.+?)(?:\n|$)', analysis_text)
-            
-            score = int(score_match.group(1)) if score_match else 70
-            improved_alt = improved_match.group(1).strip() if improved_match else current_alt
+            analysis_text = choice.message.content
+            data = json.loads(analysis_text)
             
             return {
                 'success': True,
                 'current_alt': current_alt,
-                'score': score,
-                'improved_alt': improved_alt,
+                'score': int(data['score']),
+                'issues': data.get('issues', []),
+                'improved_alt': data['improved'].strip(),
                 'analysis': analysis_text,
             }
         
@@ -286,25 +527,18 @@ def validate_alt_text(alt_text: str) -> Dict:
         alt_lower = alt_text.lower()
         
         # Check for redundant phrases
-        redundant_phrases = [
-            'image of', 'picture of', 'photo of', 'graphic of',
-            'screenshot of', 'illustration of'
-        ]
-        
-        for phrase in redundant_phrases:
-            if alt_lower.startswith(phrase):
-                warnings.append(f"Starts with redundant phrase: '{phrase}'")
-                score -= 5
-                break
+        if alt_lower.startswith(_REDUNDANT_PREFIXES):
+            phrase = next(p for p in _REDUNDANT_PREFIXES if alt_lower.startswith(p))
+            warnings.append(f"Starts with redundant phrase: '{phrase}'")
+            score -= 5
         
         # Check for filename patterns
-        if any(char in alt_text for char in ['_', '-']) and '.' in alt_text:
+        if _FILENAME_RE.search(alt_text):
             warnings.append("Looks like a filename - should be descriptive text")
             score -= 15
         
         # Check for generic text
-        generic_terms = ['image', 'photo', 'picture', 'graphic']
-        if alt_text.lower() in generic_terms:
+        if alt_lower in _GENERIC_TERMS:
             issues.append("Alt text is too generic")
             score -= 30
     
@@ -9,9 +9,422 @@ Evaluates content for:
 - Content completeness
 """
 
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import json
+import random
+import re
+import time
+import weakref
+import httpx
+import numpy as np
 import openai
+import tiktoken
 from openai import AsyncOpenAI
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+
+# Errors worth retrying: rate limits, timeouts, dropped connections and 5xx
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_CAP_SECONDS = 60.0
+
+# Prompt budget for page content, in tokens of the scoring model
+_MAX_CONTENT_TOKENS = 750
+# Upper bound on characters per token when pre-slicing long content
+_MAX_CHARS_PER_TOKEN = 16
+_SCORING_SYSTEM_PROMPT = (
+    "You are an expert SEO content analyst with deep knowledge of "
+    "content quality, readability, E-A-T principles, and search engine "
+    "optimization. Provide detailed, actionable analysis."
+)
+
+# Response cache settings
+_CACHE_KEY_PREFIX = "content_score:"
+_RESULT_CACHE_SIZE = 4096
+_EMBEDDING_MODEL = "text-embedding-3-small"
+_SEMANTIC_SIMILARITY_THRESHOLD = 0.97
+_SEMANTIC_CACHE_SIZE = 4096
+# Initial rows allocated for a semantic index; doubled as it fills
+_SEMANTIC_INITIAL_ROWS = 64
+
+# Response parsing patterns
+_SCORE_RE = re.compile(r'(\d+)\s*(?:/100|out of 100)?')
+# Bullet item; matched against single lines and searched across blocks
+_BULLET_RE = re.compile(r'[-•*]\s*(.+)')
+# Matched against single stripped lines by _extract_recommendations
+_IMPROV_HEADER_RE = re.compile(r'(?:IMPROVEMENTS|RECOMMENDATIONS):$', re.IGNORECASE)
+_NUMBERED_LINE_RE = re.compile(r'\d+\.\s+(.+)')
+_STRENGTHS_RE = re.compile(
+    r'(?:TOP \d+ STRENGTHS|STRENGTHS):\s*\n((?:[-•*]\s*.+\n?)+)',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """
+    Get the tokenizer for a model, falling back to ``cl100k_base``.
+    
+    Args:
+        model: OpenAI model name.
+    
+    Returns:
+        tiktoken.Encoding: Tokenizer for the model.
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _truncate_tokens(content: str, model: str, max_tokens: int) -> str:
+    """
+    Truncate content to a token budget for the given model.
+    
+    Args:
+        content: Content to truncate.
+        model: OpenAI model name.
+        max_tokens: Maximum number of content tokens.
+    
+    Returns:
+        str: Content, cut at the token budget and marked if truncated.
+    """
+    # Every token covers at least one character, so short content fits
+    if len(content) <= max_tokens:
+        return content
+    
+    encoding = _get_encoding(model)
+    
+    # Only tokenize a prefix that is certain to hold the budget
+    tokens = encoding.encode(content[:max_tokens * _MAX_CHARS_PER_TOKEN])
+    if len(tokens) <= max_tokens and len(content) <= max_tokens * _MAX_CHARS_PER_TOKEN:
+        return content
+    
+    return encoding.decode(tokens[:max_tokens]) + "... [truncated]"
+
+
+def _match_score(text: str, complete: bool = True) -> Optional[int]:
+    """
+    Extract the overall score from the start of an AI response.
+    
+    Args:
+        text: Response text, or the prefix streamed so far.
+        complete: Whether ``text`` is the whole response.
+    
+    Returns:
+        int: Score clamped to 0-100 (70 if none is found), or None if
+            ``text`` is an incomplete prefix that cannot decide it yet.
+    """
+    match = _SCORE_RE.search(text, 0, 500)
+    if not complete and len(text) < 500 and (match is None or match.end(1) == len(text)):
+        return None
+    
+    overall_score = int(match.group(1)) if match else 70
+    return min(100, max(0, overall_score))
+
+
+_SCORING_PROMPT_TEMPLATE = """Analyze the following web page content for SEO and quality:
+
+URL: {url}
+{keyword_line}
+{industry_line}
+
+CONTENT:
+{content}
+
+Please provide a comprehensive analysis in the following structured format:
+
+1. OVERALL SCORE (0-100):
+   - Provide a numerical score
+
+2. READABILITY ANALYSIS:
+   - Grade level and clarity
+   - Sentence structure
+   - Use of jargon
+
+3. SEO OPTIMIZATION:
+   - Keyword usage and density
+   - Content structure (headings, paragraphs)
+   - Internal linking opportunities
+   - Meta information assessment
+
+4. E-A-T ASSESSMENT (Expertise, Authoritativeness, Trustworthiness):
+   - Evidence of expertise
+   - Credibility signals
+   - Trust factors
+
+5. ENGAGEMENT POTENTIAL:
+   - Hook and introduction quality
+   - Content depth and value
+   - Call-to-action effectiveness
+
+6. CONTENT COMPLETENESS:
+   - Topic coverage
+   - Missing elements
+   - Information gaps
+
+7. TOP 3 STRENGTHS:
+   - List specific strengths
+
+8. TOP 5 IMPROVEMENTS:
+   - Prioritized, actionable recommendations
+
+9. CONTENT TYPE CLASSIFICATION:
+   - Identify content type (informational, commercial, transactional, etc.)
+
+Provide the analysis in a clear, structured format."""
+
+
+@lru_cache(maxsize=256)
+def _build_scoring_prompt_cached(
+    content: str,
+    url: str,
+    target_keyword: Optional[str],
+    industry: Optional[str]
+) -> str:
+    """
+    Build the scoring prompt for already-truncated content.
+    
+    Args:
+        content: Content to analyze, truncated to the prompt limit.
+        url: Page URL.
+        target_keyword: Target keyword.
+        industry: Industry from the caller's context.
+    
+    Returns:
+        str: Formatted prompt.
+    """
+    return _SCORING_PROMPT_TEMPLATE.format_map({
+        'url': url,
+        'keyword_line': f"Target Keyword: {target_keyword}" if target_keyword else "",
+        'industry_line': f"Industry: {industry}" if industry else "",
+        'content': content,
+    })
+
+
+# One client (and connection pool) per API key and event loop, shared by
+# every scorer. Pooled connections are bound to the loop that opened them,
+# and Celery tasks run each job in a fresh loop via asyncio.run().
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _new_client(api_key: str) -> AsyncOpenAI:
+    """
+    Create an OpenAI client with its own connection pool.
+    
+    Args:
+        api_key: OpenAI API key.
+    
+    Returns:
+        AsyncOpenAI: Client backed by a pooled HTTP connection.
+    """
+    return AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        ),
+    )
+
+
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """
+    Get the shared OpenAI client for an API key, creating it on first use.
+    
+    Clients are shared within the running event loop only. Outside of an
+    event loop a new, unshared client is returned.
+    
+    Args:
+        api_key: OpenAI API key.
+    
+    Returns:
+        AsyncOpenAI: Client backed by a pooled HTTP connection.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _new_client(api_key)
+    
+    clients = _CLIENTS.setdefault(loop, {})
+    client = clients.get(api_key)
+    if client is None:
+        client = clients[api_key] = _new_client(api_key)
+    return client
+
+
+async def close_all_clients() -> None:
+    """Close the running event loop's shared OpenAI clients and their pools."""
+    clients = _CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+# In-memory result cache shared by all scorers, keyed by request digest
+_RESULTS: "OrderedDict[str, Dict]" = OrderedDict()
+
+
+def _remember(key: str, result: Dict) -> None:
+    """
+    Add a result to the in-memory cache, evicting the oldest.
+    
+    Args:
+        key: Exact-match cache key.
+        result: Parsed scoring result.
+    """
+    _RESULTS[key] = result
+    _RESULTS.move_to_end(key)
+    if len(_RESULTS) > _RESULT_CACHE_SIZE:
+        _RESULTS.popitem(last=False)
+
+
+class _EmbeddingIndex:
+    """
+    Bounded store of normalized prompt embeddings for the semantic tier.
+    
+    Rows are preallocated and doubled as the index fills; once full, the
+    oldest row is overwritten, so adding an embedding never copies more
+    than the rows already stored.
+    """
+    
+    def __init__(self, capacity: int = _SEMANTIC_CACHE_SIZE) -> None:
+        """
+        Initialize an empty index.
+        
+        Args:
+            capacity: Maximum number of embeddings kept.
+        """
+        self.capacity = capacity
+        self._keys: List[str] = []
+        self._vectors: Optional[np.ndarray] = None
+        self._size = 0
+        self._next = 0
+    
+    def add(self, key: str, embedding: np.ndarray) -> None:
+        """
+        Add an embedding, replacing the oldest one when full.
+        
+        Args:
+            key: Exact-match cache key of the scored prompt.
+            embedding: Normalized prompt embedding.
+        """
+        if self._vectors is None:
+            rows = min(_SEMANTIC_INITIAL_ROWS, self.capacity)
+            self._vectors = np.empty((rows, embedding.shape[0]), dtype=np.float32)
+        elif self._size == len(self._vectors) < self.capacity:
+            grown = np.empty(
+                (min(2 * len(self._vectors), self.capacity), self._vectors.shape[1]),
+                dtype=np.float32,
+            )
+            grown[:self._size] = self._vectors
+            self._vectors = grown
+        
+        self._vectors[self._next] = embedding
+        if self._size < self.capacity:
+            self._keys.append(key)
+            self._size += 1
+        else:
+            self._keys[self._next] = key
+        self._next = (self._next + 1) % self.capacity
+    
+    def nearest(self, embedding: np.ndarray) -> Tuple[Optional[str], float]:
+        """
+        Find the stored embedding most similar to ``embedding``.
+        
+        Args:
+            embedding: Normalized prompt embedding.
+        
+        Returns:
+            tuple: Key of the closest embedding (None if the index is
+                empty) and its cosine similarity.
+        """
+        if not self._size:
+            return None, 0.0
+        
+        similarities = self._vectors[:self._size] @ embedding
+        best = int(np.argmax(similarities))
+        return self._keys[best], float(similarities[best])
+
+
+# Semantic indexes shared by all scorers, one per scoring model
+_EMBEDDINGS: Dict[str, _EmbeddingIndex] = {}
+
+
+class _RateLimiter:
+    """
+    Token-bucket limiter for OpenAI request and token budgets per minute.
+    
+    Both buckets refill continuously; callers wait until enough capacity
+    is available before submitting a request.
+    """
+    
+    def __init__(
+        self,
+        max_requests_per_minute: Optional[int] = None,
+        max_tokens_per_minute: Optional[int] = None
+    ):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            max_requests_per_minute: Request budget (None for unlimited).
+            max_tokens_per_minute: Token budget (None for unlimited).
+        """
+        self.limits = (max_requests_per_minute, max_tokens_per_minute)
+        self.available = [float(limit or 0) for limit in self.limits]
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        """Add the capacity accrued since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self.updated_at
+        self.updated_at = now
+        
+        for i, limit in enumerate(self.limits):
+            if limit:
+                self.available[i] = min(limit, self.available[i] + elapsed * limit / 60)
+    
+    async def acquire(self, tokens: int) -> None:
+        """
+        Wait until one request and ``tokens`` tokens can be spent.
+        
+        Args:
+            tokens: Estimated tokens the request will consume.
+        """
+        async with self.lock:
+            while True:
+                self._refill()
+                
+                needed = [
+                    min(amount, limit or 0)
+                    for amount, limit in zip((1, tokens), self.limits)
+                ]
+                wait = max(
+                    (
+                        (need - available) * 60 / limit
+                        for need, available, limit in zip(needed, self.available, self.limits)
+                        if limit and available < need
+                    ),
+                    default=0.0,
+                )
+                
+                if wait <= 0:
+                    for i, need in enumerate(needed):
+                        self.available[i] -= need
+                    return
+                
+                await asyncio.sleep(wait)
 
 
 class ContentQualityScorer:
@@ -25,16 +438,164 @@ class ContentQualityScorer:
     - Competitor comparison
     """
     
-    def __init__(self, api_key: str, model: str = "gpt-4"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4",
+        max_requests_per_minute: Optional[int] = None,
+        max_tokens_per_minute: Optional[int] = None,
+        max_attempts: int = 6,
+        timeout: float = 30.0,
+        cache: Optional[Redis] = None,
+        cache_ttl: int = 7 * 24 * 3600,
+        semantic_cache: bool = False
+    ):
         """
         Initialize content quality scorer.
         
         Args:
             api_key: OpenAI API key.
             model: Model to use (gpt-4, gpt-4-turbo, gpt-3.5-turbo).
+            max_requests_per_minute: Optional request budget shared by all
+                calls made through this scorer.
+            max_tokens_per_minute: Optional token budget shared by all
+                calls made through this scorer.
+            max_attempts: Attempts per request before giving up on
+                rate-limit, timeout, connection and server errors.
+            timeout: Per-request timeout in seconds.
+            cache: Optional Redis client used to share scoring results
+                across processes; results are always cached in memory,
+                shared by all scorers in the process.
+            cache_ttl: Lifetime of Redis cache entries in seconds.
+            semantic_cache: Also reuse results for prompts whose
+                embeddings are near-identical to a cached prompt.
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        # Retries are handled here so they can honour Retry-After and the
+        # rate limiter; the client's own retries are disabled.
+        self.client = _get_client(api_key).with_options(
+            timeout=timeout,
+            max_retries=0,
+        )
         self.model = model
+        self.max_attempts = max_attempts
+        
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.semantic_cache = semantic_cache
+        self.rate_limiter = None
+        
+        if max_requests_per_minute or max_tokens_per_minute:
+            self.rate_limiter = _RateLimiter(max_requests_per_minute, max_tokens_per_minute)
+    
+    async def _create_completion(self, messages: List[Dict], **kwargs):
+        """
+        Create a chat completion with rate limiting and retries.
+        
+        Waits on the rate limiter if configured, and retries transient
+        failures with exponential backoff and jitter, preferring the
+        server's ``Retry-After`` delay when one is given.
+        
+        Args:
+            messages: Chat messages.
+            **kwargs: Extra arguments for ``chat.completions.create``.
+        
+        Returns:
+            ChatCompletion: OpenAI response.
+        
+        Raises:
+            openai.APIError: If the request fails permanently or runs out
+                of attempts.
+        """
+        # Roughly 4 characters per token for English prompts
+        estimated_tokens = sum(len(m["content"]) for m in messages) // 4
+        
+        return await self._request(
+            lambda: self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                **kwargs
+            ),
+            estimated_tokens,
+        )
+    
+    async def _create_embedding(self, text: str) -> np.ndarray:
+        """
+        Embed text for the semantic cache, with rate limiting and retries.
+        
+        Args:
+            text: Text to embed.
+        
+        Returns:
+            np.ndarray: Normalized float32 embedding.
+        
+        Raises:
+            openai.APIError: If the request fails permanently or runs out
+                of attempts.
+        """
+        response = await self._request(
+            lambda: self.client.embeddings.create(
+                model=_EMBEDDING_MODEL,
+                input=text,
+            ),
+            len(text) // 4,
+        )
+        embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+        embedding /= np.linalg.norm(embedding)
+        return embedding
+    
+    async def _request(
+        self,
+        send: Callable[[], Awaitable[Any]],
+        estimated_tokens: int
+    ) -> Any:
+        """
+        Send an API request through the rate limiter, retrying transient errors.
+        
+        Args:
+            send: Starts one attempt of the request.
+            estimated_tokens: Tokens charged to the rate limiter per attempt.
+        
+        Returns:
+            The API response.
+        
+        Raises:
+            openai.APIError: If the request fails permanently or runs out
+                of attempts.
+        """
+        for attempt in range(self.max_attempts):
+            if self.rate_limiter:
+                await self.rate_limiter.acquire(estimated_tokens)
+            
+            try:
+                return await send()
+            except _RETRYABLE_ERRORS as e:
+                if attempt == self.max_attempts - 1:
+                    raise
+                
+                await asyncio.sleep(self._retry_delay(e, attempt))
+    
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """
+        Compute how long to wait before retrying a failed request.
+        
+        Args:
+            error: Error raised by the failed attempt.
+            attempt: Zero-based attempt number.
+        
+        Returns:
+            float: Delay in seconds.
+        """
+        response = getattr(error, "response", None)
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            try:
+                return min(_BACKOFF_CAP_SECONDS, float(retry_after))
+            except (TypeError, ValueError):
+                pass
+        
+        backoff = min(_BACKOFF_CAP_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** attempt)
+        return backoff + random.random() * _BACKOFF_BASE_SECONDS
     
     async def score_content(
         self,
@@ -57,16 +618,18 @@ class ContentQualityScorer:
         """
         # Build prompt
         prompt = self._build_scoring_prompt(content, url, target_keyword, context)
+        cache_key = self._cache_key(_SCORING_SYSTEM_PROMPT, prompt)
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
+            cached, embedding = await self._cache_lookup(cache_key, prompt)
+            if cached is not None:
+                return cached
+            
+            response = await self._create_completion(
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are an expert SEO content analyst with deep knowledge of "
-                                   "content quality, readability, E-A-T principles, and search engine "
-                                   "optimization. Provide detailed, actionable analysis."
+                        "content": _SCORING_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -79,7 +642,10 @@ class ContentQualityScorer:
             analysis_text = response.choices[0].message.content
             
             # Parse AI response (structured format)
-            return self._parse_ai_response(analysis_text)
+            result = self._parse_ai_response(analysis_text)
+            await self._cache_store(cache_key, result, embedding)
+            
+            return result
         
         except Exception as e:
             return {
@@ -87,6 +653,234 @@ class ContentQualityScorer:
                 'error': str(e),
             }
     
+    async def score_content_streaming(
+        self,
+        content: str,
+        url: str,
+        target_keyword: Optional[str] = None,
+        context: Optional[Dict] = None
+    ) -> Tuple[Optional[int], Awaitable[Dict]]:
+        """
+        Score content quality, returning the overall score early.
+        
+        The analysis is streamed, and the overall score is returned as soon
+        as it appears near the start of the response. The rest of the
+        stream is consumed in the background.
+        
+        Args:
+            content: Page content to analyze.
+            url: Page URL for context.
+            target_keyword: Optional target keyword.
+            context: Additional context (industry, audience, etc.).
+        
+        Returns:
+            tuple: Overall score (None if the request failed), and an
+                awaitable resolving to the same analysis ``score_content``
+                returns.
+        """
+        loop = asyncio.get_running_loop()
+        prompt = self._build_scoring_prompt(content, url, target_keyword, context)
+        cache_key = self._cache_key(_SCORING_SYSTEM_PROMPT, prompt)
+        
+        try:
+            cached, embedding = await self._cache_lookup(cache_key, prompt)
+            if cached is not None:
+                done = loop.create_future()
+                done.set_result(cached)
+                return cached['overall_score'], done
+            
+            stream = await self._create_completion(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": _SCORING_SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                temperature=0.3,
+                stream=True,
+            )
+        except Exception as e:
+            done = loop.create_future()
+            done.set_result({
+                'success': False,
+                'error': str(e),
+            })
+            return None, done
+        
+        score_ready = loop.create_future()
+        
+        async def consume() -> Dict:
+            parts = []
+            head = ""
+            try:
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    
+                    if not score_ready.done():
+                        head += delta
+                        score = _match_score(head, complete=False)
+                        if score is not None:
+                            score_ready.set_result(score)
+                
+                result = self._parse_ai_response("".join(parts))
+                if not score_ready.done():
+                    score_ready.set_result(result['overall_score'])
+                
+                await self._cache_store(cache_key, result, embedding)
+                return result
+            
+            except Exception as e:
+                if not score_ready.done():
+                    score_ready.set_result(None)
+                return {
+                    'success': False,
+                    'error': str(e),
+                }
+        
+        analysis = asyncio.create_task(consume())
+        return await score_ready, analysis
+    
+    def _cache_key(self, system: str, prompt: str) -> str:
+        """
+        Build the exact-match cache key for a scoring request.
+        
+        Args:
+            system: System prompt.
+            prompt: User prompt.
+        
+        Returns:
+            str: Hex digest identifying the request.
+        """
+        digest = blake2b(digest_size=16)
+        for part in (self.model, system, prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    async def _cache_lookup(
+        self,
+        key: str,
+        prompt: str
+    ) -> Tuple[Optional[Dict], Optional[np.ndarray]]:
+        """
+        Look up a cached scoring result.
+        
+        Checks the in-memory cache, then Redis, then (if enabled) the
+        semantic tier.
+        
+        Args:
+            key: Exact-match cache key.
+            prompt: User prompt, embedded for the semantic tier.
+        
+        Returns:
+            tuple: Cached result or None, and the prompt embedding when the
+                semantic tier computed one (to be reused when storing).
+        """
+        result = _RESULTS.get(key)
+        if result is not None:
+            _RESULTS.move_to_end(key)
+            return result, None
+        
+        if self.cache is not None:
+            try:
+                raw = await self.cache.get(_CACHE_KEY_PREFIX + key)
+            except RedisError:
+                # An unavailable cache is a miss, not a failed score
+                raw = None
+            if raw is not None:
+                result = json.loads(raw)
+                _remember(key, result)
+                return result, None
+        
+        if not self.semantic_cache:
+            return None, None
+        
+        try:
+            embedding = await self._create_embedding(prompt)
+        except openai.APIError:
+            # Like Redis, an unavailable semantic tier is a miss
+            return None, None
+        
+        index = _EMBEDDINGS.get(self.model)
+        if index is not None:
+            nearest, similarity = index.nearest(embedding)
+            if nearest is not None and similarity >= _SEMANTIC_SIMILARITY_THRESHOLD:
+                return _RESULTS.get(nearest), embedding
+        
+        return None, embedding
+    
+    async def _cache_store(
+        self,
+        key: str,
+        result: Dict,
+        embedding: Optional[np.ndarray]
+    ) -> None:
+        """
+        Store a scoring result in every configured cache tier.
+        
+        Args:
+            key: Exact-match cache key.
+            result: Parsed scoring result.
+            embedding: Normalized prompt embedding for the semantic tier.
+        """
+        _remember(key, result)
+        
+        if self.cache is not None:
+            try:
+                await self.cache.setex(_CACHE_KEY_PREFIX + key, self.cache_ttl, json.dumps(result))
+            except RedisError:
+                pass
+        
+        if embedding is not None:
+            index = _EMBEDDINGS.get(self.model)
+            if index is None:
+                index = _EMBEDDINGS[self.model] = _EmbeddingIndex()
+            index.add(key, embedding)
+    
+    async def score_content_batch(
+        self,
+        items: List[Tuple[str, str, Optional[str]]],
+        max_concurrent: int = 20
+    ) -> List[Dict]:
+        """
+        Score many pages concurrently.
+        
+        At most ``max_concurrent`` requests are in flight at once; the
+        scorer's rate limiter, if configured, also paces submissions.
+        
+        Args:
+            items: ``(content, url, target_keyword)`` tuples.
+            max_concurrent: Maximum number of concurrent requests.
+        
+        Returns:
+            list: Content quality analysis for each item, in input order.
+        """
+        sem = asyncio.Semaphore(max_concurrent)
+        
+        async def _score(content: str, url: str, target_keyword: Optional[str]) -> Dict:
+            async with sem:
+                return await self.score_content(content, url, target_keyword)
+        
+        results = await asyncio.gather(
+            *(_score(*item) for item in items),
+            return_exceptions=True,
+        )
+        
+        return [
+            result if not isinstance(result, BaseException) else {
+                'success': False,
+                'error': str(result),
+            }
+            for result in results
+        ]
+    
     def _build_scoring_prompt(
         self,
         content: str,
@@ -106,63 +900,14 @@ class ContentQualityScorer:
         Returns:
             str: Formatted prompt.
         """
-        # Truncate content if too long
-        max_content_length = 3000
-        if len(content) > max_content_length:
-            content = content[:max_content_length] + "... [truncated]"
+        # Truncate content to the model's token budget
+        content = _truncate_tokens(content, self.model, _MAX_CONTENT_TOKENS)
         
-        prompt = f"""Analyze the following web page content for SEO and quality:
-
-URL: {url}
-{f"Target Keyword: {target_keyword}" if target_keyword else ""}
-{f"Industry: {context.get('industry')}" if context and context.get('industry') else ""}
-
-CONTENT:
-{content}
-
-Please provide a comprehensive analysis in the following structured format:
-
-1. OVERALL SCORE (0-100):
-   - Provide a numerical score
-
-2. READABILITY ANALYSIS:
-   - Grade level and clarity
-   - Sentence structure
-   - Use of jargon
-
-3. SEO OPTIMIZATION:
-   - Keyword usage and density
-   - Content structure (headings, paragraphs)
-   - Internal linking opportunities
-   - Meta information assessment
-
-4. E-A-T ASSESSMENT (Expertise, Authoritativeness, Trustworthiness):
-   - Evidence of expertise
-   - Credibility signals
-   - Trust factors
-
-5. ENGAGEMENT POTENTIAL:
-   - Hook and introduction quality
-   - Content depth and value
-   - Call-to-action effectiveness
-
-6. CONTENT COMPLETENESS:
-   - Topic coverage
-   - Missing elements
-   - Information gaps
-
-7. TOP 3 STRENGTHS:
-   - List specific strengths
-
-8. TOP 5 IMPROVEMENTS:
-   - Prioritized, actionable recommendations
-
-9. CONTENT TYPE CLASSIFICATION:
-   - Identify content type (informational, commercial, transactional, etc.)
-
-Provide the analysis in a clear, structured format."""
-
-        return prompt
+        industry = context.get('industry') if context else None
+        
+        return _build_scoring_prompt_cached(
+            content, url, target_keyword, str(industry) if industry else None
+        )
     
     def _parse_ai_response(self, response_text: str) -> Dict:
         """
@@ -177,16 +922,9 @@ Provide the analysis in a clear, structured format."""
         # This is a simplified parser
         # In production, you'd use more robust parsing or structured output
         
-        lines = response_text.split('\n')
-        
-        # Extract overall score (basic regex)
-        import re
-        score_match = re.search(r'(\d+)\s*(?:/100|out of 100)?', response_text[:500])
-        overall_score = int(score_match.group(1)) if score_match else 70
-        
         return {
             'success': True,
-            'overall_score': min(100, max(0, overall_score)),
+            'overall_score': _match_score(response_text),
             'analysis': response_text,
             'recommendations': self._extract_recommendations(response_text),
             'strengths': self._extract_strengths(response_text),
@@ -194,34 +932,49 @@ Provide the analysis in a clear, structured format."""
     
     def _extract_recommendations(self, text: str) -> List[str]:
         """Extract recommendations from AI response."""
-        recommendations = []
+        improvements = []
+        numbered = []
+        in_improvements = False
         
-        # Look for numbered lists or bullet points
-        import re
-        patterns = [
-            r'(?:TOP \d+ IMPROVEMENTS|IMPROVEMENTS|RECOMMENDATIONS):\s*\n((?:[-•*]\s*.+\n?)+)',
-            r'\d+\.\s+(.+?)(?=\n\d+\.|\n\n|$)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.MULTILINE | re.IGNORECASE)
-            if matches:
-                for match in matches[:5]:  # Limit to top 5
-                    recommendations.append(match.strip())
-                break
+        # Single pass over the lines: prefer the bullets under an
+        # improvements header, falling back to numbered list items
+        for line in text.splitlines():
+            stripped = line.strip()
+            
+            if in_improvements:
+                bullet = _BULLET_RE.fullmatch(stripped)
+                if bullet:
+                    improvements.append(bullet.group(1).strip())
+                    if len(improvements) == 5:  # Limit to top 5
+                        break
+                    continue
+                if stripped or improvements:
+                    in_improvements = False
+                    if improvements:
+                        break
+            
+            if _IMPROV_HEADER_RE.search(stripped):
+                in_improvements = True
+            
+            if len(numbered) < 5:
+                item = _NUMBERED_LINE_RE.fullmatch(stripped)
+                if item:
+                    numbered.append(item.group(1).strip())
         
-        return recommendations or ["Review AI analysis for detailed recommendations"]
+        return (
+            improvements
+            or numbered
+            or ["Review AI analysis for detailed recommendations"]
+        )
     
     def _extract_strengths(self, text: str) -> List[str]:
         """Extract strengths from AI response."""
         strengths = []
         
-        import re
-        pattern = r'(?:TOP \d+ STRENGTHS|STRENGTHS):\s*\n((?:[-•*]\s*.+\n?)+)'
-        match = re.search(pattern, text, re.MULTILINE | re.IGNORECASE)
+        match = _STRENGTHS_RE.search(text)
         
         if match:
-            items = re.findall(r'[-•*]\s*(.+)', match.group(1))
+            items = _BULLET_RE.findall(match.group(1))
             strengths = [item.strip() for item in items[:3]]
         
         return strengths or ["Content has good structure"]
@@ -261,8 +1014,7 @@ Provide analysis:
 """
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
+            response = await self._create_completion(
                 messages=[
                     {"role": "system", "content": "You are an SEO competitor analysis expert."},
                     {"role": "user", "content": prompt}
@@ -316,8 +1068,7 @@ Provide:
 Format as an actionable brief for a content writer."""
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
+            response = await self._create_completion(
                 messages=[
                     {"role": "system", "content": "You are an SEO content strategist."},
                     {"role": "user", "content": prompt}
@@ -335,6 +1086,63 @@ Format as an actionable brief for a content writer."""
                 'success': False,
                 'error': str(e),
             }
+    
+    async def analyze_content(
+        self,
+        content: str,
+        url: str,
+        topic: str,
+        target_keyword: str,
+        competitor_contents: List[Dict],
+        max_concurrent: int = 3
+    ) -> Dict:
+        """
+        Score a page, compare it with competitors and draft a brief concurrently.
+        
+        The three requests are fanned out together, as a dashboard needs all
+        of them; they share the scorer's rate limiter like any other call.
+        
+        Args:
+            content: Page content to analyze.
+            url: Page URL for context.
+            topic: Content topic for the brief.
+            target_keyword: Target keyword.
+            competitor_contents: List of competitor content dicts with 'url'
+                and 'content'.
+            max_concurrent: Maximum number of concurrent requests.
+        
+        Returns:
+            dict: 'score', 'comparison' and 'brief' results, as returned by
+                ``score_content``, ``compare_with_competitors`` and
+                ``generate_content_brief``.
+        """
+        sem = asyncio.Semaphore(max_concurrent)
+        
+        async def _run(request: Awaitable[Dict]) -> Dict:
+            async with sem:
+                return await request
+        
+        competitor_urls = [comp.get('url', '') for comp in competitor_contents]
+        results = await asyncio.gather(
+            _run(self.score_content(content, url, target_keyword)),
+            _run(self.compare_with_competitors(content, competitor_contents)),
+            _run(self.generate_content_brief(topic, target_keyword, competitor_urls)),
+            return_exceptions=True,
+        )
+        
+        score, comparison, brief = (
+            result if not isinstance(result, BaseException) else {
+                'success': False,
+                'error': str(result),
+            }
+            for result in results
+        )
+        
+        return {
+            'score': score,
+            'comparison': comparison,
+            'brief': brief,
+        }
 
 
 async def score_content_quality(
@@ -0,0 +1,132 @@
+"""
+Hamming-distance helpers for 64-bit fingerprints (SimHash, pHash).
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+# Narrowest band worth indexing; below this, buckets hold most fingerprints
+# and a dense distance matrix is cheaper
+_MIN_BAND_BITS = 8
+
+# Rows of the pairwise distance matrix computed at a time
+_BLOCK_ROWS = 1024
+
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_H01 = np.uint64(0x0101010101010101)
+
+
+def _swar_popcount64(x: np.ndarray) -> np.ndarray:
+    """
+    Count the set bits of each element of a uint64 array.
+    
+    Args:
+        x: Array of uint64 values.
+    
+    Returns:
+        np.ndarray: Bit counts, as uint8.
+    """
+    x = x - ((x >> np.uint64(1)) & _M1)
+    x = (x & _M2) + ((x >> np.uint64(2)) & _M2)
+    x = (x + (x >> np.uint64(4))) & _M4
+    return ((x * _H01) >> np.uint64(56)).astype(np.uint8)
+
+
+# NumPy 2.0+ ships a native popcount ufunc
+popcount64 = getattr(np, 'bitwise_count', _swar_popcount64)
+
+
+def band_layout(threshold: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Split the 64 fingerprint bits into ``threshold + 1`` bands.
+    
+    Two fingerprints within ``threshold`` bits of each other must agree on
+    at least one band, so only fingerprints sharing a band need to be
+    compared.
+    
+    Args:
+        threshold: Maximum Hamming distance for near-duplicates.
+    
+    Returns:
+        list: (shift, width) of each band, or None if the bands would be
+            narrower than ``_MIN_BAND_BITS``.
+    """
+    num_bands = threshold + 1
+    if 64 // num_bands < _MIN_BAND_BITS:
+        return None
+    
+    bounds = [i * 64 // num_bands for i in range(num_bands + 1)]
+    return [(low, high - low) for low, high in zip(bounds, bounds[1:])]
+
+
+def near_duplicate_groups(fingerprints: np.ndarray, threshold: int) -> List[List[int]]:
+    """
+    Group fingerprints that are within ``threshold`` bits of each other.
+    
+    Every pair within the threshold is merged into one group (union-find),
+    so groups are the connected components of the near-duplicate graph.
+    Candidate pairs come from ``band_layout`` buckets; when the bands would
+    be too narrow, distances are computed densely in row blocks instead.
+    
+    Args:
+        fingerprints: uint64 array of fingerprints.
+        threshold: Maximum Hamming distance for near-duplicates.
+    
+    Returns:
+        list: Ascending indices of each group with two or more members,
+            ordered by their first index.
+    """
+    num_fingerprints = len(fingerprints)
+    parent = list(range(num_fingerprints))
+    
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    def union(i: int, others: List[int]) -> None:
+        root = find(i)
+        for j in others:
+            other_root = find(j)
+            if other_root != root:
+                # Keep the smallest index as the root of each group
+                if other_root < root:
+                    root, other_root = other_root, root
+                parent[other_root] = root
+    
+    bands = band_layout(threshold)
+    
+    if bands is not None:
+        # Near-duplicates share at least one band; compare within buckets
+        for shift, width in bands:
+            values = (fingerprints >> np.uint64(shift)) & np.uint64((1 << width) - 1)
+            
+            # Group indices by band value with one sort
+            order = np.argsort(values, kind='stable')
+            sorted_values = values[order]
+            cuts = np.flatnonzero(sorted_values[1:] != sorted_values[:-1]) + 1
+            
+            for members in np.split(order, cuts):
+                for k in range(len(members) - 1):
+                    others = members[k + 1:]
+                    distances = popcount64(fingerprints[others] ^ fingerprints[members[k]])
+                    union(int(members[k]), others[distances <= threshold].tolist())
+    else:
+        for start in range(0, num_fingerprints, _BLOCK_ROWS):
+            stop = min(start + _BLOCK_ROWS, num_fingerprints)
+            distances = popcount64(fingerprints[start:stop, None] ^ fingerprints[None, :])
+            
+            for i, row in enumerate(distances, start):
+                similar = np.flatnonzero(row[i + 1:] <= threshold) + i + 1
+                union(i, similar.tolist())
+    
+    groups = {}
+    for i in range(num_fingerprints):
+        groups.setdefault(find(i), []).append(i)
+    
+    return [members for members in groups.values() if len(members) > 1]
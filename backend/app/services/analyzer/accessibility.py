@@ -5,9 +5,47 @@ This module provides WCAG compliance checking and accessibility
 analysis for web pages.
 """
 
-from typing import Dict, List, Optional
-from playwright.async_api import async_playwright, Browser, Page
-import json
+import asyncio
+import heapq
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import aiofiles
+import httpx
+import orjson
+from playwright.async_api import async_playwright, Browser, BrowserContext
+
+
+_IMPACT_CATEGORIES = ('critical', 'serious', 'moderate', 'minor')
+
+# Runs AXE and trims its results in the browser, so only the fields the
+# report uses (and at most 5 nodes per violation) cross the CDP boundary.
+_AXE_RUN_JS = '''
+async (options) => {
+    const results = await axe.run(options);
+    return {
+        timestamp: results.timestamp,
+        violations: results.violations.map(v => ({
+            id: v.id,
+            description: v.description,
+            help: v.help,
+            helpUrl: v.helpUrl,
+            impact: v.impact,
+            tags: v.tags,
+            nodesAffected: v.nodes.length,
+            nodes: v.nodes.slice(0, 5).map(n => ({
+                html: n.html,
+                target: n.target,
+                failureSummary: n.failureSummary,
+            })),
+        })),
+        passCount: results.passes.length,
+        incompleteCount: results.incomplete.length,
+        inapplicableCount: results.inapplicable.length,
+    };
+}
+'''
 
 
 class AccessibilityAuditor:
@@ -21,13 +59,29 @@ class AccessibilityAuditor:
     - Keyboard navigation
     """
     
-    # AXE core script - this would be injected into pages
-    AXE_SCRIPT_URL = "https://cdnjs.cloudflare.com/ajax/libs/axe-core/4.7.2/axe.min.js"
+    # AXE core script - downloaded once, cached on disk and injected into pages
+    AXE_VERSION = "4.7.2"
+    AXE_SCRIPT_URL = f"https://cdnjs.cloudflare.com/ajax/libs/axe-core/{AXE_VERSION}/axe.min.js"
+    AXE_CACHE_PATH = Path.home() / ".cache" / "seorankpulse" / f"axe-{AXE_VERSION}.js"
+    AXE_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
     
-    def __init__(self):
-        """Initialize accessibility auditor."""
+    def __init__(self, concurrency: int = 5):
+        """
+        Initialize accessibility auditor.
+        
+        Args:
+            concurrency: Maximum number of browser contexts audited in
+                parallel; contexts are only opened as audits need them.
+        """
+        self.concurrency = concurrency
         self.browser: Optional[Browser] = None
         self.playwright = None
+        self._axe_js: Optional[str] = None
+        self._contexts: List[BrowserContext] = []
+        self._idle_contexts: Optional[asyncio.Queue] = None
+        # Contexts opened or being opened, counted before awaiting so
+        # concurrent audits cannot exceed ``concurrency``
+        self._context_count = 0
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -39,12 +93,91 @@ class AccessibilityAuditor:
         await self.close()
     
     async def initialize(self):
-        """Initialize Playwright browser."""
+        """
+        Initialize Playwright browser and the (empty) pool of audit contexts.
+        
+        The AXE bundle is loaded once and registered as an init script
+        on every context, so each new page has ``axe`` defined on load.
+        """
+        self._axe_js = await self._load_axe_script()
+        
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(headless=True)
+        
+        self._idle_contexts = asyncio.Queue()
+    
+    async def _acquire_context(self) -> BrowserContext:
+        """
+        Borrow an idle context, opening a new one while under ``concurrency``.
+        
+        Returns:
+            BrowserContext: Context with AXE registered as an init script.
+        """
+        if self._idle_contexts.empty() and self._context_count < self.concurrency:
+            self._context_count += 1
+            try:
+                context = await self.browser.new_context()
+            except Exception:
+                self._context_count -= 1
+                raise
+            
+            self._contexts.append(context)
+            try:
+                await context.add_init_script(script=self._axe_js)
+            except Exception:
+                self._contexts.remove(context)
+                self._context_count -= 1
+                await context.close()
+                raise
+            return context
+        
+        return await self._idle_contexts.get()
+    
+    async def _load_axe_script(self) -> str:
+        """
+        Load the AXE bundle, preferring the on-disk cache.
+        
+        The cached copy is used while it is younger than
+        ``AXE_CACHE_MAX_AGE``; otherwise the bundle is downloaded again.
+        A stale copy is still used if the download fails.
+        
+        Returns:
+            str: AXE JavaScript source.
+        """
+        path = self.AXE_CACHE_PATH
+        try:
+            age = time.time() - path.stat().st_mtime
+        except OSError:
+            age = None
+        
+        if age is not None and age < self.AXE_CACHE_MAX_AGE:
+            return path.read_text(encoding='utf-8')
+        
+        try:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                response = await client.get(self.AXE_SCRIPT_URL)
+                response.raise_for_status()
+        except httpx.HTTPError:
+            if age is not None:
+                return path.read_text(encoding='utf-8')
+            raise
+        
+        script = response.text
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(script, encoding='utf-8')
+        except OSError:
+            pass  # Caching is best-effort
+        
+        return script
     
     async def close(self):
         """Close browser and cleanup."""
+        for context in self._contexts:
+            await context.close()
+        self._contexts = []
+        self._idle_contexts = None
+        self._context_count = 0
         if self.browser:
             await self.browser.close()
         if self.playwright:
@@ -67,20 +200,19 @@ class AccessibilityAuditor:
         Returns:
             dict: Accessibility audit results.
         """
-        if not self.browser:
+        if not self.browser or self._idle_contexts is None:
             raise RuntimeError("Browser not initialized")
         
-        page = await self.browser.new_page()
+        context = None
+        page = None
         
         try:
-            # Navigate to page
-            await page.goto(url, wait_until='networkidle', timeout=30000)
-            
-            # Inject AXE core
-            await page.add_script_tag(url=self.AXE_SCRIPT_URL)
+            # Borrow a context; this also bounds the number of open pages
+            context = await self._acquire_context()
+            page = await context.new_page()
             
-            # Wait for AXE to load
-            await page.wait_for_function("typeof axe !== 'undefined'")
+            # Navigate to page (AXE is already injected by the init script)
+            await page.goto(url, wait_until='networkidle', timeout=30000)
             
             # Configure AXE options
             options = {}
@@ -96,11 +228,7 @@ class AccessibilityAuditor:
                 }
             
             # Run AXE audit
-            results = await page.evaluate(f'''
-                () => {{
-                    return axe.run({json.dumps(options)});
-                }}
-            ''')
+            results = await page.evaluate(_AXE_RUN_JS, options)
             
             # Process results
             return self._process_results(url, results)
@@ -113,7 +241,10 @@ class AccessibilityAuditor:
             }
         
         finally:
-            await page.close()
+            if page is not None:
+                await page.close()
+            if context is not None:
+                self._idle_contexts.put_nowait(context)
     
     def _process_results(self, url: str, axe_results: Dict) -> Dict:
         """
@@ -121,15 +252,13 @@ class AccessibilityAuditor:
         
         Args:
             url: Audited URL.
-            axe_results: Raw AXE results.
+            axe_results: AXE results, as trimmed in the browser by ``_AXE_RUN_JS``.
         
         Returns:
             dict: Processed accessibility report.
         """
         violations = axe_results.get('violations', [])
-        passes = axe_results.get('passes', [])
-        incomplete = axe_results.get('incomplete', [])
-        inapplicable = axe_results.get('inapplicable', [])
+        pass_count = axe_results.get('passCount', 0)
         
         # Categorize violations by impact
         critical_issues = []
@@ -147,14 +276,14 @@ class AccessibilityAuditor:
                 'help_url': violation.get('helpUrl'),
                 'impact': impact,
                 'tags': violation.get('tags', []),
-                'nodes_affected': len(violation.get('nodes', [])),
+                'nodes_affected': violation.get('nodesAffected', 0),
                 'nodes': [
                     {
                         'html': node.get('html'),
                         'target': node.get('target'),
                         'failure_summary': node.get('failureSummary'),
                     }
-                    for node in violation.get('nodes', [])[:5]  # Limit to first 5
+                    for node in violation.get('nodes', [])
                 ]
             }
             
@@ -169,7 +298,7 @@ class AccessibilityAuditor:
         
         # Calculate score
         total_violations = len(violations)
-        total_checks = len(violations) + len(passes)
+        total_checks = len(violations) + pass_count
         score = round((1 - total_violations / max(total_checks, 1)) * 100, 2)
         
         # Determine compliance level
@@ -192,9 +321,9 @@ class AccessibilityAuditor:
                 'serious': len(serious_issues),
                 'moderate': len(moderate_issues),
                 'minor': len(minor_issues),
-                'passes': len(passes),
-                'incomplete': len(incomplete),
-                'inapplicable': len(inapplicable),
+                'passes': pass_count,
+                'incomplete': axe_results.get('incompleteCount', 0),
+                'inapplicable': axe_results.get('inapplicableCount', 0),
             },
             'score': score,
             'compliance_level': compliance_level,
@@ -213,21 +342,49 @@ class AccessibilityAuditor:
     
     async def batch_audit(self, urls: List[str]) -> List[Dict]:
         """
-        Audit multiple URLs.
+        Audit multiple URLs concurrently across the context pool.
+        
+        Args:
+            urls: List of URLs to audit.
+        
+        Returns:
+            list: Accessibility reports for each URL, in input order.
+        """
+        return list(await asyncio.gather(*(self.audit_url(url) for url in urls)))
+    
+    async def batch_audit_to_file(
+        self,
+        urls: List[str],
+        output_path: Union[str, Path]
+    ) -> Dict[str, int]:
+        """
+        Audit multiple URLs, appending each report to a JSONL file.
+        
+        Reports are written as soon as each audit finishes instead of being
+        held in memory, which keeps site-wide audits flat on memory. Use
+        ``read_audit_report`` to load a single report back.
         
         Args:
             urls: List of URLs to audit.
+            output_path: JSONL file to append reports to.
         
         Returns:
-            list: Accessibility reports for each URL.
+            dict: Byte offset of each URL's report within the file.
         """
-        results = []
+        manifest = {}
         
-        for url in urls:
-            result = await self.audit_url(url)
-            results.append(result)
+        async with aiofiles.open(output_path, 'ab') as f:
+            offset = await f.tell()
+            for next_result in asyncio.as_completed(
+                [self.audit_url(url) for url in urls]
+            ):
+                result = await next_result
+                line = orjson.dumps(result) + b'\n'
+                await f.write(line)
+                manifest[result['url']] = offset
+                offset += len(line)
         
-        return results
+        return manifest
 
 
 async def audit_accessibility(url: str, tags: Optional[List[str]] = None) -> Dict:
@@ -245,6 +402,22 @@ async def audit_accessibility(url: str, tags: Optional[List[str]] = None) -> Dic
         return await auditor.audit_url(url, tags=tags)
 
 
+def read_audit_report(path: Union[str, Path], offset: int) -> Dict:
+    """
+    Read one report written by ``batch_audit_to_file``.
+    
+    Args:
+        path: JSONL file the reports were written to.
+        offset: Byte offset of the report, as returned in the manifest.
+    
+    Returns:
+        dict: Accessibility audit results.
+    """
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        return orjson.loads(f.readline())
+
+
 def generate_accessibility_report(audit_results: List[Dict]) -> Dict:
     """
     Generate aggregated accessibility report for multiple pages.
@@ -263,54 +436,49 @@ def generate_accessibility_report(audit_results: List[Dict]) -> Dict:
             'error': 'No successful audits',
         }
     
-    # Aggregate stats
-    total_violations = sum(
-        r['summary']['total_violations']
-        for r in successful_audits
-    )
-    
-    total_critical = sum(
-        r['summary']['critical']
-        for r in successful_audits
-    )
-    
-    total_serious = sum(
-        r['summary']['serious']
-        for r in successful_audits
-    )
-    
-    # Find pages with most issues
-    pages_by_issues = sorted(
-        successful_audits,
-        key=lambda x: x['summary']['total_violations'],
-        reverse=True
-    )
-    
-    # Common violations
+    # Aggregate stats and common violations in a single pass
+    total_violations = 0
+    total_critical = 0
+    total_serious = 0
+    score_sum = 0
     violation_counts = {}
     for result in successful_audits:
-        for category in ['critical', 'serious', 'moderate', 'minor']:
-            for violation in result['violations'][category]:
+        summary = result['summary']
+        total_violations += summary['total_violations']
+        total_critical += summary['critical']
+        total_serious += summary['serious']
+        score_sum += result['score']
+        
+        violations = result['violations']
+        for category in _IMPACT_CATEGORIES:
+            for violation in violations[category]:
                 vid = violation['id']
-                if vid not in violation_counts:
-                    violation_counts[vid] = {
+                counts = violation_counts.get(vid)
+                if counts is None:
+                    counts = violation_counts[vid] = {
                         'id': vid,
                         'description': violation['description'],
                         'impact': violation['impact'],
                         'count': 0,
                         'pages_affected': 0,
                     }
-                violation_counts[vid]['count'] += violation['nodes_affected']
-                violation_counts[vid]['pages_affected'] += 1
+                counts['count'] += violation['nodes_affected']
+                counts['pages_affected'] += 1
     
-    top_violations = sorted(
+    # Only the top 10 are reported, so avoid fully sorting either list
+    worst_pages = heapq.nlargest(
+        10,
+        successful_audits,
+        key=lambda x: x['summary']['total_violations'],
+    )
+    
+    top_violations = heapq.nlargest(
+        10,
         violation_counts.values(),
         key=lambda x: x['pages_affected'],
-        reverse=True
-    )[:10]
+    )
     
-    # Calculate average score
-    avg_score = sum(r['score'] for r in successful_audits) / len(successful_audits)
+    avg_score = score_sum / len(successful_audits)
     
     return {
         'summary': {
@@ -328,7 +496,7 @@ def generate_accessibility_report(audit_results: List[Dict]) -> Dict:
                 'critical': p['summary']['critical'],
                 'serious': p['summary']['serious'],
             }
-            for p in pages_by_issues[:10]
+            for p in worst_pages
         ],
         'common_violations': top_violations,
     }
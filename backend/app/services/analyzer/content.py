@@ -6,14 +6,68 @@ readability, and SEO-relevant metrics.
 """
 
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional
 from collections import Counter
+from itertools import islice
 
 import nltk
-from bs4 import BeautifulSoup
+import numpy as np
+from lxml import etree
 
 
-def calculate_readability_score(text: str) -> Dict[str, float]:
+# One match per sentence: a run of non-terminators containing a non-space
+_SENT_RE = re.compile(r'[^.!?\s][^.!?]*')
+_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+
+# Byte table mapping every ASCII non-word character to a space, so
+# splitting translated ASCII text yields the same runs \w+ would match
+_NON_WORD_TABLE = bytes(
+    c if chr(c).isalnum() or c == ord('_') else ord(' ')
+    for c in range(128)
+) + bytes(range(128, 256))
+
+# Vowels for the per-word syllable counter
+_VOWELS = frozenset("aeiouy")
+
+# Code points used by the vectorized syllable counter
+_VOWEL_CODES = np.array([ord(c) for c in "aeiouy"], dtype=np.uint32)
+_SPACE_CODE = ord(" ")
+_E_CODE = ord("e")
+
+# Bytes str.split() treats as whitespace, for counting ASCII words
+_ASCII_WHITESPACE = np.zeros(256, dtype=bool)
+_ASCII_WHITESPACE[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+
+# Common stop words
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'should', 'could', 'may', 'might', 'can', 'this', 'that', 'these',
+    'those', 'it', 'its', 'they', 'them', 'their', 'what', 'which',
+})
+
+
+def count_sentences(text: str) -> int:
+    """
+    Count sentences delimited by '.', '!' or '?'.
+    
+    Counts matches without building the list of sentence substrings.
+    
+    Args:
+        text: The text to analyze.
+    
+    Returns:
+        int: Number of non-blank sentences.
+    """
+    return sum(1 for _ in _SENT_RE.finditer(text))
+
+
+def calculate_readability_score(
+    text: str,
+    words: Optional[List[str]] = None,
+    sentence_count: Optional[int] = None
+) -> Dict[str, float]:
     """
     Calculate Flesch Reading Ease and other readability metrics.
     
@@ -22,31 +76,32 @@ def calculate_readability_score(text: str) -> Dict[str, float]:
     
     Args:
         text: The text to analyze.
+        words: ``text.split()``, if the caller already has it.
+        sentence_count: ``count_sentences(text)``, if already computed.
     
     Returns:
         dict: Readability scores and interpretation.
     """
-    # Clean text
-    text = re.sub(r'\s+', ' ', text).strip()
+    # Count words; runs of whitespace never affect any of the counts
+    if words is None:
+        words = text.split()
     
-    if not text:
+    if not words:
         return {
             "flesch_reading_ease": 0.0,
             "flesch_kincaid_grade": 0.0,
             "interpretation": "No content",
         }
     
-    # Count sentences
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
-    num_sentences = len(sentences) or 1
+    num_words = len(words)
     
-    # Count words
-    words = text.split()
-    num_words = len(words) or 1
+    # Count sentences
+    if sentence_count is None:
+        sentence_count = count_sentences(text)
+    num_sentences = sentence_count or 1
     
     # Count syllables (simplified approximation)
-    num_syllables = sum(count_syllables(word) for word in words)
+    num_syllables = count_syllables_text(text, words)
     
     # Calculate Flesch Reading Ease
     flesch = 206.835 - 1.015 * (num_words / num_sentences) - 84.6 * (num_syllables / num_words)
@@ -91,12 +146,11 @@ def count_syllables(word: str) -> int:
         int: Estimated syllable count.
     """
     word = word.lower().strip()
-    vowels = "aeiouy"
     count = 0
     previous_was_vowel = False
     
     for char in word:
-        is_vowel = char in vowels
+        is_vowel = char in _VOWELS
         if is_vowel and not previous_was_vowel:
             count += 1
         previous_was_vowel = is_vowel
@@ -112,6 +166,72 @@ def count_syllables(word: str) -> int:
     return count
 
 
+def count_words(text: str) -> int:
+    """
+    Count whitespace-separated words without building a word list.
+    
+    Gives the same result as ``len(text.split())``. ASCII text is counted
+    from word starts in a NumPy array of its bytes.
+    
+    Args:
+        text: Text to count.
+    
+    Returns:
+        int: Number of words.
+    """
+    if not text.isascii():
+        return len(text.split())
+    if not text:
+        return 0
+    
+    is_space = _ASCII_WHITESPACE[np.frombuffer(text.encode('ascii'), dtype=np.uint8)]
+    
+    # A word starts at every non-space preceded by a space (or the start)
+    starts = int(np.count_nonzero(is_space[:-1] & ~is_space[1:]))
+    return starts if is_space[0] else starts + 1
+
+
+def count_syllables_text(text: str, words: Optional[List[str]] = None) -> int:
+    """
+    Count syllables across all words of a text in one vectorized pass.
+    
+    Gives the same total as summing ``count_syllables`` over
+    ``text.split()``, but works on the whole text as a NumPy array of code
+    points instead of looping over characters in Python.
+    
+    Args:
+        text: Whitespace-separated text.
+        words: ``text.split()``, if the caller already has it.
+    
+    Returns:
+        int: Estimated syllable count.
+    """
+    if words is None:
+        words = text.split()
+    if not words:
+        return 0
+    
+    chars = np.frombuffer(" ".join(words).lower().encode("utf-32-le"), dtype=np.uint32)
+    
+    is_vowel = np.isin(chars, _VOWEL_CODES)
+    is_space = chars == _SPACE_CODE
+    
+    # Vowel groups start where a vowel follows a non-vowel; spaces are
+    # non-vowels, so groups never span words
+    group_starts = is_vowel.copy()
+    group_starts[1:] &= ~is_vowel[:-1]
+    
+    word_ids = np.cumsum(is_space)
+    counts = np.bincount(word_ids[group_starts], minlength=len(words))
+    
+    # Adjust for silent 'e' at the end of each word
+    word_ends = np.flatnonzero(np.append(is_space[1:], True) & ~is_space)
+    counts -= chars[word_ends] == _E_CODE
+    
+    # Ensure at least one syllable per word
+    return int(np.maximum(counts, 1).sum())
+
+
 def extract_keywords(text: str, top_n: int = 10) -> List[Dict]:
     """
     Extract top keywords from text using TF-IDF-like approach.
@@ -125,19 +245,17 @@ def extract_keywords(text: str, top_n: int = 10) -> List[Dict]:
     """
     # Clean and tokenize
     text_lower = text.lower()
-    words = re.findall(r'\b[a-z]{3,}\b', text_lower)
-    
-    # Common stop words
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-        'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-        'should', 'could', 'may', 'might', 'can', 'this', 'that', 'these',
-        'those', 'it', 'its', 'they', 'them', 'their', 'what', 'which',
-    }
+    
+    if text_lower.isascii():
+        # Fast path: split on non-word bytes and keep 3+ letter tokens,
+        # matching the regex below without running it
+        tokens = text_lower.encode('ascii').translate(_NON_WORD_TABLE).decode('ascii').split()
+        words = [w for w in tokens if len(w) >= 3 and w.isalpha()]
+    else:
+        words = _WORD_RE.findall(text_lower)
     
     # Filter stop words
-    filtered_words = [w for w in words if w not in stop_words]
+    filtered_words = [w for w in words if w not in _STOP_WORDS]
     
     # Count frequencies
     word_counts = Counter(filtered_words)
@@ -156,13 +274,61 @@ def extract_keywords(text: str, top_n: int = 10) -> List[Dict]:
     return keywords
 
 
-def calculate_content_metrics(html: str, text: str) -> Dict:
+class _ParagraphCounter:
+    """lxml parser target that counts <p> start tags without building a tree."""
+    
+    def __init__(self) -> None:
+        """Start with no paragraphs counted."""
+        self.count = 0
+    
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        """Count the element if it is a paragraph."""
+        if tag == 'p':
+            self.count += 1
+    
+    def end(self, tag: str) -> None:
+        """Ignore end tags."""
+    
+    def data(self, data: str) -> None:
+        """Ignore text content."""
+    
+    def close(self) -> int:
+        """Return the paragraph count as the parser's result."""
+        return self.count
+
+
+def count_paragraphs(html: str) -> int:
+    """
+    Count <p> elements in an HTML document in a single streaming pass.
+    
+    Args:
+        html: Raw HTML content.
+    
+    Returns:
+        int: Number of paragraph elements.
+    """
+    if not html.strip():
+        return 0
+    
+    # Parse as UTF-8 bytes so a declared encoding in the markup is ignored
+    parser = etree.HTMLParser(target=_ParagraphCounter(), encoding='utf-8')
+    return etree.HTML(html.encode('utf-8'), parser)
+
+
+def calculate_content_metrics(
+    html: str,
+    text: str,
+    words: Optional[List[str]] = None,
+    sentence_count: Optional[int] = None
+) -> Dict:
     """
     Calculate various content quality metrics.
     
     Args:
         html: Raw HTML content.
         text: Extracted text content.
+        words: ``text.split()``, if the caller already has it.
+        sentence_count: ``count_sentences(text)``, if already computed.
     
     Returns:
         dict: Content metrics.
@@ -171,20 +337,19 @@ def calculate_content_metrics(html: str, text: str) -> Dict:
     text_size = len(text)
     
     # Word count
-    words = text.split()
+    if words is None:
+        words = text.split()
     word_count = len(words)
     
     # Character count
     char_count = len(text)
     
     # Sentence count
-    sentences = re.split(r'[.!?]+', text)
-    sentence_count = len([s for s in sentences if s.strip()])
+    if sentence_count is None:
+        sentence_count = count_sentences(text)
     
     # Paragraph count (from HTML)
-    soup = BeautifulSoup(html, 'lxml')
-    paragraphs = soup.find_all('p')
-    paragraph_count = len(paragraphs)
+    paragraph_count = count_paragraphs(html)
     
     # Text to HTML ratio
     text_to_html_ratio = (text_size / html_size * 100) if html_size > 0 else 0
@@ -209,47 +374,99 @@ def calculate_content_metrics(html: str, text: str) -> Dict:
     }
 
 
-def analyze_keyword_usage(text: str, target_keyword: str) -> Dict:
+def analyze_content(html: str, text: str) -> Dict:
     """
-    Analyze how a target keyword is used in the content.
+    Calculate readability and content metrics from one tokenization.
+    
+    Splits the text into words and counts its sentences once, and shares
+    both with ``calculate_readability_score`` and
+    ``calculate_content_metrics``.
     
     Args:
-        text: Content text.
+        html: Raw HTML content.
+        text: Extracted text content.
+    
+    Returns:
+        dict: ``readability`` scores and content ``metrics``.
+    """
+    words = text.split()
+    sentence_count = count_sentences(text)
+    
+    return {
+        "readability": calculate_readability_score(text, words, sentence_count),
+        "metrics": calculate_content_metrics(html, text, words, sentence_count),
+    }
+
+
+def _keyword_usage(text_lower: str, total_words: int, target_keyword: str) -> Dict:
+    """
+    Analyze keyword usage in text that has already been lowercased.
+    
+    Args:
+        text_lower: Lowercased content text.
+        total_words: Number of whitespace-separated words in the text.
         target_keyword: Keyword to analyze.
     
     Returns:
         dict: Keyword usage analysis.
     """
-    text_lower = text.lower()
     keyword_lower = target_keyword.lower()
     
     # Count occurrences
     count = text_lower.count(keyword_lower)
     
     # Calculate density
-    words = text.split()
-    total_words = len(words)
     density = (count / total_words * 100) if total_words > 0 else 0
     
-    # Find positions (for prominence analysis)
-    positions = []
-    start = 0
-    while True:
-        pos = text_lower.find(keyword_lower, start)
-        if pos == -1:
-            break
-        positions.append(pos)
-        start = pos + 1
+    # Find positions (for prominence analysis); the lookahead also reports
+    # overlapping matches, and only the first 5 are ever scanned for
+    keyword_re = re.compile(f'(?={re.escape(keyword_lower)})')
+    positions = [m.start() for m in islice(keyword_re.finditer(text_lower), 5)]
     
     # Check if in first paragraph (important for SEO)
-    first_300_chars = text_lower[:300]
-    in_first_paragraph = keyword_lower in first_300_chars
+    in_first_paragraph = text_lower.find(keyword_lower, 0, 300) != -1
     
     return {
         "keyword": target_keyword,
         "count": count,
         "density_percent": round(density, 2),
         "in_first_paragraph": in_first_paragraph,
-        "positions": positions[:5],  # First 5 positions
+        "positions": positions,  # First 5 positions
         "optimal_density": 1.0 <= density <= 3.0,
     }
+
+
+def analyze_keyword_usage(text: str, target_keyword: str) -> Dict:
+    """
+    Analyze how a target keyword is used in the content.
+    
+    Args:
+        text: Content text.
+        target_keyword: Keyword to analyze.
+    
+    Returns:
+        dict: Keyword usage analysis.
+    """
+    return _keyword_usage(text.lower(), count_words(text), target_keyword)
+
+
+def analyze_keywords_usage(text: str, keywords: List[str]) -> List[Dict]:
+    """
+    Analyze how several target keywords are used in the same content.
+    
+    The text is lowercased and split into words once and shared by every
+    keyword, instead of once per ``analyze_keyword_usage`` call.
+    
+    Args:
+        text: Content text.
+        keywords: Keywords to analyze.
+    
+    Returns:
+        list: Keyword usage analysis for each keyword, in input order.
+    """
+    text_lower = text.lower()
+    total_words = count_words(text)
+    return [
+        _keyword_usage(text_lower, total_words, keyword)
+        for keyword in keywords
+    ]
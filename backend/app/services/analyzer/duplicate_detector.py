@@ -8,8 +8,62 @@ to identify SEO issues like content cannibalization.
 from typing import Dict, List, Tuple, Set
 import hashlib
 import re
-from collections import defaultdict
-from simhash import Simhash, SimhashIndex
+from collections import Counter, defaultdict
+
+import numpy as np
+from simhash import Simhash
+
+from app.services.analyzer._hamming import near_duplicate_groups
+
+
+_WORD_RE = re.compile(r'\w+')
+
+# Common navigation/footer text patterns, matched in one pass against
+# lowercased text (customize based on your needs)
+_BOILERPLATE_RE = re.compile('|'.join((
+    r'copyright \d{4}',
+    r'all rights reserved',
+    r'privacy policy',
+    r'terms of service',
+    r'cookie policy',
+)))
+
+# Pages with fewer words than this are too short for a stable SimHash
+# (one changed feature can flip many bits) and are matched on exact text
+_MIN_SIMHASH_WORDS = 10
+
+
+def _simhash_fingerprint(text: str) -> int:
+    """
+    Compute a 64-bit SimHash fingerprint with NumPy.
+    
+    Produces the same value as ``Simhash(text, f=64, reg=r'\\w+')``: the
+    features are 4-character shingles of the concatenated words, weighted
+    by count and hashed with the last 8 bytes of MD5. The per-bit sums are
+    computed in a single matrix product instead of per feature.
+    
+    Args:
+        text: Lowercased text.
+    
+    Returns:
+        int: Fingerprint value.
+    """
+    content = ''.join(_WORD_RE.findall(text))
+    shingles = Counter(
+        content[i:i + 4] for i in range(max(len(content) - 3, 1))
+    )
+    
+    digests = b''.join(
+        hashlib.md5(shingle.encode('utf-8')).digest()[-8:]
+        for shingle in shingles
+    )
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(-1, 64)
+    weights = np.fromiter(shingles.values(), dtype=np.int64, count=len(shingles))
+    
+    # A bit is set when the features setting it outweigh those clearing it
+    sums = weights @ bits
+    fingerprint_bits = sums > weights.sum() / 2
+    return int.from_bytes(np.packbits(fingerprint_bits).tobytes(), 'big')
 
 
 class DuplicateContentDetector:
@@ -30,8 +84,15 @@ class DuplicateContentDetector:
                                  Typical range: 0-10 (3 is recommended).
         """
         self.similarity_threshold = similarity_threshold
-        self.simhash_index = None
-        self.page_hashes = {}
+        self.url_list: List[str] = []
+        self.fp_array = np.empty(0, dtype=np.uint64)
+        self._url_index: Dict[str, int] = {}
+        self._short_texts: Dict[str, str] = {}
+    
+    @property
+    def page_hashes(self) -> Dict[str, int]:
+        """Fingerprint of each indexed page, keyed by URL."""
+        return dict(zip(self.url_list, self.fp_array.tolist()))
     
     def compute_simhash(self, text: str) -> Simhash:
         """
@@ -43,11 +104,20 @@ class DuplicateContentDetector:
         Returns:
             Simhash: SimHash object.
         """
-        # Normalize text
-        text = self._normalize_text(text)
+        return Simhash(self.compute_fingerprint(text), f=64)
+    
+    def compute_fingerprint(self, text: str) -> int:
+        """
+        Compute the 64-bit SimHash fingerprint of text content.
         
-        # Create simhash with 4-grams (groups of 4 characters)
-        return Simhash(text, f=64, reg=r'\w+')
+        Args:
+            text: Text content to hash.
+        
+        Returns:
+            int: Fingerprint value.
+        """
+        # Normalize text, then hash 4-grams (groups of 4 characters)
+        return _simhash_fingerprint(self._normalize_text(text))
     
     def _normalize_text(self, text: str) -> str:
         """
@@ -63,20 +133,10 @@ class DuplicateContentDetector:
         text = text.lower()
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = ' '.join(text.split())
         
         # Remove common navigation/footer text patterns
-        # (customize based on your needs)
-        patterns_to_remove = [
-            r'copyright \d{4}',
-            r'all rights reserved',
-            r'privacy policy',
-            r'terms of service',
-            r'cookie policy',
-        ]
-        
-        for pattern in patterns_to_remove:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        text = _BOILERPLATE_RE.sub('', text)
         
         return text
     
@@ -87,8 +147,8 @@ class DuplicateContentDetector:
         Args:
             pages: List of page dictionaries with 'url' and content.
         """
-        self.page_hashes = {}
-        data = []
+        page_hashes = {}
+        short_texts = {}
         
         for page in pages:
             url = page.get('url', '')
@@ -112,57 +172,56 @@ class DuplicateContentDetector:
             text = ' '.join(parts)
             
             if text.strip():
-                simhash = self.compute_simhash(text)
-                self.page_hashes[url] = simhash.value
-                data.append((url, simhash))
-        
-        # Build index for fast similarity search
-        if data:
-            self.simhash_index = SimhashIndex(
-                data,
-                k=self.similarity_threshold
-            )
+                normalized = self._normalize_text(text)
+                page_hashes[url] = _simhash_fingerprint(normalized)
+                
+                if len(_WORD_RE.findall(normalized)) < _MIN_SIMHASH_WORDS:
+                    short_texts[url] = normalized
+                else:
+                    short_texts.pop(url, None)
+        
+        # Pack fingerprints for vectorized distance computation
+        self.url_list = list(page_hashes)
+        self.fp_array = np.fromiter(
+            page_hashes.values(),
+            dtype=np.uint64,
+            count=len(page_hashes),
+        )
+        self._url_index = {url: i for i, url in enumerate(self.url_list)}
+        self._short_texts = short_texts
     
     def find_duplicates(self) -> List[Dict]:
         """
         Find all duplicate and near-duplicate pages.
         
+        Short pages are only grouped with pages of identical normalized text.
+        
         Returns:
             list: Groups of duplicate/similar pages.
         """
-        if not self.simhash_index:
-            return []
+        groups = []
         
-        duplicate_groups = defaultdict(list)
-        processed = set()
+        rows = [
+            i for i, url in enumerate(self.url_list)
+            if url not in self._short_texts
+        ]
+        for members in near_duplicate_groups(self.fp_array[rows], self.similarity_threshold):
+            groups.append([self.url_list[rows[i]] for i in members])
         
-        for url, hash_value in self.page_hashes.items():
-            if url in processed:
-                continue
-            
-            # Find similar pages
-            simhash_obj = Simhash(hash_value, f=64)
-            similar_urls = self.simhash_index.get_near_dups(simhash_obj)
-            
-            if len(similar_urls) > 1:
-                # Create a group
-                group_id = min(similar_urls)  # Use lexicographically smallest URL as ID
-                duplicate_groups[group_id].extend(similar_urls)
-                processed.update(similar_urls)
+        exact_groups = defaultdict(list)
+        for url, text in self._short_texts.items():
+            exact_groups[text].append(url)
+        groups.extend(urls for urls in exact_groups.values() if len(urls) > 1)
         
-        # Convert to list format
         results = []
-        for group_id, urls in duplicate_groups.items():
-            # Remove duplicates and sort
-            unique_urls = sorted(set(urls))
-            
-            if len(unique_urls) > 1:
-                results.append({
-                    'group_id': group_id,
-                    'count': len(unique_urls),
-                    'urls': unique_urls,
-                    'similarity': 'high',  # Based on threshold
-                })
+        for urls in groups:
+            urls = sorted(urls)
+            results.append({
+                'group_id': urls[0],  # Use lexicographically smallest URL as ID
+                'count': len(urls),
+                'urls': urls,
+                'similarity': 'high',  # Based on threshold
+            })
         
         return results
     
@@ -177,15 +236,15 @@ class DuplicateContentDetector:
         Returns:
             dict: Similarity analysis.
         """
-        if url1 not in self.page_hashes or url2 not in self.page_hashes:
+        index1 = self._url_index.get(url1)
+        index2 = self._url_index.get(url2)
+        
+        if index1 is None or index2 is None:
             return {
                 'error': 'One or both URLs not found in index',
             }
         
-        hash1 = Simhash(self.page_hashes[url1], f=64)
-        hash2 = Simhash(self.page_hashes[url2], f=64)
-        
-        distance = hash1.distance(hash2)
+        distance = int(self.fp_array[index1] ^ self.fp_array[index2]).bit_count()
         
         # Calculate similarity percentage (approximate)
         # Lower distance = higher similarity
@@ -212,7 +271,9 @@ class DuplicateContentDetector:
         Returns:
             list: Groups of exact duplicate pages.
         """
-        content_hashes = defaultdict(list)
+        # Group by the content itself (str hashes are cached by Python) and
+        # only compute the MD5 digest for groups that are reported
+        content_groups = defaultdict(list)
         
         for page in pages:
             url = page.get('url', '')
@@ -226,16 +287,14 @@ class DuplicateContentDetector:
             content = ' '.join(parts).strip()
             
             if content:
-                # Create MD5 hash
-                content_hash = hashlib.md5(content.encode()).hexdigest()
-                content_hashes[content_hash].append(url)
+                content_groups[content].append(url)
         
         # Find groups with duplicates
         duplicates = []
-        for content_hash, urls in content_hashes.items():
+        for content, urls in content_groups.items():
             if len(urls) > 1:
                 duplicates.append({
-                    'content_hash': content_hash,
+                    'content_hash': hashlib.md5(content.encode()).hexdigest(),
                     'count': len(urls),
                     'urls': sorted(urls),
                     'type': 'exact_duplicate',
@@ -287,23 +346,31 @@ def find_cannibalization_issues(pages: List[Dict], target_keywords: List[str]) -
     Returns:
         list: Cannibalization issues found.
     """
+    # Lowercase each page's key fields once, joined with a non-word
+    # separator, so one search covers all of them
+    page_fields = [
+        (
+            page.get('url', ''),
+            '\0'.join([
+                page.get('title', ''),
+                page.get('meta_description', ''),
+                *page.get('h1_tags', []),
+            ]).lower(),
+        )
+        for page in pages
+    ]
+    
     issues = []
     
     for keyword in target_keywords:
-        keyword_lower = keyword.lower()
-        matching_pages = []
+        # Match whole words only, so 'seo' does not match 'season'
+        keyword_re = re.compile(r'(?<!\w)' + re.escape(keyword.lower()) + r'(?!\w)')
         
-        for page in pages:
-            # Check title and meta description
-            title = page.get('title', '').lower()
-            desc = page.get('meta_description', '').lower()
-            h1_tags = [h.lower() for h in page.get('h1_tags', [])]
-            
-            # Check if keyword appears in key places
-            if (keyword_lower in title or 
-                keyword_lower in desc or 
-                any(keyword_lower in h1 for h1 in h1_tags)):
-                matching_pages.append(page.get('url', ''))
+        # Check if keyword appears in key places
+        matching_pages = [
+            url for url, fields in page_fields
+            if keyword_re.search(fields)
+        ]
         
         if len(matching_pages) > 1:
             issues.append({
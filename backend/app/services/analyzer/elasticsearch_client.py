@@ -5,14 +5,42 @@ This module provides a client for indexing page content in Elasticsearch
 and performing full-text searches.
 """
 
-from typing import Dict, List, Optional
+import time
+from typing import Dict, Iterator, List, Optional
 
 from elasticsearch import AsyncElasticsearch
 from elasticsearch.exceptions import NotFoundError
+from elasticsearch.helpers import async_bulk
 
 from app.core.config import settings
 
 
+# Documents sent per bulk request
+_BULK_CHUNK_SIZE = 500
+
+
+def _build_document(
+    url_hash: str,
+    url: str,
+    title: str,
+    content: str,
+    meta_description: Optional[str] = None,
+    h1: Optional[str] = None,
+    crawl_job_id: Optional[int] = None,
+) -> Dict:
+    """Build the indexed document for a page."""
+    return {
+        "url": url,
+        "url_hash": url_hash,
+        "title": title,
+        "content": content[:50000],  # Limit content size
+        "meta_description": meta_description,
+        "h1": h1,
+        "crawl_job_id": crawl_job_id,
+        "timestamp": int(time.time() * 1000),
+    }
+
+
 class ElasticsearchClient:
     """
     Async Elasticsearch client for content operations.
@@ -48,13 +76,14 @@ class ElasticsearchClient:
             "mappings": {
                 "properties": {
                     "url": {"type": "keyword"},
-                    "url_hash": {"type": "keyword"},
+                    # Only used as the document _id, never searched
+                    "url_hash": {"type": "keyword", "index": False, "doc_values": False},
                     "title": {"type": "text", "analyzer": "english"},
                     "content": {"type": "text", "analyzer": "english"},
                     "meta_description": {"type": "text"},
                     "h1": {"type": "text"},
                     "crawl_job_id": {"type": "integer"},
-                    "timestamp": {"type": "date"},
+                    "timestamp": {"type": "date", "format": "epoch_millis"},
                 }
             },
             "settings": {
@@ -85,6 +114,9 @@ class ElasticsearchClient:
         """
         Index a page in Elasticsearch.
         
+        Use ``index_pages`` when indexing more than a handful of pages;
+        this sends one request per page.
+        
         Args:
             url_hash: Unique hash of URL.
             url: Page URL.
@@ -100,16 +132,15 @@ class ElasticsearchClient:
         if not self.client:
             await self.connect()
         
-        doc = {
-            "url": url,
-            "url_hash": url_hash,
-            "title": title,
-            "content": content[:50000],  # Limit content size
-            "meta_description": meta_description,
-            "h1": h1,
-            "crawl_job_id": crawl_job_id,
-            "timestamp": "now",
-        }
+        doc = _build_document(
+            url_hash=url_hash,
+            url=url,
+            title=title,
+            content=content,
+            meta_description=meta_description,
+            h1=h1,
+            crawl_job_id=crawl_job_id,
+        )
         
         try:
             await self.client.index(
@@ -121,6 +152,42 @@ class ElasticsearchClient:
         except Exception:
             return False
     
+    async def index_pages(self, pages: List[Dict]) -> int:
+        """
+        Index many pages using the bulk API.
+        
+        Args:
+            pages: Page dicts with the keyword arguments of ``index_page``
+                (``url_hash``, ``url``, ``title``, ``content`` and the
+                optional fields).
+        
+        Returns:
+            int: Number of pages indexed successfully.
+        """
+        if not self.client:
+            await self.connect()
+        
+        def actions() -> Iterator[Dict]:
+            for page in pages:
+                doc = _build_document(**page)
+                yield {
+                    "_index": self.index_name,
+                    "_id": doc["url_hash"],
+                    "_source": doc,
+                }
+        
+        try:
+            indexed, _ = await async_bulk(
+                self.client,
+                actions(),
+                chunk_size=_BULK_CHUNK_SIZE,
+                max_retries=3,
+                raise_on_error=False,
+            )
+            return indexed
+        except Exception:
+            return 0
+    
     async def search(
         self,
         query: str,
@@ -9,11 +9,120 @@ Analyzes images for:
 - Lazy loading suggestions
 """
 
+import asyncio
+import json
+import time
+import weakref
+from collections import OrderedDict
+from hashlib import blake2b
+
 import httpx
+import numpy as np
 from PIL import Image
 from io import BytesIO
 from typing import Dict, List, Optional
 import imagehash
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.services.analyzer._hamming import near_duplicate_groups
+
+
+# Images larger than this are reported without being downloaded or decoded
+_MAX_IMAGE_BYTES = 20 * 1024 * 1024
+
+# Smallest size JPEGs are decoded at for perceptual hashing; phash only
+# looks at a 32x32 grayscale thumbnail
+_PHASH_DRAFT_SIZE = (256, 256)
+
+# Analysis result cache settings; entries older than the TTL are
+# revalidated with the image's ETag before being reused
+_CACHE_KEY_PREFIX = "image_analysis:"
+_RESULT_CACHE_SIZE = 10000
+_RESULT_CACHE_TTL = 3600
+
+# In-memory result cache shared by all analyzers, keyed by image URL
+_RESULTS: "OrderedDict[str, Dict]" = OrderedDict()
+
+# Locks for images being analyzed, so concurrent requests for one URL
+# download it once; each lock goes away with its last waiter
+_LOCKS: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# One download client (and connection pool) per event loop. Pooled
+# connections are bound to the loop that opened them, and Celery tasks run
+# each job in a fresh loop via asyncio.run().
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _new_client() -> httpx.AsyncClient:
+    """
+    Create an HTTP client for image downloads.
+    
+    Returns:
+        httpx.AsyncClient: HTTP/2 client with a pooled set of connections.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+    )
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for image downloads, creating it on first use.
+    
+    Clients are shared within the running event loop only. Outside of an
+    event loop a new, unshared client is returned.
+    
+    Returns:
+        httpx.AsyncClient: HTTP/2 client with a pooled set of connections.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _new_client()
+    
+    client = _CLIENTS.get(loop)
+    if client is None:
+        client = _CLIENTS[loop] = _new_client()
+    return client
+
+
+def _redis_key(image_url: str) -> str:
+    """
+    Build the Redis key for an image's cached analysis.
+    
+    Args:
+        image_url: URL of the image.
+    
+    Returns:
+        str: Prefixed digest of the URL.
+    """
+    return _CACHE_KEY_PREFIX + blake2b(image_url.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _remember(image_url: str, entry: Dict) -> None:
+    """
+    Add an entry to the in-memory result cache, evicting the oldest.
+    
+    Args:
+        image_url: URL of the image.
+        entry: Cache entry with 'stored_at', 'etag' and 'result'.
+    """
+    _RESULTS[image_url] = entry
+    _RESULTS.move_to_end(image_url)
+    if len(_RESULTS) > _RESULT_CACHE_SIZE:
+        _RESULTS.popitem(last=False)
+
+
+async def close_client() -> None:
+    """Close the running event loop's image download client and its pool."""
+    client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
 
 
 class ImageAnalyzer:
@@ -27,9 +136,22 @@ class ImageAnalyzer:
     - Loading optimization
     """
     
-    def __init__(self):
-        """Initialize image analyzer."""
-        self.client = httpx.AsyncClient(timeout=30.0)
+    def __init__(
+        self,
+        cache: Optional[Redis] = None,
+        cache_ttl: int = 7 * 24 * 3600
+    ):
+        """
+        Initialize image analyzer.
+        
+        Args:
+            cache: Optional Redis client used to share analysis results
+                across processes; results are always cached in memory.
+            cache_ttl: Lifetime of Redis cache entries in seconds.
+        """
+        self.client = _get_client()
+        self.cache = cache
+        self.cache_ttl = cache_ttl
     
     async def analyze_image(self, image_url: str) -> Dict:
         """
@@ -41,65 +163,63 @@ class ImageAnalyzer:
         Returns:
             dict: Image analysis with optimization recommendations.
         """
+        # Later callers for the same URL wait, then find the cached result
+        lock = _LOCKS.get(image_url)
+        if lock is None:
+            lock = _LOCKS[image_url] = asyncio.Lock()
+        
+        async with lock:
+            return await self._fetch_and_analyze(image_url)
+    
+    async def _fetch_and_analyze(self, image_url: str) -> Dict:
+        """
+        Analyze an image, reusing or revalidating a cached analysis.
+        
+        Args:
+            image_url: URL of the image to analyze.
+        
+        Returns:
+            dict: Image analysis with optimization recommendations.
+        """
+        cached = await self._cache_lookup(image_url)
+        if cached is not None and time.time() - cached['stored_at'] < _RESULT_CACHE_TTL:
+            return cached['result']
+        
+        headers = {}
+        if cached is not None and cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        
         try:
-            # Download image
-            response = await self.client.get(image_url)
-            
-            if response.status_code != 200:
-                return {
-                    'url': image_url,
-                    'error': f'Failed to download (status {response.status_code})',
-                }
-            
-            # Get file size
-            file_size = len(response.content)
-            
-            # Load image
-            img = Image.open(BytesIO(response.content))
-            
-            # Get image info
-            width, height = img.size
-            format_name = img.format
-            mode = img.mode
-            
-            # Calculate perceived hash for duplicate detection
-            phash = str(imagehash.phash(img))
-            
-            # Analyze compression potential
-            compression_analysis = self._analyze_compression(
-                img, file_size, format_name
-            )
-            
-            # Size recommendations
-            size_recommendations = self._analyze_dimensions(width, height, file_size)
+            # Download image, bailing out on oversized bodies before reading
+            async with self.client.stream('GET', image_url, headers=headers) as response:
+                if response.status_code == 304 and cached is not None:
+                    # Unchanged since it was analyzed
+                    etag = response.headers.get('etag') or cached['etag']
+                    await self._cache_store(image_url, etag, cached['result'])
+                    return cached['result']
+                
+                if response.status_code != 200:
+                    return {
+                        'url': image_url,
+                        'error': f'Failed to download (status {response.status_code})',
+                    }
+                
+                content_length = int(response.headers.get('content-length') or 0)
+                if content_length > _MAX_IMAGE_BYTES:
+                    return self._too_large_result(image_url, content_length)
+                
+                buffer = BytesIO()
+                async for chunk in response.aiter_bytes():
+                    buffer.write(chunk)
+                    if buffer.tell() > _MAX_IMAGE_BYTES:
+                        return self._too_large_result(image_url, buffer.tell())
+                
+                etag = response.headers.get('etag')
             
-            # Format recommendations
-            format_recommendations = self._recommend_format(
-                format_name, width, height, mode
-            )
-            
-            # Calculate optimization score
-            score = self._calculate_image_score(
-                file_size, width, height, format_name
-            )
-            
-            return {
-                'url': image_url,
-                'success': True,
-                'properties': {
-                    'width': width,
-                    'height': height,
-                    'format': format_name,
-                    'mode': mode,
-                    'file_size_bytes': file_size,
-                    'file_size_kb': round(file_size / 1024, 2),
-                    'perceptual_hash': phash,
-                },
-                'compression_analysis': compression_analysis,
-                'size_recommendations': size_recommendations,
-                'format_recommendations': format_recommendations,
-                'score': score,
-            }
+            # Decode and hash off the event loop
+            result = await asyncio.to_thread(self._analyze_bytes, image_url, buffer)
+            await self._cache_store(image_url, etag, result)
+            return result
         
         except Exception as e:
             return {
@@ -108,6 +228,169 @@ class ImageAnalyzer:
                 'error': str(e),
             }
     
+    def _analyze_bytes(self, image_url: str, buffer: BytesIO) -> Dict:
+        """
+        Analyze a downloaded image (CPU-bound; runs in a worker thread).
+        
+        Args:
+            image_url: URL of the image.
+            buffer: Image bytes, positioned at the end.
+        
+        Returns:
+            dict: Image analysis with optimization recommendations.
+        """
+        # Get file size
+        file_size = buffer.tell()
+        buffer.seek(0)
+        
+        # Load image (only the header is read until pixels are needed)
+        img = Image.open(buffer)
+        
+        # Get image info
+        width, height = img.size
+        format_name = img.format
+        mode = img.mode
+        
+        # Analyze compression potential
+        compression_analysis = self._analyze_compression(
+            img, file_size, format_name
+        )
+        
+        # Calculate perceived hash for duplicate detection; JPEGs are
+        # decoded at reduced scale since phash only needs a thumbnail
+        img.draft('L', _PHASH_DRAFT_SIZE)
+        phash = str(imagehash.phash(img))
+        
+        # Size recommendations
+        size_recommendations = self._analyze_dimensions(width, height, file_size)
+        
+        # Format recommendations
+        format_recommendations = self._recommend_format(
+            format_name, width, height, mode
+        )
+        
+        # Calculate optimization score
+        score = self._calculate_image_score(
+            file_size, width, height, format_name
+        )
+        
+        return {
+            'url': image_url,
+            'success': True,
+            'properties': {
+                'width': width,
+                'height': height,
+                'format': format_name,
+                'mode': mode,
+                'file_size_bytes': file_size,
+                'file_size_kb': round(file_size / 1024, 2),
+                'perceptual_hash': phash,
+            },
+            'compression_analysis': compression_analysis,
+            'size_recommendations': size_recommendations,
+            'format_recommendations': format_recommendations,
+            'score': score,
+        }
+    
+    async def analyze_images(
+        self,
+        image_urls: List[str],
+        concurrency: int = 16
+    ) -> List[Dict]:
+        """
+        Analyze many images concurrently.
+        
+        Downloads overlap with each other and with decoding, which runs in
+        worker threads.
+        
+        Args:
+            image_urls: URLs of the images to analyze.
+            concurrency: Maximum number of images in flight at once.
+        
+        Returns:
+            list: Image analyses, in input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def analyze_one(image_url: str) -> Dict:
+            async with semaphore:
+                return await self.analyze_image(image_url)
+        
+        # Each distinct URL is downloaded once
+        unique_urls = list(dict.fromkeys(image_urls))
+        results = await asyncio.gather(*(analyze_one(url) for url in unique_urls))
+        by_url = dict(zip(unique_urls, results))
+        
+        return [by_url[url] for url in image_urls]
+    
+    async def _cache_lookup(self, image_url: str) -> Optional[Dict]:
+        """
+        Look up a cached analysis, checking memory and then Redis.
+        
+        Args:
+            image_url: URL of the image.
+        
+        Returns:
+            dict: Cache entry with 'stored_at', 'etag' and 'result', or None.
+        """
+        entry = _RESULTS.get(image_url)
+        if entry is not None:
+            _RESULTS.move_to_end(image_url)
+            return entry
+        
+        if self.cache is not None:
+            try:
+                raw = await self.cache.get(_redis_key(image_url))
+            except RedisError:
+                # An unavailable cache is a miss, not a failed analysis
+                raw = None
+            if raw is not None:
+                entry = json.loads(raw)
+                _remember(image_url, entry)
+                return entry
+        
+        return None
+    
+    async def _cache_store(self, image_url: str, etag: Optional[str], result: Dict) -> None:
+        """
+        Store an analysis in memory and, if configured, in Redis.
+        
+        Args:
+            image_url: URL of the image.
+            etag: ETag the image was served with, if any.
+            result: Successful image analysis.
+        """
+        entry = {'stored_at': time.time(), 'etag': etag, 'result': result}
+        _remember(image_url, entry)
+        
+        if self.cache is not None:
+            try:
+                await self.cache.setex(_redis_key(image_url), self.cache_ttl, json.dumps(entry))
+            except RedisError:
+                pass
+    
+    def _too_large_result(self, image_url: str, file_size: int) -> Dict:
+        """
+        Build the result for an image too large to analyze.
+        
+        Args:
+            image_url: URL of the image.
+            file_size: File size in bytes (at least the bytes seen so far).
+        
+        Returns:
+            dict: Failed analysis flagged as too large.
+        """
+        return {
+            'url': image_url,
+            'success': False,
+            'too_large': True,
+            'error': f'Image exceeds {_MAX_IMAGE_BYTES // (1024 * 1024)}MB',
+            'properties': {
+                'file_size_bytes': file_size,
+                'file_size_kb': round(file_size / 1024, 2),
+            },
+        }
+    
     def _analyze_compression(
         self,
         img: Image.Image,
@@ -346,10 +629,6 @@ class ImageAnalyzer:
                 (total_images - images_without_alt) / total_images * 100, 2
             ) if total_images > 0 else 100,
         }
-    
-    async def close(self):
-        """Close HTTP client."""
-        await self.client.aclose()
 
 
 async def analyze_image(image_url: str) -> Dict:
@@ -362,18 +641,16 @@ async def analyze_image(image_url: str) -> Dict:
     Returns:
         dict: Image analysis.
     """
-    analyzer = ImageAnalyzer()
-    try:
-        result = await analyzer.analyze_image(image_url)
-        return result
-    finally:
-        await analyzer.close()
+    return await ImageAnalyzer().analyze_image(image_url)
 
 
 def detect_duplicate_images(image_analyses: List[Dict], threshold: int = 5) -> List[Dict]:
     """
     Detect duplicate or very similar images using perceptual hashing.
     
+    Images whose 64-bit perceptual hashes are within ``threshold`` bits of
+    each other are grouped (transitively).
+    
     Args:
         image_analyses: List of image analysis results with perceptual hashes.
         threshold: Maximum hash distance to consider duplicates.
@@ -381,26 +658,26 @@ def detect_duplicate_images(image_analyses: List[Dict], threshold: int = 5) -> L
     Returns:
         list: Groups of duplicate images.
     """
-    from collections import defaultdict
-    
-    # Group by perceptual hash
-    hash_groups = defaultdict(list)
+    urls = []
+    hashes = []
     
     for analysis in image_analyses:
         if analysis.get('success') and 'properties' in analysis:
             phash = analysis['properties'].get('perceptual_hash')
             if phash:
-                hash_groups[phash].append(analysis['url'])
+                urls.append(analysis['url'])
+                hashes.append(phash)
+    
+    fingerprints = np.array([int(phash, 16) for phash in hashes], dtype=np.uint64)
     
-    # Find duplicates
     duplicates = []
-    for phash, urls in hash_groups.items():
-        if len(urls) > 1:
-            duplicates.append({
-                'hash': phash,
-                'count': len(urls),
-                'urls': urls,
-                'type': 'exact_duplicate',
-            })
+    for members in near_duplicate_groups(fingerprints, threshold):
+        group_hashes = {hashes[i] for i in members}
+        duplicates.append({
+            'hash': hashes[members[0]],
+            'count': len(members),
+            'urls': [urls[i] for i in members],
+            'type': 'exact_duplicate' if len(group_hashes) == 1 else 'near_duplicate',
+        })
     
     return duplicates
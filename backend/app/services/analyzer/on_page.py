@@ -5,30 +5,87 @@ This module provides functions for analyzing on-page SEO elements
 like meta tags, headings, images, etc.
 """
 
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple
+
+import numpy as np
 from bs4 import BeautifulSoup
 
 
+# Weights of the title, meta, headings, images, links and content scores
+# in the overall SEO score
+_SCORE_WEIGHTS = (0.25, 0.15, 0.20, 0.15, 0.15, 0.10)
+
+# Grade for each tenth of the 0-100 overall score
+_GRADES_BY_DECILE = ('F', 'F', 'F', 'F', 'F', 'D', 'C', 'B', 'A', 'A+', 'A+')
+
+
+@dataclass(frozen=True, slots=True)
+class _TagAnalysis:
+    """Immutable title or meta description analysis, as held in the caches."""
+    
+    present: bool
+    length: int
+    optimal_length: bool
+    score: int
+    issues: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+    
+    def as_dict(self) -> Dict:
+        """
+        Convert to the dict returned by the public analysis functions.
+        
+        Returns:
+            dict: Analysis results, with fresh issue and warning lists.
+        """
+        return {
+            "present": self.present,
+            "length": self.length,
+            "optimal_length": self.optimal_length,
+            "score": self.score,
+            "issues": list(self.issues),
+            "warnings": list(self.warnings),
+        }
+
+
 def analyze_title_tag(title: str) -> Dict:
     """
     Analyze title tag for SEO best practices.
     
+    Results are memoized per title, since templated and paginated pages
+    often share the same one.
+    
     Args:
         title: Title tag content.
     
     Returns:
         dict: Analysis results with issues and score.
     """
+    return _analyze_title_tag_cached(title).as_dict()
+
+
+@lru_cache(maxsize=8192)
+def _analyze_title_tag_cached(title: str) -> _TagAnalysis:
+    """
+    Analyze title tag (memoized).
+    
+    Args:
+        title: Title tag content.
+    
+    Returns:
+        _TagAnalysis: Analysis results with issues and score.
+    """
     issues = []
     warnings = []
     score = 100
+    length = len(title) if title else 0
     
     if not title:
         issues.append("Missing title tag")
         score = 0
     else:
-        length = len(title)
-        
         if length < 30:
             issues.append(f"Title too short ({length} chars, recommended 50-60)")
             score -= 20
@@ -40,47 +97,61 @@ def analyze_title_tag(title: str) -> Dict:
             score -= 10
         
         # Check for keyword stuffing (repeated words)
-        words = title.lower().split()
-        word_counts = {}
-        for word in words:
-            if len(word) > 3:  # Ignore short words
-                word_counts[word] = word_counts.get(word, 0) + 1
+        word_counts = Counter(
+            word for word in title.lower().split()
+            if len(word) > 3  # Ignore short words
+        )
         
         repeated = [word for word, count in word_counts.items() if count > 2]
         if repeated:
             warnings.append(f"Possible keyword stuffing: {', '.join(repeated)}")
             score -= 10
     
-    return {
-        "present": bool(title),
-        "length": len(title) if title else 0,
-        "optimal_length": 50 <= len(title or "") <= 60,
-        "score": max(0, score),
-        "issues": issues,
-        "warnings": warnings,
-    }
+    return _TagAnalysis(
+        present=bool(title),
+        length=length,
+        optimal_length=50 <= length <= 60,
+        score=max(0, score),
+        issues=tuple(issues),
+        warnings=tuple(warnings),
+    )
 
 
 def analyze_meta_description(description: str) -> Dict:
     """
     Analyze meta description for SEO best practices.
     
+    Results are memoized per description, like ``analyze_title_tag``.
+    
     Args:
         description: Meta description content.
     
     Returns:
         dict: Analysis results.
     """
+    return _analyze_meta_description_cached(description).as_dict()
+
+
+@lru_cache(maxsize=8192)
+def _analyze_meta_description_cached(description: str) -> _TagAnalysis:
+    """
+    Analyze meta description (memoized).
+    
+    Args:
+        description: Meta description content.
+    
+    Returns:
+        _TagAnalysis: Analysis results.
+    """
     issues = []
     warnings = []
     score = 100
+    length = len(description) if description else 0
     
     if not description:
         issues.append("Missing meta description")
         score = 0
     else:
-        length = len(description)
-        
         if length < 120:
             warnings.append(f"Description too short ({length} chars, recommended 150-160)")
             score -= 15
@@ -88,14 +159,14 @@ def analyze_meta_description(description: str) -> Dict:
             warnings.append(f"Description too long ({length} chars, may be truncated)")
             score -= 10
     
-    return {
-        "present": bool(description),
-        "length": len(description) if description else 0,
-        "optimal_length": 120 <= len(description or "") <= 160,
-        "score": max(0, score),
-        "issues": issues,
-        "warnings": warnings,
-    }
+    return _TagAnalysis(
+        present=bool(description),
+        length=length,
+        optimal_length=120 <= length <= 160,
+        score=max(0, score),
+        issues=tuple(issues),
+        warnings=tuple(warnings),
+    )
 
 
 def analyze_headings(h1_tags: List[str], h2_tags: List[str], h3_tags: List[str]) -> Dict:
@@ -259,38 +330,48 @@ def calculate_overall_seo_score(
         tuple: (overall_score, grade)
     """
     # Weighted average
-    weights = {
-        "title": 0.25,
-        "meta": 0.15,
-        "headings": 0.20,
-        "images": 0.15,
-        "links": 0.15,
-        "content": 0.10,
-    }
-    
-    weighted_score = (
-        title_score * weights["title"] +
-        meta_score * weights["meta"] +
-        headings_score * weights["headings"] +
-        images_score * weights["images"] +
-        links_score * weights["links"] +
-        content_score * weights["content"]
+    component_scores = (
+        title_score,
+        meta_score,
+        headings_score,
+        images_score,
+        links_score,
+        content_score,
+    )
+    weighted_score = sum(
+        score * weight for score, weight in zip(component_scores, _SCORE_WEIGHTS)
     )
     
     overall_score = int(weighted_score)
     
     # Assign grade
-    if overall_score >= 90:
-        grade = "A+"
-    elif overall_score >= 80:
-        grade = "A"
-    elif overall_score >= 70:
-        grade = "B"
-    elif overall_score >= 60:
-        grade = "C"
-    elif overall_score >= 50:
-        grade = "D"
-    else:
-        grade = "F"
+    grade = _GRADES_BY_DECILE[min(max(overall_score // 10, 0), 10)]
     
     return overall_score, grade
+
+
+def calculate_overall_seo_scores(component_scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate overall SEO scores and grades for many pages at once.
+    
+    Vectorized equivalent of ``calculate_overall_seo_score``; results match
+    it exactly for every row.
+    
+    Args:
+        component_scores: (N, 6) array of title, meta, headings, images,
+            links and content scores (0-100) per page.
+    
+    Returns:
+        tuple: (overall_scores, grades) arrays of length N.
+    """
+    component_scores = np.asarray(component_scores, dtype=np.float64)
+    
+    # Accumulate column by column, in the same order as the scalar version
+    weighted_scores = np.zeros(len(component_scores))
+    for column, weight in enumerate(_SCORE_WEIGHTS):
+        weighted_scores += component_scores[:, column] * weight
+    
+    overall_scores = weighted_scores.astype(np.int64)
+    grades = np.array(_GRADES_BY_DECILE)[np.clip(overall_scores // 10, 0, 10)]
+    
+    return overall_scores, grades
@@ -8,9 +8,94 @@ This module tracks redirect chains to identify:
 - Redirect optimization opportunities
 """
 
+import asyncio
+import time
+import weakref
+
 import httpx
-from typing import Dict, List, Optional, Tuple
-from collections import deque
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from collections import OrderedDict, deque
+from urllib.parse import urljoin, urlparse
+
+
+# Statuses servers return when they do not support HEAD requests
+_HEAD_UNSUPPORTED = (405, 501)
+
+# Descriptions of the redirect status codes
+_REDIRECT_TYPES = {
+    301: 'Permanent (301)',
+    302: 'Temporary (302)',
+    303: 'See Other (303)',
+    307: 'Temporary (307)',
+    308: 'Permanent (308)',
+}
+
+# Redirect statuses SEO treats as temporary
+_TEMPORARY_REDIRECT_CODES = frozenset({302, 307})
+
+# Analysis cache settings; chains are followed again once older than the TTL
+_RESULT_CACHE_SIZE = 4096
+_RESULT_CACHE_TTL = 900
+
+# Analyses shared by all analyzers, keyed by (url, max_redirects), with
+# the monotonic time they were stored
+_RESULTS: "OrderedDict[Tuple[str, int], Tuple[float, Dict]]" = OrderedDict()
+
+# One redirect-following client (and connection pool) per event loop.
+# Pooled connections are bound to the loop that opened them, and Celery
+# tasks run each job in a fresh loop via asyncio.run().
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _new_client() -> httpx.AsyncClient:
+    """
+    Create an HTTP client for following redirects.
+    
+    Returns:
+        httpx.AsyncClient: HTTP/2 client that does not follow redirects
+            itself, with keep-alive connections pooled across hops.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        follow_redirects=False,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=30.0,
+        ),
+    )
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for following redirects, creating it on first use.
+    
+    Clients are shared within the running event loop only. Outside of an
+    event loop a new, unshared client is returned.
+    
+    Returns:
+        httpx.AsyncClient: HTTP/2 client that does not follow redirects
+            itself, with keep-alive connections pooled across hops.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _new_client()
+    
+    client = _CLIENTS.get(loop)
+    if client is None:
+        client = _CLIENTS[loop] = _new_client()
+    return client
+
+
+async def close_client() -> None:
+    """Close the running event loop's redirect-following client and its pool."""
+    client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
 
 
 class RedirectChainAnalyzer:
@@ -34,12 +119,51 @@ class RedirectChainAnalyzer:
         """
         self.max_redirects = max_redirects
     
-    async def analyze_url(self, url: str) -> Dict:
+    async def analyze_url(
+        self,
+        url: str,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Dict:
         """
         Analyze redirect chain for a URL.
         
+        Results are cached for 15 minutes, so re-audits of the same URLs
+        skip the network.
+        
         Args:
             url: URL to analyze.
+            client: HTTP client to use (must not follow redirects);
+                defaults to the shared pooled client.
+        
+        Returns:
+            dict: Redirect chain analysis.
+        """
+        key = (url, self.max_redirects)
+        
+        entry = _RESULTS.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _RESULT_CACHE_TTL:
+            _RESULTS.move_to_end(key)
+            return entry[1]
+        
+        result = await self._follow_chain(url, client or _get_client())
+        
+        # Requests that failed outright may succeed on retry, so aren't cached
+        chain = result.get('chain')
+        if chain and all('status_code' in hop for hop in chain):
+            _RESULTS[key] = (time.monotonic(), result)
+            _RESULTS.move_to_end(key)
+            if len(_RESULTS) > _RESULT_CACHE_SIZE:
+                _RESULTS.popitem(last=False)
+        
+        return result
+    
+    async def _follow_chain(self, url: str, client: httpx.AsyncClient) -> Dict:
+        """
+        Follow the redirects from a URL and analyze the resulting chain.
+        
+        Args:
+            url: URL to analyze.
+            client: HTTP client that does not follow redirects itself.
         
         Returns:
             dict: Redirect chain analysis.
@@ -48,83 +172,77 @@ class RedirectChainAnalyzer:
         current_url = url
         visited = set()
         
-        async with httpx.AsyncClient(
-            follow_redirects=False,
-            timeout=30.0
-        ) as client:
+        for hop in range(self.max_redirects):
+            if current_url in visited:
+                # Redirect loop detected
+                return {
+                    'url': url,
+                    'has_redirects': True,
+                    'has_loop': True,
+                    'chain_length': len(chain),
+                    'chain': chain,
+                    'final_url': current_url,
+                    'issues': ['Redirect loop detected'],
+                    'severity': 'critical',
+                }
+            
+            visited.add(current_url)
             
-            for hop in range(self.max_redirects):
-                if current_url in visited:
-                    # Redirect loop detected
-                    return {
-                        'url': url,
-                        'has_redirects': True,
-                        'has_loop': True,
-                        'chain_length': len(chain),
-                        'chain': chain,
-                        'final_url': current_url,
-                        'issues': ['Redirect loop detected'],
-                        'severity': 'critical',
-                    }
+            try:
+                # Only the status and Location header are needed
+                response = await client.head(current_url)
                 
-                visited.add(current_url)
+                if response.status_code in _HEAD_UNSUPPORTED:
+                    # Fall back to GET, closing the stream without reading the body
+                    async with client.stream('GET', current_url) as response:
+                        pass
                 
-                try:
-                    response = await client.get(current_url)
-                    
-                    # Record this hop
-                    hop_info = {
-                        'url': current_url,
-                        'status_code': response.status_code,
-                        'hop_number': hop + 1,
-                    }
-                    
-                    # Check if it's a redirect
-                    if 300 <= response.status_code < 400:
-                        location = response.headers.get('location')
-                        
-                        if not location:
-                            hop_info['error'] = 'Redirect without Location header'
-                            chain.append(hop_info)
-                            break
-                        
-                        # Resolve relative URLs
-                        if location.startswith('/'):
-                            from urllib.parse import urlparse, urlunparse
-                            parsed = urlparse(current_url)
-                            location = urlunparse((
-                                parsed.scheme,
-                                parsed.netloc,
-                                location,
-                                '', '', ''
-                            ))
-                        
-                        hop_info['redirect_type'] = self._classify_redirect(
-                            response.status_code
-                        )
-                        hop_info['next_url'] = location
-                        
-                        chain.append(hop_info)
-                        current_url = location
+                # Record this hop
+                hop_info = {
+                    'url': current_url,
+                    'status_code': response.status_code,
+                    'hop_number': hop + 1,
+                }
+                
+                # Check if it's a redirect
+                if 300 <= response.status_code < 400:
+                    location = response.headers.get('location')
                     
-                    else:
-                        # Final destination (non-redirect)
-                        hop_info['is_final'] = True
+                    if not location:
+                        hop_info['error'] = 'Redirect without Location header'
                         chain.append(hop_info)
                         break
+                    
+                    # Resolve relative URLs
+                    location = urljoin(current_url, location)
+                    
+                    hop_info['redirect_type'] = self._classify_redirect(
+                        response.status_code
+                    )
+                    hop_info['next_url'] = location
+                    
+                    chain.append(hop_info)
+                    current_url = location
                 
-                except Exception as e:
-                    chain.append({
-                        'url': current_url,
-                        'error': str(e),
-                        'hop_number': hop + 1,
-                    })
+                else:
+                    # Final destination (non-redirect)
+                    hop_info['is_final'] = True
+                    chain.append(hop_info)
                     break
+            
+            except Exception as e:
+                chain.append({
+                    'url': current_url,
+                    'error': str(e),
+                    'hop_number': hop + 1,
+                })
+                break
         
         # Analyze the chain
         return self._analyze_chain(url, chain)
     
-    def _classify_redirect(self, status_code: int) -> str:
+    @staticmethod
+    def _classify_redirect(status_code: int) -> str:
         """
         Classify redirect type.
         
@@ -134,14 +252,7 @@ class RedirectChainAnalyzer:
         Returns:
             str: Redirect type description.
         """
-        redirect_types = {
-            301: 'Permanent (301)',
-            302: 'Temporary (302)',
-            303: 'See Other (303)',
-            307: 'Temporary (307)',
-            308: 'Permanent (308)',
-        }
-        return redirect_types.get(status_code, f'Unknown ({status_code})')
+        return _REDIRECT_TYPES.get(status_code) or f'Unknown ({status_code})'
     
     def _analyze_chain(self, original_url: str, chain: List[Dict]) -> Dict:
         """
@@ -179,34 +290,39 @@ class RedirectChainAnalyzer:
             warnings.append(f"Redirect chain has {chain_length} hops")
             recommendations.append("Consider direct redirect to final destination")
         
-        # Check redirect types
-        redirect_types = [
-            hop.get('redirect_type')
-            for hop in chain
-            if 'redirect_type' in hop
-        ]
+        # Collect redirect types, protocols and domains in one pass
+        redirect_types = []
+        has_temporary = False
+        has_http = False
+        has_https = False
+        unique_domains = set()
+        
+        for hop in chain:
+            if 'redirect_type' in hop:
+                redirect_types.append(hop['redirect_type'])
+                if hop['status_code'] in _TEMPORARY_REDIRECT_CODES:
+                    has_temporary = True
+            
+            url = hop['url']
+            if url.startswith('http://'):
+                has_http = True
+            elif url.startswith('https://'):
+                has_https = True
+            
+            domain = urlparse(url).netloc
+            if domain:
+                unique_domains.add(domain)
         
-        if 'Temporary (302)' in redirect_types or 'Temporary (307)' in redirect_types:
+        # Check redirect types
+        if has_temporary:
             warnings.append("Contains temporary redirects")
             recommendations.append("Use permanent redirects (301/308) for SEO")
         
         # Check for protocol changes
-        urls_in_chain = [hop['url'] for hop in chain]
-        has_http = any(url.startswith('http://') for url in urls_in_chain)
-        has_https = any(url.startswith('https://') for url in urls_in_chain)
-        
         if has_http and has_https:
             warnings.append("Mixed HTTP/HTTPS in redirect chain")
         
         # Check for domain changes
-        domains = []
-        for url in urls_in_chain:
-            from urllib.parse import urlparse
-            domain = urlparse(url).netloc
-            if domain:
-                domains.append(domain)
-        
-        unique_domains = set(domains)
         if len(unique_domains) > 1:
             warnings.append(f"Redirects across {len(unique_domains)} domains")
         
@@ -234,23 +350,61 @@ class RedirectChainAnalyzer:
             'domains_in_chain': list(unique_domains),
         }
     
-    async def batch_analyze(self, urls: List[str]) -> List[Dict]:
+    async def batch_analyze(
+        self,
+        urls: List[str],
+        concurrency: int = 20
+    ) -> List[Dict]:
         """
-        Analyze redirect chains for multiple URLs.
+        Analyze redirect chains for multiple URLs concurrently.
         
         Args:
             urls: List of URLs to analyze.
+            concurrency: Maximum number of chains followed at once.
         
         Returns:
-            list: Redirect chain analyses.
+            list: Redirect chain analyses, in input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def analyze_one(url: str) -> Dict:
+            async with semaphore:
+                return await self.analyze_url(url)
+        
+        return list(await asyncio.gather(*(analyze_one(url) for url in urls)))
+    
+    async def batch_analyze_stream(
+        self,
+        urls: List[str],
+        concurrency: int = 20
+    ) -> AsyncIterator[Dict]:
         """
-        results = []
+        Analyze redirect chains for multiple URLs, yielding each as it finishes.
         
-        for url in urls:
-            result = await self.analyze_url(url)
-            results.append(result)
+        Lets callers show results while slower chains are still being
+        followed. Chains still in flight are cancelled if the caller stops
+        iterating early.
         
-        return results
+        Args:
+            urls: List of URLs to analyze.
+            concurrency: Maximum number of chains followed at once.
+        
+        Yields:
+            dict: Redirect chain analyses, in completion order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def analyze_one(url: str) -> Dict:
+            async with semaphore:
+                return await self.analyze_url(url)
+        
+        tasks = [asyncio.create_task(analyze_one(url)) for url in urls]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
 
 
 async def analyze_redirect_chain(url: str) -> Dict:
@@ -332,7 +486,8 @@ def generate_redirect_map(analyses: List[Dict]) -> Dict:
         'edges': [],
     }
     
-    node_ids = set()
+    # Nodes keyed by URL, in order of first appearance
+    nodes_by_id = {}
     
     for analysis in analyses:
         if not analysis.get('has_redirects'):
@@ -342,14 +497,13 @@ def generate_redirect_map(analyses: List[Dict]) -> Dict:
         
         for hop in chain:
             url = hop.get('url')
-            if url and url not in node_ids:
-                node_ids.add(url)
-                redirect_map['nodes'].append({
+            if url and url not in nodes_by_id:
+                nodes_by_id[url] = {
                     'id': url,
                     'label': url,
                     'status_code': hop.get('status_code'),
                     'is_final': hop.get('is_final', False),
-                })
+                }
             
             if 'next_url' in hop:
                 redirect_map['edges'].append({
@@ -358,4 +512,6 @@ def generate_redirect_map(analyses: List[Dict]) -> Dict:
                     'type': hop.get('redirect_type'),
                 })
     
+    redirect_map['nodes'] = list(nodes_by_id.values())
+    
     return redirect_map
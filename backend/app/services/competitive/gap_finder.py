@@ -5,6 +5,12 @@ Content gap analysis - find topics competitors rank for but you don't.
 from typing import Dict, List, Set
 
 
+# Common words ignored when extracting topics from titles
+_TITLE_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+})
+
+
 class ContentGapFinder:
     """
     Identify content gaps between your site and competitors.
@@ -66,8 +72,7 @@ class ContentGapFinder:
                 # Simple tokenization
                 words = title.lower().split()
                 # Remove common words
-                stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
-                significant_words = [w for w in words if w not in stop_words and len(w) > 3]
+                significant_words = [w for w in words if w not in _TITLE_STOP_WORDS and len(w) > 3]
                 topics.update(significant_words)
             
             # Extract from H1
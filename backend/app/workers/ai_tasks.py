@@ -4,8 +4,6 @@ Celery tasks for AI-powered analysis.
 
 from celery import Task
 from app.workers.celery_app import celery_app
-from app.services.ai.content_scorer import ContentQualityScorer
-from app.services.ai.alt_text_generator import AltTextGenerator
 from app.core.config import settings
 
 
@@ -21,6 +19,7 @@ def score_content_quality_task(self: Task, page_id: int, api_key: str = None):
     import asyncio
     from app.db.session import AsyncSessionLocal
     from app.models.page import Page
+    from app.services.ai.content_scorer import ContentQualityScorer, close_all_clients
     from sqlalchemy import select
     
     async def _score():
@@ -54,7 +53,14 @@ def score_content_quality_task(self: Task, page_id: int, api_key: str = None):
             
             return result
     
-    return asyncio.run(_score())
+    async def _score_and_close():
+        # The shared OpenAI clients are bound to this task's event loop
+        try:
+            return await _score()
+        finally:
+            await close_all_clients()
+    
+    return asyncio.run(_score_and_close())
 
 
 @celery_app.task(bind=True, name="ai.generate_alt_texts")
@@ -67,6 +73,7 @@ def generate_alt_texts_task(self: Task, project_id: int, api_key: str = None):
         api_key: OpenAI API key (optional).
     """
     import asyncio
+    from app.services.ai import AltTextGenerator
     
     async def _generate():
         # In production, this would:
@@ -105,15 +112,20 @@ def generate_content_brief_task(
         api_key: OpenAI API key (optional).
     """
     import asyncio
+    from app.services.ai.content_scorer import ContentQualityScorer, close_all_clients
     
     async def _generate():
         scorer = ContentQualityScorer(api_key=api_key or settings.OPENAI_API_KEY)
         
-        brief = await scorer.generate_content_brief(
-            topic=topic,
-            target_keyword=target_keyword,
-            competitors=competitors
-        )
+        try:
+            brief = await scorer.generate_content_brief(
+                topic=topic,
+                target_keyword=target_keyword,
+                competitors=competitors
+            )
+        finally:
+            # The shared OpenAI clients are bound to this task's event loop
+            await close_all_clients()
         
         return brief
     
@@ -6,13 +6,15 @@ These tasks handle asynchronous crawling operations.
 
 import asyncio
 from datetime import datetime
-from typing import Any
+from typing import Any, Dict, List
 
 from celery import Task
-from sqlalchemy import select
+from sqlalchemy import SmallInteger, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import async_session_maker
 from app.models.crawl_job import CrawlJob, CrawlStatus
+from app.models.page import Page
 from app.models.project import Project
 from app.workers.celery_app import celery_app
 
@@ -96,6 +98,7 @@ async def _run_crawl(task: Task, crawl_job_id: int) -> dict:
             # from app.services.crawler.spider import WebCrawler
             # crawler = WebCrawler(project)
             # results = await crawler.crawl()
+            # await _store_pages(db, crawl_job, results["pages"])
             
             # Simulate crawl for now
             await asyncio.sleep(5)
@@ -124,6 +127,81 @@ async def _run_crawl(task: Task, crawl_job_id: int) -> dict:
             raise
 
 
+# Columns the crawler output may populate; anything else (links, errors,
+# JS metadata) is crawl-time bookkeeping and is not persisted. Generated
+# columns are computed by the database and cannot be inserted.
+_PAGE_COLUMNS = frozenset(
+    column.key
+    for column in Page.__table__.columns
+    if column.computed is None and column.key not in ("id", "crawl_job_id", "created_at")
+)
+
+# SMALLINT counters on ``pages``; values are clamped rather than failing the
+# whole batch on a pathological page
+_SMALLINT_COLUMNS = frozenset(
+    column.key for column in Page.__table__.columns if isinstance(column.type, SmallInteger)
+)
+_SMALLINT_MAX = 32767
+
+
+async def _store_pages(db: AsyncSession, crawl_job: CrawlJob, pages_data: List[Dict]) -> int:
+    """
+    Persist a crawl's pages with a single Core-style bulk INSERT.
+    
+    Building one ORM ``Page`` per row costs identity-map and attribute
+    history bookkeeping that is never used, since pages are write-once.
+    The per-crawl error counts and mean response time are accumulated in
+    the same pass and stored on the crawl job, in the same transaction.
+    
+    Args:
+        db: Database session.
+        crawl_job: The owning crawl job.
+        pages_data: All page dictionaries returned by ``WebCrawler.crawl``.
+    
+    Returns:
+        int: Number of pages inserted.
+    """
+    rows = []
+    errors_4xx = 0
+    errors_5xx = 0
+    response_time_total = 0
+    response_time_count = 0
+    
+    for page in pages_data:
+        row = {key: value for key, value in page.items() if key in _PAGE_COLUMNS}
+        row["crawl_job_id"] = crawl_job.id
+        
+        for key in _SMALLINT_COLUMNS.intersection(row):
+            if row[key] is not None and row[key] > _SMALLINT_MAX:
+                row[key] = _SMALLINT_MAX
+        
+        # Pages that failed before a response (e.g. timeouts) are stored with
+        # status 0, as the crawler reports them; the column is NOT NULL
+        status_code = row["status_code"] = row.get("status_code") or 0
+        if 400 <= status_code < 500:
+            errors_4xx += 1
+        elif status_code >= 500:
+            errors_5xx += 1
+        
+        response_time = row.get("response_time_ms")
+        if response_time is not None:
+            response_time_total += response_time
+            response_time_count += 1
+        
+        rows.append(row)
+    
+    if rows:
+        await db.execute(insert(Page), rows)
+    
+    crawl_job.errors_4xx = errors_4xx
+    crawl_job.errors_5xx = errors_5xx
+    crawl_job.avg_response_time_ms = (
+        response_time_total / response_time_count if response_time_count else None
+    )
+    
+    return len(rows)
+
+
 @celery_app.task(name="app.workers.crawl_tasks.cleanup_old_results")
 def cleanup_old_results() -> dict:
     """
@@ -2,8 +2,13 @@
 Tests for accessibility auditing.
 """
 
+import asyncio
+
 import pytest
-from app.services.analyzer.accessibility import generate_accessibility_report
+from app.services.analyzer.accessibility import (
+    AccessibilityAuditor,
+    generate_accessibility_report
+)
 
 
 def test_generate_accessibility_report():
@@ -56,3 +61,74 @@ def test_generate_accessibility_report():
     assert report['summary']['total_violations'] == 6
     assert report['summary']['total_critical'] == 1
     assert report['summary']['average_score'] == 90.0
+
+
+class _FakePage:
+    """Playwright page stand-in returning an empty AXE result."""
+    
+    async def goto(self, url, **kwargs):
+        await asyncio.sleep(0.01)
+    
+    async def evaluate(self, script, options):
+        return {'violations': [], 'passCount': 10}
+    
+    async def close(self):
+        pass
+
+
+class _FakeContext:
+    """Playwright browser context stand-in."""
+    
+    async def add_init_script(self, script):
+        pass
+    
+    async def new_page(self):
+        return _FakePage()
+    
+    async def close(self):
+        pass
+
+
+class _FakeBrowser:
+    """Playwright browser stand-in counting the contexts it opens."""
+    
+    def __init__(self):
+        self.contexts = 0
+    
+    async def new_context(self):
+        self.contexts += 1
+        return _FakeContext()
+
+
+def _fake_auditor(concurrency):
+    """Build an auditor wired to a fake browser instead of Playwright."""
+    auditor = AccessibilityAuditor(concurrency=concurrency)
+    auditor.browser = _FakeBrowser()
+    auditor._axe_js = ''
+    auditor._idle_contexts = asyncio.Queue()
+    return auditor
+
+
+@pytest.mark.asyncio
+async def test_single_audit_opens_one_context():
+    """Auditing one page opens one context, not the whole pool."""
+    auditor = _fake_auditor(concurrency=5)
+    
+    result = await auditor.audit_url('https://example.com/')
+    await auditor.audit_url('https://example.com/about')
+    
+    assert result['success']
+    assert result['score'] == 100.0
+    assert auditor.browser.contexts == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_audit_opens_at_most_concurrency_contexts():
+    """Concurrent audits open contexts up to the limit, then share them."""
+    auditor = _fake_auditor(concurrency=3)
+    urls = [f'https://example.com/{i}' for i in range(10)]
+    
+    results = await auditor.batch_audit(urls)
+    
+    assert [result['url'] for result in results] == urls
+    assert auditor.browser.contexts == 3
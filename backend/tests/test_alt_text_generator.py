@@ -0,0 +1,74 @@
+"""
+Tests for AI alt text generation.
+"""
+
+import json
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from app.services.ai.alt_text_generator import AltTextGenerator
+
+
+def _generator(content, finish_reason='stop', requests=None):
+    """Build a generator whose client answers every request with ``content``."""
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(json.loads(request.content))
+        return httpx.Response(200, json={
+            'id': 'chatcmpl-test',
+            'object': 'chat.completion',
+            'created': 0,
+            'model': 'gpt-4o',
+            'choices': [{
+                'index': 0,
+                'finish_reason': finish_reason,
+                'message': {'role': 'assistant', 'content': content},
+            }],
+        })
+    
+    generator = AltTextGenerator(api_key='test-key')
+    generator.client = AsyncOpenAI(
+        api_key='test-key',
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return generator
+
+
+@pytest.mark.asyncio
+async def test_analyze_alt_text_parses_json_reply():
+    """A JSON reply is parsed into the score, issues and improved text."""
+    requests = []
+    reply = json.dumps({
+        'score': 45,
+        'issues': ['Too generic'],
+        'improved': ' Red running shoes on a wooden floor ',
+    })
+    generator = _generator(reply, requests=requests)
+    
+    result = await generator.analyze_and_improve_alt_text(
+        current_alt='shoes', image_url='https://example.com/shoes.jpg'
+    )
+    
+    assert result['success'], result
+    assert result['score'] == 45
+    assert result['issues'] == ['Too generic']
+    assert result['improved_alt'] == 'Red running shoes on a wooden floor'
+    assert requests[0]['model'] == 'gpt-4o'
+    assert requests[0]['response_format'] == {'type': 'json_object'}
+
+
+@pytest.mark.asyncio
+async def test_analyze_alt_text_cut_off_reply():
+    """A reply truncated at the token limit is reported as a failure."""
+    generator = _generator('{"score": 45, "issues": ["Too gen', finish_reason='length')
+    
+    result = await generator.analyze_and_improve_alt_text(
+        current_alt='shoes', image_url='https://example.com/shoes.jpg'
+    )
+    
+    assert result['success'] is False
+    assert 'cut off' in result['error']
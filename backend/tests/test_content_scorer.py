@@ -0,0 +1,189 @@
+"""
+Tests for AI content quality scoring.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.services.ai.content_scorer import ContentQualityScorer, _EmbeddingIndex
+
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive chat completions endpoint."""
+    
+    protocol_version = "HTTP/1.1"
+    requests = 0
+    embedding_requests = 0
+    delay = 0.0
+    
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path.endswith("/embeddings"):
+            # The embeddings endpoint is always overloaded
+            type(self).embedding_requests += 1
+            body = b'{"error": {"message": "overloaded", "type": "server_error"}}'
+            self.send_response(503)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        
+        type(self).requests += 1
+        time.sleep(self.delay)
+        body = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "OVERALL SCORE: 82/100"},
+            }],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def openai_server(monkeypatch):
+    """Serve fake completions locally and point the OpenAI client at them."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_port}/v1")
+    yield
+    server.shutdown()
+    server.server_close()
+
+
+def test_scoring_in_consecutive_event_loops(openai_server):
+    """Pooled clients must not leak between asyncio.run calls (as in Celery tasks)."""
+    
+    async def score(content: str) -> dict:
+        scorer = ContentQualityScorer(api_key="test-key", max_attempts=1)
+        return await scorer.score_content(content=content, url="https://example.com")
+    
+    first = asyncio.run(score("First page about SEO"))
+    second = asyncio.run(score("Second page about SEO"))
+    
+    assert first["success"], first
+    assert second["success"], second
+    assert second["overall_score"] == 82
+
+
+class _UnavailableRedis:
+    """Redis stand-in whose every call fails."""
+    
+    async def get(self, key):
+        raise RedisConnectionError("connection refused")
+    
+    async def setex(self, key, ttl, value):
+        raise RedisConnectionError("connection refused")
+
+
+@pytest.mark.asyncio
+async def test_results_shared_between_scorers(openai_server):
+    """A result scored by one scorer is reused by the next without a request."""
+    content = "Shared cache page about SEO"
+    
+    first = await ContentQualityScorer(api_key="test-key", max_attempts=1).score_content(
+        content=content, url="https://example.com/shared"
+    )
+    requests = _CompletionHandler.requests
+    second = await ContentQualityScorer(api_key="test-key", max_attempts=1).score_content(
+        content=content, url="https://example.com/shared"
+    )
+    
+    assert first["success"], first
+    assert second == first
+    assert _CompletionHandler.requests == requests
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_cache_misses(openai_server):
+    """An unreachable Redis must not fail the score."""
+    scorer = ContentQualityScorer(
+        api_key="test-key", max_attempts=1, cache=_UnavailableRedis()
+    )
+    
+    result = await scorer.score_content(
+        content="Page scored while Redis is down", url="https://example.com/redis"
+    )
+    
+    assert result["success"], result
+    assert result["overall_score"] == 82
+
+
+def test_embedding_index_grows_and_evicts_oldest():
+    """The semantic index grows past its first allocation, then wraps."""
+    index = _EmbeddingIndex(capacity=100)
+    vectors = np.eye(128, dtype=np.float32)
+    
+    for i in range(100):
+        index.add(f"key-{i}", vectors[i])
+    
+    assert index.nearest(vectors[0]) == ("key-0", 1.0)
+    assert index.nearest(vectors[99]) == ("key-99", 1.0)
+    
+    index.add("key-100", vectors[100])
+    
+    assert index.nearest(vectors[0])[1] == 0.0
+    assert index.nearest(vectors[100]) == ("key-100", 1.0)
+    assert index.nearest(vectors[1]) == ("key-1", 1.0)
+
+
+@pytest.mark.asyncio
+async def test_embedding_errors_are_cache_misses(openai_server):
+    """A failing semantic tier is retried, then skipped rather than failing the score."""
+    embedding_requests = _CompletionHandler.embedding_requests
+    scorer = ContentQualityScorer(
+        api_key="test-key", max_attempts=2, semantic_cache=True
+    )
+    
+    result = await scorer.score_content(
+        content="Page scored while embeddings are down", url="https://example.com/embed"
+    )
+    
+    assert result["success"], result
+    assert result["overall_score"] == 82
+    assert _CompletionHandler.embedding_requests == embedding_requests + 2
+
+
+@pytest.mark.asyncio
+async def test_analyze_content_fans_out(openai_server, monkeypatch):
+    """Score, comparison and brief are requested concurrently."""
+    monkeypatch.setattr(_CompletionHandler, "delay", 0.5)
+    requests = _CompletionHandler.requests
+    scorer = ContentQualityScorer(api_key="test-key", max_attempts=1)
+    
+    started = time.monotonic()
+    result = await scorer.analyze_content(
+        content="Dashboard page about SEO",
+        url="https://example.com/dashboard",
+        topic="SEO dashboards",
+        target_keyword="seo dashboard",
+        competitor_contents=[{"url": "https://competitor.com", "content": "Their page"}],
+    )
+    elapsed = time.monotonic() - started
+    
+    assert result["score"]["overall_score"] == 82
+    assert result["comparison"]["success"], result["comparison"]
+    assert result["brief"]["success"], result["brief"]
+    assert _CompletionHandler.requests == requests + 3
+    assert elapsed < 1.2  # Three sequential requests would take 1.5s
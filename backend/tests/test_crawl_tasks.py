@@ -0,0 +1,74 @@
+"""
+Tests for crawl task persistence.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.workers.crawl_tasks import _store_pages
+
+
+class _RecordingSession:
+    """AsyncSession stand-in recording executed statements."""
+    
+    def __init__(self):
+        self.executed = []
+    
+    async def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+
+
+@pytest.mark.asyncio
+async def test_store_pages_bulk_insert():
+    """Pages are inserted in one statement with per-crawl stats on the job."""
+    db = _RecordingSession()
+    crawl_job = SimpleNamespace(id=7)
+    pages = [
+        {
+            'url': 'https://example.com/',
+            'status_code': 200,
+            'response_time_ms': 100,
+            'internal_links_count': 40000,
+            'links': ['https://example.com/about'],  # Not a column
+        },
+        {'url': 'https://example.com/missing', 'status_code': 404, 'response_time_ms': 50},
+        {'url': 'https://example.com/error', 'status_code': 503},
+        {'url': 'https://example.com/timeout', 'status_code': None, 'images_count': None},
+    ]
+    
+    stored = await _store_pages(db, crawl_job, pages)
+    
+    assert stored == 4
+    assert len(db.executed) == 1
+    
+    statement, rows = db.executed[0]
+    assert statement.table.name == 'pages'
+    assert rows[0] == {
+        'url': 'https://example.com/',
+        'status_code': 200,
+        'response_time_ms': 100,
+        'internal_links_count': 32767,  # Clamped to SMALLINT
+        'crawl_job_id': 7,
+    }
+    assert rows[3]['status_code'] == 0  # NOT NULL column
+    assert rows[3]['images_count'] is None
+    assert all(row['crawl_job_id'] == 7 for row in rows)
+    
+    assert crawl_job.errors_4xx == 1
+    assert crawl_job.errors_5xx == 1
+    assert crawl_job.avg_response_time_ms == 75
+
+
+@pytest.mark.asyncio
+async def test_store_pages_empty_crawl():
+    """An empty crawl inserts nothing and has no mean response time."""
+    db = _RecordingSession()
+    crawl_job = SimpleNamespace(id=7)
+    
+    assert await _store_pages(db, crawl_job, []) == 0
+    
+    assert db.executed == []
+    assert crawl_job.errors_4xx == 0
+    assert crawl_job.errors_5xx == 0
+    assert crawl_job.avg_response_time_ms is None
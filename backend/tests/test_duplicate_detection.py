@@ -2,7 +2,11 @@
 Tests for duplicate content detection.
 """
 
+import random
+
+import numpy as np
 import pytest
+from app.services.analyzer import _hamming
 from app.services.analyzer.duplicate_detector import (
     DuplicateContentDetector,
     detect_duplicates,
@@ -74,3 +78,127 @@ def test_cannibalization_detection():
     assert len(issues) > 0
     assert issues[0]['keyword'] == 'seo tools'
     assert issues[0]['page_count'] == 2
+
+
+def _page(url, title='', meta_description='', h1_tags=()):
+    """Build a minimal page dictionary for cannibalization checks."""
+    return {
+        'url': url,
+        'title': title,
+        'meta_description': meta_description,
+        'h1_tags': list(h1_tags),
+    }
+
+
+def test_cannibalization_ignores_substring_matches():
+    """Keywords only match whole words, not parts of longer words."""
+    pages = [
+        _page('https://example.com/a', title='Season tickets'),
+        _page('https://example.com/b', title='Off-season deals'),
+        _page('https://example.com/c', title='ASP.NET hosting'),
+        _page('https://example.com/d', h1_tags=['Learn ASP.NET']),
+    ]
+    
+    assert find_cannibalization_issues(pages, ['seo', '.net']) == []
+    
+    issues = find_cannibalization_issues(pages, ['asp.net'])
+    
+    assert len(issues) == 1
+    assert issues[0]['urls'] == ['https://example.com/c', 'https://example.com/d']
+
+
+def test_cannibalization_punctuation_keywords():
+    """Keywords containing regex metacharacters match literally."""
+    pages = [
+        _page('https://example.com/a', title='C++ tutorial'),
+        _page('https://example.com/b', meta_description='Modern C++ in depth'),
+        _page('https://example.com/c', title='C tutorial'),
+        _page('https://example.com/d', title='Cxx build flags'),
+    ]
+    
+    issues = find_cannibalization_issues(pages, ['c++'])
+    
+    assert len(issues) == 1
+    assert issues[0]['page_count'] == 2
+    assert issues[0]['urls'] == ['https://example.com/a', 'https://example.com/b']
+
+
+def test_cannibalization_does_not_span_fields():
+    """Fields are searched separately; a keyword cannot straddle two of them."""
+    pages = [
+        _page('https://example.com/a', title='Guide to SEO', meta_description='Tools for beginners'),
+        _page('https://example.com/b', title='All about SEO', h1_tags=['Tools we use']),
+    ]
+    
+    assert find_cannibalization_issues(pages, ['seo tools']) == []
+    
+    issues = find_cannibalization_issues(pages, ['seo', 'tools'])
+    
+    assert [issue['keyword'] for issue in issues] == ['seo', 'tools']
+    assert all(issue['page_count'] == 2 for issue in issues)
+
+
+def _brute_force_groups(fingerprints, threshold):
+    """Connected components of the near-duplicate graph, pair by pair."""
+    parent = list(range(len(fingerprints)))
+    
+    def find(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+    
+    for i in range(len(fingerprints)):
+        for j in range(i + 1, len(fingerprints)):
+            if (fingerprints[i] ^ fingerprints[j]).bit_count() <= threshold:
+                parent[find(j)] = find(i)
+    
+    components = {}
+    for i in range(len(fingerprints)):
+        components.setdefault(find(i), []).append(i)
+    return sorted(c for c in components.values() if len(c) > 1)
+
+
+@pytest.mark.parametrize('threshold', range(13))
+def test_near_duplicate_groups_match_brute_force(threshold, monkeypatch):
+    """Banded and dense grouping agree with an all-pairs reference."""
+    # Small blocks so the dense path crosses block boundaries
+    monkeypatch.setattr(_hamming, '_BLOCK_ROWS', 7)
+    rng = random.Random(threshold)
+    
+    for _ in range(20):
+        # Clusters of fingerprints a few bit flips from a shared base
+        fingerprints = []
+        for _ in range(rng.randint(0, 8)):
+            base = rng.getrandbits(64)
+            for _ in range(rng.randint(1, 6)):
+                fingerprint = base
+                for bit in rng.sample(range(64), rng.randint(0, 2 * threshold + 2)):
+                    fingerprint ^= 1 << bit
+                fingerprints.append(fingerprint)
+        rng.shuffle(fingerprints)
+        
+        groups = _hamming.near_duplicate_groups(
+            np.array(fingerprints, dtype=np.uint64), threshold
+        )
+        
+        assert groups == _brute_force_groups(fingerprints, threshold)
+
+
+def test_short_pages_group_only_on_identical_text():
+    """Pages too short for a stable SimHash need identical text to group."""
+    detector = DuplicateContentDetector(similarity_threshold=12)
+    detector.build_index([
+        {'url': 'https://example.com/a', 'title': 'Buy red shoes online'},
+        {'url': 'https://example.com/b', 'title': 'Buy red shoes online now'},
+        {'url': 'https://example.com/c', 'title': 'Buy  Red Shoes Online'},
+    ])
+    
+    fingerprints = detector.page_hashes
+    distance = (fingerprints['https://example.com/a'] ^ fingerprints['https://example.com/b']).bit_count()
+    assert distance <= 12  # Close enough that SimHash alone would group them
+    
+    groups = detector.find_duplicates()
+    
+    assert [group['urls'] for group in groups] == [
+        ['https://example.com/a', 'https://example.com/c'],
+    ]
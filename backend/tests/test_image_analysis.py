@@ -2,7 +2,15 @@
 Tests for image analysis.
 """
 
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+import httpx
 import pytest
+from PIL import Image
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 
 def test_image_score_calculation():
@@ -50,3 +58,167 @@ def test_format_recommendations():
     
     assert 'WebP' in rec['recommended_format']
     assert len(rec['recommendations']) > 0
+
+
+def _hashed_image(url, phash):
+    """Build a minimal successful analysis carrying a perceptual hash."""
+    return {'success': True, 'url': url, 'properties': {'perceptual_hash': phash}}
+
+
+def test_duplicate_images_within_threshold():
+    """Hashes a few bits apart are grouped as near duplicates."""
+    from app.services.analyzer.image_analyzer import detect_duplicate_images
+    
+    analyses = [
+        _hashed_image('https://example.com/a.jpg', 'ffff0000ffff0000'),
+        _hashed_image('https://example.com/b.jpg', 'ffff0000ffff001f'),  # 5 bits off
+        {'success': False, 'url': 'https://example.com/broken.jpg'},
+    ]
+    
+    groups = detect_duplicate_images(analyses, threshold=5)
+    
+    assert groups == [{
+        'hash': 'ffff0000ffff0000',
+        'count': 2,
+        'urls': ['https://example.com/a.jpg', 'https://example.com/b.jpg'],
+        'type': 'near_duplicate',
+    }]
+
+
+def test_duplicate_images_over_threshold():
+    """Hashes further apart than the threshold stay separate."""
+    from app.services.analyzer.image_analyzer import detect_duplicate_images
+    
+    analyses = [
+        _hashed_image('https://example.com/a.jpg', 'ffff0000ffff0000'),
+        _hashed_image('https://example.com/b.jpg', 'ffff0000ffff003f'),  # 6 bits off
+    ]
+    
+    assert detect_duplicate_images(analyses, threshold=5) == []
+    assert len(detect_duplicate_images(analyses, threshold=6)) == 1
+
+
+def test_duplicate_images_exact_and_near_labels():
+    """Groups of identical hashes are exact; mixed groups are near duplicates."""
+    from app.services.analyzer.image_analyzer import detect_duplicate_images
+    
+    analyses = [
+        _hashed_image('https://example.com/logo.png', '0123456789abcdef'),
+        _hashed_image('https://example.com/hero.jpg', 'f0f0f0f0f0f0f0f0'),
+        _hashed_image('https://example.com/logo-copy.png', '0123456789abcdef'),
+        _hashed_image('https://example.com/hero-small.jpg', 'f0f0f0f0f0f0f0f1'),
+    ]
+    
+    groups = detect_duplicate_images(analyses, threshold=5)
+    
+    assert [(group['type'], group['urls']) for group in groups] == [
+        ('exact_duplicate', ['https://example.com/logo.png', 'https://example.com/logo-copy.png']),
+        ('near_duplicate', ['https://example.com/hero.jpg', 'https://example.com/hero-small.jpg']),
+    ]
+
+
+def _png_client(requests):
+    """Build a client serving one small PNG and counting the downloads."""
+    buffer = BytesIO()
+    Image.new('RGB', (64, 48), 'red').save(buffer, 'PNG')
+    
+    def handler(request):
+        requests.append(str(request.url))
+        return httpx.Response(200, content=buffer.getvalue())
+    
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class _UnavailableRedis:
+    """Redis stand-in whose every call fails."""
+    
+    async def get(self, key):
+        raise RedisConnectionError("connection refused")
+    
+    async def setex(self, key, ttl, value):
+        raise RedisConnectionError("connection refused")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_download_once():
+    """Concurrent analyses of one URL share a single download."""
+    from app.services.analyzer import image_analyzer
+    
+    image_analyzer._RESULTS.clear()
+    requests = []
+    analyzer = image_analyzer.ImageAnalyzer()
+    
+    async with _png_client(requests) as client:
+        analyzer.client = client
+        first, second = await asyncio.gather(
+            analyzer.analyze_image('https://example.com/shared.png'),
+            analyzer.analyze_image('https://example.com/shared.png'),
+        )
+    
+    assert first['success'], first
+    assert second == first
+    assert requests == ['https://example.com/shared.png']
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_cache_misses():
+    """An unreachable Redis must not fail the analysis."""
+    from app.services.analyzer import image_analyzer
+    
+    image_analyzer._RESULTS.clear()
+    requests = []
+    analyzer = image_analyzer.ImageAnalyzer(cache=_UnavailableRedis())
+    
+    async with _png_client(requests) as client:
+        analyzer.client = client
+        result = await analyzer.analyze_image('https://example.com/redis.png')
+    
+    assert result['success'], result
+    assert result['properties']['width'] == 64
+
+
+class _PngHandler(BaseHTTPRequestHandler):
+    """Keep-alive server returning the same small PNG for every path."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self) -> None:
+        buffer = BytesIO()
+        Image.new('RGB', (32, 32), 'blue').save(buffer, 'PNG')
+        body = buffer.getvalue()
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_analysis_in_consecutive_event_loops():
+    """Pooled downloads must not leak between asyncio.run calls (as in Celery tasks)."""
+    from app.services.analyzer.image_analyzer import ImageAnalyzer, close_client
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PngHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    
+    async def analyze(path: str, close: bool) -> dict:
+        try:
+            return await ImageAnalyzer().analyze_image(base_url + path)
+        finally:
+            if close:
+                await close_client()
+    
+    try:
+        # The first caller leaves its pooled connection open
+        first = asyncio.run(analyze("/loop-first.png", close=False))
+        second = asyncio.run(analyze("/loop-second.png", close=True))
+    finally:
+        server.shutdown()
+        server.server_close()
+    
+    assert first['success'], first
+    assert second['success'], second
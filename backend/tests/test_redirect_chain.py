@@ -0,0 +1,131 @@
+"""
+Tests for redirect chain analysis.
+"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from app.services.analyzer import redirect_chain
+from app.services.analyzer.redirect_chain import RedirectChainAnalyzer
+
+
+@pytest.fixture(autouse=True)
+def clear_results():
+    """Keep cached analyses from leaking between tests."""
+    redirect_chain._RESULTS.clear()
+    yield
+    redirect_chain._RESULTS.clear()
+
+
+def _mock_client(routes, requests=None):
+    """Build a client answering from a {url: (status, location)} table; other URLs get 200."""
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append((request.method, str(request.url)))
+        status, location = routes.get(str(request.url), (200, None))
+        headers = {'location': location} if location else {}
+        return httpx.Response(status, headers=headers)
+    
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('start, location, resolved', [
+    # Protocol-relative: keeps the current scheme
+    ('http://example.com/', '//cdn.example.net/home', 'http://cdn.example.net/home'),
+    # Relative paths resolve against the current directory
+    ('https://example.com/blog/post', 'other-post', 'https://example.com/blog/other-post'),
+    ('https://example.com/blog/post', '../about', 'https://example.com/about'),
+    # Query-only keeps the current path
+    ('https://example.com/search?q=seo', '?q=seo&page=2', 'https://example.com/search?q=seo&page=2'),
+])
+async def test_relative_locations_are_resolved(start, location, resolved):
+    """Location headers are resolved against the URL that returned them."""
+    requests = []
+    
+    async with _mock_client({start: (301, location)}, requests) as client:
+        result = await RedirectChainAnalyzer().analyze_url(start, client=client)
+    
+    assert result['chain'][0]['next_url'] == resolved
+    assert result['final_url'] == resolved
+    assert result['final_status'] == 200
+    assert requests == [('HEAD', start), ('HEAD', resolved)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('head_status', [405, 501])
+async def test_head_unsupported_falls_back_to_get(head_status):
+    """Servers rejecting HEAD are asked again with GET."""
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, str(request.url)))
+        if request.url.host == 'nohead.example.com':
+            if request.method == 'HEAD':
+                return httpx.Response(head_status)
+            return httpx.Response(301, headers={'location': 'https://example.com/'})
+        return httpx.Response(200)
+    
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        result = await RedirectChainAnalyzer().analyze_url(
+            'https://nohead.example.com/', client=client
+        )
+    
+    assert requests == [
+        ('HEAD', 'https://nohead.example.com/'),
+        ('GET', 'https://nohead.example.com/'),
+        ('HEAD', 'https://example.com/'),
+    ]
+    assert [hop['status_code'] for hop in result['chain']] == [301, 200]
+    assert result['chain'][0]['redirect_type'] == 'Permanent (301)'
+    assert result['final_url'] == 'https://example.com/'
+
+
+class _RedirectHandler(BaseHTTPRequestHandler):
+    """Keep-alive server redirecting /old/* to /new/*."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_HEAD(self) -> None:
+        if self.path.startswith('/old/'):
+            self.send_response(301)
+            self.send_header('Location', '/new/' + self.path[len('/old/'):])
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+    
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_analysis_in_consecutive_event_loops():
+    """Pooled connections must not leak between asyncio.run calls (as in Celery tasks)."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _RedirectHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+    
+    async def analyze(path: str, close: bool) -> dict:
+        try:
+            return await RedirectChainAnalyzer().analyze_url(base_url + path)
+        finally:
+            if close:
+                await redirect_chain.close_client()
+    
+    try:
+        # The first caller leaves its pooled connection open
+        first = asyncio.run(analyze('/old/first', close=False))
+        second = asyncio.run(analyze('/old/second', close=True))
+    finally:
+        server.shutdown()
+        server.server_close()
+    
+    assert first['final_url'] == base_url + '/new/first'
+    assert second['final_url'] == base_url + '/new/second'
+    assert second['final_status'] == 200
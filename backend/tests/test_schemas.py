@@ -0,0 +1,50 @@
+"""
+Tests for response schema helpers.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from app.schemas._base import fast_dump
+from app.schemas.project import ProjectWithStats
+
+
+def test_fast_dump_matches_pydantic_json():
+    """fast_dump must produce the same JSON as the declared response_model."""
+    projects = [
+        ProjectWithStats.model_construct(
+            id=1,
+            user_id=2,
+            name='Example',
+            domain='example.com',
+            description=None,
+            max_depth=3,
+            crawl_delay_ms=1000,
+            user_agent='SEORankPulse',
+            respect_robots_txt=True,
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 2, 3, 4, 5, 678901),
+            total_crawls=4,
+            last_crawl_date=datetime(2024, 1, 3, tzinfo=timezone.utc),
+            total_pages=120,
+        ),
+        ProjectWithStats.model_construct(
+            id=2,
+            user_id=2,
+            name='No crawls',
+            domain='example.org',
+            description='Fresh project',
+            max_depth=1,
+            crawl_delay_ms=0,
+            user_agent='SEORankPulse',
+            respect_robots_txt=False,
+            created_at=datetime(2024, 2, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 2, 1, 9, tzinfo=timezone(timedelta(hours=2))),
+            total_crawls=0,
+            last_crawl_date=None,
+            total_pages=0,
+        ),
+    ]
+    
+    expected = b'[' + b','.join(p.model_dump_json().encode() for p in projects) + b']'
+    
+    assert fast_dump(projects) == expected